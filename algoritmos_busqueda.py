@@ -1,16 +1,51 @@
 """
 Módulo: Algoritmos de Búsqueda No Informada
-Descripción: Implementación de BFS, DFS, UCS y IDDFS para resolver problemas de búsqueda.
+Descripción: Implementación de BFS, DFS, UCS y IDDFS (y de BFS y UCS bidireccionales) para resolver problemas de búsqueda.
+
+Los algoritmos trabajan sobre la forma compilada del grafo (ver grafo_compilado.py):
+los estados se manejan como ids enteros y solo se traducen a nombres al construir
+el camino de la solución.
+
+BFS, DFS, UCS e IDDFS también aceptan un problema implícito (ver ``EspacioEstados`` en
+espacio_estados.py), cuyo espacio de estados se genera sobre la marcha a partir de sus
+sucesores. Lo reconocen por su forma, no por su clase.
+
+Todas las búsquedas aceptan un ``observador`` al que notifican cada expansión, generación
+y poda de un estado (ver ``Observador``); traza_busqueda.py construye sus trazas con él.
 """
 
+from array import array
 from collections import deque
 import heapq
-from typing import Dict, List, Tuple, Optional, Set, Callable
+import math
+import threading
+import weakref
+from typing import Any, Dict, Hashable, List, Tuple, Optional, Set, Callable, Union
+
+from colas_prioridad import crear_frontera
+from espacio_estados import EspacioEstados, ProblemaImplicito, como_problema_implicito, estados_camino
+from grafo_compilado import GrafoCompilado, huella_grafo
+from presupuesto_busqueda import ControlPresupuesto, PresupuestoBusqueda
+
+# Tipos de los eventos que las búsquedas notifican a su observador (ver traza_busqueda.py)
+EXPANDIR = "expandir"
+GENERAR = "generar"
+PODAR = "podar"
+OBJETIVO = "objetivo"
+
+# observador(tipo, estado, padre, costo, sentido): el estado expandido, generado, podado o
+# encontrado, el estado desde el que se generó o podó (None si no aplica), el costo del
+# camino hasta el estado y el sentido de la búsqueda (0 hacia adelante, 1 hacia atrás).
+# Los estados son nombres en un ProblemaDeRuta y los propios estados en un ProblemaImplicito
+Observador = Callable[[str, Any, Any, float, int], None]
 
 
 class Nodo:
     """Representa un nodo en el árbol de búsqueda."""
     
+    # Sin __dict__ por instancia: unos 40 bytes menos por nodo
+    __slots__ = ('estado', 'padre', 'accion', 'costo_camino', 'profundidad')
+    
     def __init__(
         self,
         estado: str,
@@ -24,7 +59,8 @@ class Nodo:
         Args:
             estado: El estado representado por este nodo
             padre: El nodo padre (None si es el nodo raíz)
-            accion: La acción que llevó a este nodo desde el padre
+            accion: La acción que llevó a este nodo desde el padre (None para la
+                etiqueta por defecto "padre → estado", que se genera al pedir el camino)
             costo_camino: El costo acumulado desde el estado inicial hasta este nodo
         """
         self.estado = estado
@@ -44,7 +80,10 @@ class Nodo:
         nodo_actual = self
         
         while nodo_actual.padre is not None:
-            camino.append((nodo_actual.estado, nodo_actual.accion))
+            accion = nodo_actual.accion
+            if accion is None:
+                accion = f"{nodo_actual.padre.estado} → {nodo_actual.estado}"
+            camino.append((nodo_actual.estado, accion))
             nodo_actual = nodo_actual.padre
         
         camino.append((nodo_actual.estado, "Inicio"))
@@ -55,12 +94,133 @@ class Nodo:
         return self.costo_camino < otro.costo_camino
 
 
+class PoolNodos:
+    """
+    Árbol de búsqueda compacto en arreglos paralelos (struct-of-arrays).
+    
+    Cada nodo es un índice entero en lugar de un objeto ``Nodo``: su estado (id del
+    grafo compilado), el índice de su padre (-1 en la raíz), su profundidad y su costo
+    de camino se guardan en arreglos tipados, unos 20 bytes por nodo. Las fronteras
+    guardan solo índices y el camino se reconstruye al final siguiendo los padres.
+    """
+    
+    __slots__ = ('estados', 'padres', 'profundidades', 'costos')
+    
+    def __init__(self):
+        """Inicializa un árbol vacío."""
+        self.estados = array('i')
+        self.padres = array('i')
+        self.profundidades = array('i')
+        self.costos = array('d')
+    
+    def agregar(self, estado: int, padre: int = -1, costo_camino: float = 0.0) -> int:
+        """
+        Añade un nodo al árbol.
+        
+        Args:
+            estado: Id del estado en el grafo compilado
+            padre: Índice del nodo padre (-1 si es la raíz)
+            costo_camino: El costo acumulado desde el estado inicial
+        
+        Returns:
+            int: Índice del nuevo nodo
+        """
+        indice = len(self.estados)
+        self.estados.append(estado)
+        self.padres.append(padre)
+        self.profundidades.append(0 if padre < 0 else self.profundidades[padre] + 1)
+        self.costos.append(costo_camino)
+        return indice
+    
+    def ids_camino(self, indice: int) -> List[int]:
+        """Ids de los estados desde la raíz hasta el nodo ``indice``."""
+        ids = []
+        while indice >= 0:
+            ids.append(self.estados[indice])
+            indice = self.padres[indice]
+        ids.reverse()
+        return ids
+    
+    def __len__(self) -> int:
+        return len(self.estados)
+
+
+class _DatosGrafo:
+    """
+    Versión, forma compilada y huella de un grafo, compartidos por todos los ProblemaDeRuta que lo usan.
+    
+    Mantiene vivo el grafo, así que su id no se reutiliza mientras exista la entrada.
+    ``firma`` es el tamaño (nodos y aristas) del diccionario cuando se calcularon los datos
+    derivados, o None si aún no hay ninguno.
+    """
+    
+    __slots__ = ('grafo', 'version', 'compilado', 'huella', 'firma', '__weakref__')
+    
+    def __init__(self, grafo: Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado]):
+        self.grafo = grafo
+        self.version = 0
+        self.compilado: Optional[GrafoCompilado] = None
+        self.huella: Optional[str] = None
+        self.firma: Optional[Tuple[int, int]] = None
+    
+    def invalidar(self) -> None:
+        self.version += 1
+        self.compilado = None
+        self.huella = None
+        self.firma = None
+    
+    def fijar_firma(self) -> None:
+        """Anota el tamaño actual del grafo antes de calcular un dato derivado."""
+        if self.firma is None:
+            self.firma = _firma(self.grafo)
+    
+    def comprobar(self) -> None:
+        """Descarta los datos derivados si el diccionario cambió de tamaño sin avisar."""
+        if self.firma is not None and self.firma != _firma(self.grafo):
+            self.invalidar()
+
+
+def _firma(grafo: Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado]) -> Optional[Tuple[int, int]]:
+    """Número de nodos y de aristas de un diccionario (None para un GrafoCompilado, que no cambia)."""
+    if isinstance(grafo, GrafoCompilado):
+        return None
+    return len(grafo), sum(map(len, grafo.values()))
+
+
+# Datos de cada grafo en uso, por id del grafo: una entrada desaparece (con la forma
+# compilada y la huella) en cuanto ya no la usa ningún problema
+_datos_por_grafo: 'weakref.WeakValueDictionary[int, _DatosGrafo]' = weakref.WeakValueDictionary()
+_candado_datos = threading.Lock()
+
+
+def _datos_grafo(grafo: Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado]) -> _DatosGrafo:
+    """Obtiene (o crea) los datos compartidos de ``grafo``."""
+    clave = id(grafo)
+    
+    with _candado_datos:
+        datos = _datos_por_grafo.get(clave)
+        if datos is None or datos.grafo is not grafo:
+            datos = _datos_por_grafo[clave] = _DatosGrafo(grafo)
+        else:
+            # El diccionario pudo editarse directamente desde que se calcularon sus datos
+            datos.comprobar()
+        
+        return datos
+
+
 class ProblemaDeRuta:
-    """Define un problema de búsqueda de ruta en un grafo."""
+    """
+    Define un problema de búsqueda de ruta en un grafo.
+    
+    Los problemas creados sobre el mismo grafo (el mismo objeto) comparten su forma
+    compilada, su huella y su versión: una edición hecha a través de cualquiera de ellos
+    se ve en todos. Al crear un problema se comprueba además que el diccionario conserve
+    el número de nodos y de aristas con que se calcularon esos datos; si no, se descartan.
+    """
     
     def __init__(
         self,
-        grafo: Dict[str, List[Tuple[str, float]]],
+        grafo: Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado],
         estado_inicial: str,
         estado_objetivo: str
     ):
@@ -68,13 +228,179 @@ class ProblemaDeRuta:
         Inicializa el problema.
         
         Args:
-            grafo: Diccionario {nodo: [(vecino, costo), ...]}
+            grafo: Diccionario {nodo: [(vecino, costo), ...]} o un GrafoCompilado
             estado_inicial: El estado inicial
             estado_objetivo: El estado objetivo
         """
         self.grafo = grafo
         self.estado_inicial = estado_inicial
         self.estado_objetivo = estado_objetivo
+        self._oyentes: List[Callable[[str, str, Optional[float], Optional[float]], None]] = []
+    
+    def __getstate__(self) -> dict:
+        # Los oyentes pertenecen a este proceso: no viajan al serializar el problema. La
+        # forma compilada sí, para no recompilar el grafo al deserializarlo.
+        estado = self.__dict__.copy()
+        datos = estado.pop('_datos')
+        estado['grafo'] = datos.grafo
+        estado['_compilado'] = datos.compilado
+        estado['_oyentes'] = []
+        return estado
+    
+    def __setstate__(self, estado: dict) -> None:
+        compilado = estado.pop('_compilado')
+        grafo = estado.pop('grafo')
+        self.__dict__.update(estado)
+        self.grafo = grafo
+        if self._datos.compilado is None:
+            self._datos.fijar_firma()
+            self._datos.compilado = compilado
+    
+    @property
+    def grafo(self) -> Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado]:
+        """El grafo del problema: diccionario {nodo: [(vecino, costo), ...]} o GrafoCompilado."""
+        return self._datos.grafo
+    
+    @grafo.setter
+    def grafo(self, grafo: Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado]) -> None:
+        self._datos = _datos_grafo(grafo)
+    
+    @property
+    def identidad_grafo(self) -> Hashable:
+        """
+        Objeto que identifica al grafo mientras algún problema lo use: es el mismo para
+        todos los problemas sobre el mismo grafo y admite referencias débiles.
+        """
+        return self._datos
+    
+    @property
+    def version(self) -> int:
+        """Número de ediciones del grafo, contando las hechas desde otros problemas que lo comparten."""
+        return self._datos.version
+    
+    @property
+    def grafo_compilado(self) -> GrafoCompilado:
+        """
+        Forma compilada (CSR) del grafo, sobre la que trabajan los algoritmos.
+        
+        Se construye la primera vez que se solicita y se comparte con los demás problemas
+        sobre el mismo grafo. Si el diccionario se modifica directamente (sin los métodos
+        de edición), debe llamarse a ``invalidar_compilacion`` en cualquiera de ellos; los
+        problemas que se creen después detectan por sí solos las ediciones que cambian el
+        número de nodos o de aristas, pero no las que solo cambian un costo.
+        """
+        datos = self._datos
+        
+        if isinstance(datos.grafo, GrafoCompilado):
+            return datos.grafo
+        
+        if datos.compilado is None:
+            datos.fijar_firma()
+            datos.compilado = GrafoCompilado.desde_diccionario(datos.grafo)
+        
+        return datos.compilado
+    
+    @property
+    def huella(self) -> str:
+        """
+        Huella del contenido del grafo (ver ``huella_grafo``); se calcula una vez por versión
+        del grafo y se comparte con los demás problemas que lo usan.
+        """
+        datos = self._datos
+        if datos.huella is None:
+            datos.fijar_firma()
+            datos.huella = huella_grafo(datos.grafo)
+        return datos.huella
+    
+    def invalidar_compilacion(self) -> None:
+        """
+        Registra una modificación del grafo: descarta la forma compilada (la de todos los
+        problemas que comparten el grafo) y la huella.
+        """
+        self._datos.invalidar()
+    
+    def suscribir(self, oyente: Callable[[str, str, Optional[float], Optional[float]], None]) -> None:
+        """
+        Registra una función que se llama tras cada edición de una arista con los métodos
+        ``agregar_arista``, ``eliminar_arista`` y ``actualizar_costo``.
+        
+        Args:
+            oyente: Función ``oyente(origen, destino, costo_anterior, costo_nuevo)``; el
+                costo anterior es None si la arista no existía y el nuevo, si se eliminó
+        """
+        self._oyentes.append(oyente)
+    
+    def cancelar_suscripcion(self, oyente: Callable[[str, str, Optional[float], Optional[float]], None]) -> None:
+        """Deja de notificar las ediciones a ``oyente``."""
+        self._oyentes.remove(oyente)
+    
+    def _notificar(self, origen: str, destino: str, anterior: Optional[float], nuevo: Optional[float]) -> None:
+        for oyente in list(self._oyentes):
+            oyente(origen, destino, anterior, nuevo)
+    
+    def agregar_arista(self, origen: str, destino: str, costo: float) -> None:
+        """
+        Agrega la arista origen → destino; si ya existe, reemplaza su costo.
+        
+        Args:
+            origen: Nodo de partida
+            destino: Nodo de llegada
+            costo: Costo de la arista
+        """
+        vecinos = self._grafo_editable().setdefault(origen, [])
+        anterior = None
+        
+        for i, (vecino, costo_vecino) in enumerate(vecinos):
+            if vecino == destino:
+                vecinos[i], anterior = (destino, costo), costo_vecino
+                break
+        else:
+            vecinos.append((destino, costo))
+        
+        self.invalidar_compilacion()
+        self._notificar(origen, destino, anterior, costo)
+    
+    def eliminar_arista(self, origen: str, destino: str) -> None:
+        """
+        Elimina la arista origen → destino.
+        
+        Raises:
+            KeyError: Si la arista no existe
+        """
+        vecinos = self._grafo_editable().get(origen, [])
+        
+        for i, (vecino, anterior) in enumerate(vecinos):
+            if vecino == destino:
+                del vecinos[i]
+                self.invalidar_compilacion()
+                self._notificar(origen, destino, anterior, None)
+                return
+        
+        raise KeyError(f"No existe la arista {origen} → {destino}")
+    
+    def actualizar_costo(self, origen: str, destino: str, costo: float) -> None:
+        """
+        Cambia el costo de la arista origen → destino.
+        
+        Raises:
+            KeyError: Si la arista no existe
+        """
+        vecinos = self._grafo_editable().get(origen, [])
+        
+        for i, (vecino, anterior) in enumerate(vecinos):
+            if vecino == destino:
+                vecinos[i] = (destino, costo)
+                self.invalidar_compilacion()
+                self._notificar(origen, destino, anterior, costo)
+                return
+        
+        raise KeyError(f"No existe la arista {origen} → {destino}")
+    
+    def _grafo_editable(self) -> Dict[str, List[Tuple[str, float]]]:
+        """Devuelve el diccionario del grafo; los grafos compilados no admiten ediciones."""
+        if isinstance(self.grafo, GrafoCompilado):
+            raise TypeError("Un GrafoCompilado no se puede modificar; use el formato diccionario")
+        return self.grafo
     
     def es_objetivo(self, estado: str) -> bool:
         """Verifica si un estado es el objetivo."""
@@ -84,19 +410,77 @@ class ProblemaDeRuta:
         """
         Obtiene los sucesores de un estado.
         
+        Se leen de la forma compilada del grafo (la misma que usan las búsquedas); las
+        etiquetas de acción se construyen en cada llamada y no se conservan.
+        
         Returns:
             List[Tuple[str, str, float]]: Lista de (estado_sucesor, acción, costo)
         """
-        if estado not in self.grafo:
+        grafo = self.grafo_compilado
+        indice = grafo.indice(estado)
+        
+        if indice < 0:
             return []
         
+        nombres, destinos, costos = grafo.nombres, grafo.destinos, grafo.costos
         sucesores = []
-        for vecino, costo in self.grafo[estado]:
-            accion = f"{estado} → {vecino}"
-            sucesores.append((vecino, accion, costo))
+        for k in range(grafo.desplazamientos[indice], grafo.desplazamientos[indice + 1]):
+            vecino = nombres[destinos[k]]
+            sucesores.append((vecino, f"{estado} → {vecino}", costos[k]))
         
         return sucesores
 
+class MetricasBusqueda:
+    """
+    Métricas de instrumentación de una búsqueda.
+    
+    Las funciones ``busqueda_*`` que reciben un objeto ``metricas`` completan los
+    contadores de la búsqueda; los tiempos y el pico de memoria los mide quien la
+    ejecuta (ver metricas_busqueda.py). Los valores que no se registraron quedan en None.
+    
+    Attributes:
+        nodos_generados: Sucesores que entraron en la frontera (o que eran el objetivo)
+        duplicados_podados: Sucesores descartados por estar ya alcanzados o explorados (o
+            por no mejorar su costo) más las entradas obsoletas que se sacaron de la frontera
+        pico_frontera: Tamaño máximo de la frontera
+        pico_explorados: Tamaño máximo del conjunto de estados explorados o alcanzados
+        segundos: Tiempo real de la búsqueda
+        segundos_cpu: Tiempo de CPU del proceso durante la búsqueda
+        pico_memoria: Pico de memoria asignada durante la búsqueda (tracemalloc), en bytes
+    """
+    
+    CAMPOS = (
+        'nodos_generados', 'duplicados_podados', 'pico_frontera', 'pico_explorados',
+        'segundos', 'segundos_cpu', 'pico_memoria'
+    )
+    
+    def __init__(self):
+        self.nodos_generados: Optional[int] = None
+        self.duplicados_podados: Optional[int] = None
+        self.pico_frontera: Optional[int] = None
+        self.pico_explorados: Optional[int] = None
+        self.segundos: Optional[float] = None
+        self.segundos_cpu: Optional[float] = None
+        self.pico_memoria: Optional[int] = None
+    
+    def registrar(self, generados: int, podados: int, pico_frontera: int, pico_explorados: int) -> None:
+        """Guarda los contadores de la búsqueda."""
+        self.nodos_generados = generados
+        self.duplicados_podados = podados
+        self.pico_frontera = pico_frontera
+        self.pico_explorados = pico_explorados
+    
+    def a_diccionario(self) -> Dict[str, Optional[float]]:
+        """Devuelve las métricas como diccionario {campo: valor}."""
+        return {campo: getattr(self, campo) for campo in self.CAMPOS}
+    
+    def __str__(self) -> str:
+        """Representación en string de las métricas registradas."""
+        return "\n".join(
+            f"{campo.replace('_', ' ').capitalize()}: {valor}"
+            for campo, valor in self.a_diccionario().items() if valor is not None
+        )
+
 
 class ResultadoBusqueda:
     """Almacena los resultados de una búsqueda."""
@@ -107,7 +491,10 @@ class ResultadoBusqueda:
         camino: Optional[List[Tuple[str, str]]] = None,
         costo_total: float = 0,
         nodos_expandidos: int = 0,
-        nodos_frontera: int = 0
+        nodos_frontera: int = 0,
+        expandidos_por_iteracion: Optional[List[int]] = None,
+        metricas: Optional[MetricasBusqueda] = None,
+        motivo_parada: Optional[str] = None
     ):
         """
         Inicializa los resultados.
@@ -118,17 +505,33 @@ class ResultadoBusqueda:
             costo_total: El costo total del camino
             nodos_expandidos: Número de nodos expandidos
             nodos_frontera: Número de nodos en la frontera al final
+            expandidos_por_iteracion: Nodos expandidos en cada iteración (búsquedas iterativas)
+            metricas: Métricas de instrumentación (None si no se pidieron)
+            motivo_parada: Si la búsqueda se detuvo por agotar su presupuesto, el motivo
+                (ver presupuesto_busqueda.py). Entonces ``encontrado`` indica que el camino
+                llega al objetivo aunque quizá no sea el óptimo, y si no llega, ``camino``
+                puede tener el mejor camino parcial
         """
         self.encontrado = encontrado
         self.camino = camino or []
         self.costo_total = costo_total
         self.nodos_expandidos = nodos_expandidos
         self.nodos_frontera = nodos_frontera
+        self.expandidos_por_iteracion = expandidos_por_iteracion or []
+        self.metricas = metricas
+        self.motivo_parada = motivo_parada
     
     def __str__(self) -> str:
         """Representación en string del resultado."""
         if not self.encontrado:
-            return "No se encontró solución"
+            if self.motivo_parada is None:
+                return "No se encontró solución"
+            resultado = f"Búsqueda detenida ({self.motivo_parada}) sin encontrar solución\n"
+            if self.camino:
+                resultado += f"Mejor camino parcial: {' → '.join([estado for estado, _ in self.camino])}\n"
+                resultado += f"Costo parcial: {self.costo_total:.2f}\n"
+            resultado += f"Nodos expandidos: {self.nodos_expandidos}"
+            return resultado
         
         resultado = f"✓ Solución encontrada\n"
         resultado += f"Camino: {' → '.join([estado for estado, _ in self.camino])}\n"
@@ -137,10 +540,51 @@ class ResultadoBusqueda:
         resultado += f"Nodos expandidos: {self.nodos_expandidos}\n"
         resultado += f"Nodos en frontera: {self.nodos_frontera}"
         
+        if self.motivo_parada is not None:
+            resultado += f"\nBúsqueda detenida ({self.motivo_parada}): el costo puede no ser óptimo"
+        
         return resultado
 
 
-def busqueda_amplitud(problema: ProblemaDeRuta) -> ResultadoBusqueda:
+def _es_implicito(problema: Any) -> bool:
+    """Reconoce un problema implícito por su forma (ver ``EspacioEstados``), no por su clase."""
+    return not isinstance(problema, ProblemaDeRuta) and isinstance(problema, EspacioEstados)
+
+
+def preparar_busqueda(problema: ProblemaDeRuta) -> Tuple[GrafoCompilado, int, int]:
+    """
+    Obtiene el grafo compilado y los ids del estado inicial y del objetivo (-1 si no existen).
+    
+    Raises:
+        TypeError: Si el problema no tiene grafo (por ejemplo, un problema implícito)
+    """
+    grafo = getattr(problema, 'grafo_compilado', None)
+    if grafo is None:
+        raise TypeError(f"{type(problema).__name__} no tiene grafo: esta búsqueda requiere un ProblemaDeRuta")
+    return grafo, grafo.indice(problema.estado_inicial), grafo.indice(problema.estado_objetivo)
+
+
+def camino_desde_nodo(nodo: Nodo, grafo: GrafoCompilado) -> List[Tuple[str, str]]:
+    """Traduce a nombres el camino de un nodo cuyos estados son ids del grafo compilado."""
+    ids = []
+    while nodo is not None:
+        ids.append(nodo.estado)
+        nodo = nodo.padre
+    ids.reverse()
+    return grafo.reconstruir_camino(ids)
+
+
+def camino_desde_pool(pool: PoolNodos, indice: int, grafo: GrafoCompilado) -> List[Tuple[str, str]]:
+    """Traduce a nombres el camino hasta el nodo ``indice`` de un árbol de búsqueda compacto."""
+    return grafo.reconstruir_camino(pool.ids_camino(indice))
+
+
+def busqueda_amplitud(
+    problema: Union[ProblemaDeRuta, EspacioEstados],
+    metricas: Optional[MetricasBusqueda] = None,
+    presupuesto: Optional[PresupuestoBusqueda] = None,
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
     """
     Búsqueda en Amplitud (BFS).
     
@@ -149,13 +593,23 @@ def busqueda_amplitud(problema: ProblemaDeRuta) -> ResultadoBusqueda:
     
     Args:
         problema: El problema a resolver
+        metricas: Si se indica, se completan sus contadores y se adjunta al resultado
+        presupuesto: Límites de tiempo, expansiones y memoria, y token de cancelación
+            (ver presupuesto_busqueda.py); al agotarse se devuelve un resultado parcial
+        observador: Si se indica, recibe cada evento de la búsqueda a medida que ocurre
+            (ver ``Observador``)
     
     Returns:
         ResultadoBusqueda: Los resultados de la búsqueda
     """
+    if _es_implicito(problema):
+        return _amplitud_implicita(como_problema_implicito(problema), metricas, presupuesto, observador)
+    
     nodo_inicial = Nodo(problema.estado_inicial)
     
     if problema.es_objetivo(nodo_inicial.estado):
+        if observador is not None:
+            observador(OBJETIVO, nodo_inicial.estado, None, 0.0, 0)
         return ResultadoBusqueda(
             encontrado=True,
             camino=nodo_inicial.obtener_camino(),
@@ -163,39 +617,97 @@ def busqueda_amplitud(problema: ProblemaDeRuta) -> ResultadoBusqueda:
             nodos_expandidos=1
         )
     
-    frontera = deque([nodo_inicial])
-    explorados = set()
+    grafo, inicial, objetivo = preparar_busqueda(problema)
+    
+    if inicial < 0:
+        return ResultadoBusqueda(encontrado=False, nodos_expandidos=1)
+    
+    desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+    pool = PoolNodos()
+    agregar, estados, costos_camino = pool.agregar, pool.estados, pool.costos
+    frontera = deque([agregar(inicial)])
+    # Mapa de bits de estados alcanzados (explorados o en la frontera): un estado
+    # se marca al entrar en la frontera y nunca sale de ninguno de los dos conjuntos.
+    alcanzados = bytearray(grafo.num_nodos)
+    alcanzados[inicial] = 1
     nodos_expandidos = 0
+    # Instrumentación: solo cuesta una comprobación por expansión si no se pidió
+    medir = metricas is not None
+    aristas_examinadas = pico_frontera = 0
+    # Eventos: igual que la instrumentación, solo una comprobación si no hay observador
+    observar = observador is not None
+    nombres = grafo.nombres
+    # Presupuesto: sin él, ``revision`` nunca se alcanza
+    control = ControlPresupuesto(presupuesto)
+    revision = control.proxima
     
     while frontera:
+        if nodos_expandidos >= revision:
+            if control.revisar(nodos_expandidos):
+                break
+            revision = control.proxima
+        
+        if medir:
+            pico_frontera = max(pico_frontera, len(frontera))
+        
         nodo_actual = frontera.popleft()
-        explorados.add(nodo_actual.estado)
+        actual = estados[nodo_actual]
         nodos_expandidos += 1
         
-        for estado_sucesor, accion, costo in problema.obtener_sucesores(nodo_actual.estado):
-            if estado_sucesor not in explorados and estado_sucesor not in [n.estado for n in frontera]:
-                nodo_sucesor = Nodo(
-                    estado=estado_sucesor,
-                    padre=nodo_actual,
-                    accion=accion,
-                    costo_camino=nodo_actual.costo_camino + costo
-                )
+        if observar:
+            observador(EXPANDIR, nombres[actual], None, costos_camino[nodo_actual], 0)
+        
+        if medir:
+            aristas_examinadas += desplazamientos[actual + 1] - desplazamientos[actual]
+        
+        for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+            estado_sucesor = destinos[k]
+            if not alcanzados[estado_sucesor]:
+                nodo_sucesor = agregar(estado_sucesor, nodo_actual, costos_camino[nodo_actual] + costos[k])
+                if observar:
+                    observador(GENERAR, nombres[estado_sucesor], nombres[actual], costos_camino[nodo_sucesor], 0)
                 
-                if problema.es_objetivo(nodo_sucesor.estado):
+                if estado_sucesor == objetivo:
+                    if observar:
+                        observador(OBJETIVO, nombres[estado_sucesor], nombres[actual], costos_camino[nodo_sucesor], 0)
+                    if medir:
+                        aristas_examinadas -= desplazamientos[actual + 1] - k - 1
+                        metricas.registrar(
+                            len(pool) - 1, aristas_examinadas - len(pool) + 1,
+                            max(pico_frontera, len(frontera)), len(pool)
+                        )
                     return ResultadoBusqueda(
                         encontrado=True,
-                        camino=nodo_sucesor.obtener_camino(),
-                        costo_total=nodo_sucesor.costo_camino,
+                        camino=camino_desde_pool(pool, nodo_sucesor, grafo),
+                        costo_total=costos_camino[nodo_sucesor],
                         nodos_expandidos=nodos_expandidos,
-                        nodos_frontera=len(frontera)
+                        nodos_frontera=len(frontera),
+                        metricas=metricas
                     )
                 
+                alcanzados[estado_sucesor] = 1
                 frontera.append(nodo_sucesor)
+            elif observar:
+                observador(PODAR, nombres[estado_sucesor], nombres[actual], costos_camino[nodo_actual] + costos[k], 0)
     
-    return ResultadoBusqueda(encontrado=False, nodos_expandidos=nodos_expandidos)
+    if medir:
+        metricas.registrar(len(pool) - 1, aristas_examinadas - len(pool) + 1, pico_frontera, len(pool))
+    return ResultadoBusqueda(
+        encontrado=False,
+        nodos_expandidos=nodos_expandidos,
+        nodos_frontera=len(frontera),
+        metricas=metricas,
+        motivo_parada=control.motivo
+    )
 
 
-def busqueda_profundidad(problema: ProblemaDeRuta, limite: Optional[int] = None) -> ResultadoBusqueda:
+def busqueda_profundidad(
+    problema: Union[ProblemaDeRuta, EspacioEstados],
+    limite: Optional[int] = None,
+    metricas: Optional[MetricasBusqueda] = None,
+    presupuesto: Optional[PresupuestoBusqueda] = None,
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
     """
     Búsqueda en Profundidad (DFS) o Búsqueda en Profundidad Limitada (DLS).
     
@@ -204,13 +716,23 @@ def busqueda_profundidad(problema: ProblemaDeRuta, limite: Optional[int] = None)
     Args:
         problema: El problema a resolver
         limite: Límite de profundidad (None para DFS sin límite)
+        metricas: Si se indica, se completan sus contadores y se adjunta al resultado
+        presupuesto: Límites de tiempo, expansiones y memoria, y token de cancelación
+            (ver presupuesto_busqueda.py); al agotarse se devuelve un resultado parcial
+        observador: Si se indica, recibe cada evento de la búsqueda a medida que ocurre
+            (ver ``Observador``)
     
     Returns:
         ResultadoBusqueda: Los resultados de la búsqueda
     """
+    if _es_implicito(problema):
+        return _profundidad_implicita(como_problema_implicito(problema), limite, metricas, presupuesto, observador)
+    
     nodo_inicial = Nodo(problema.estado_inicial)
     
     if problema.es_objetivo(nodo_inicial.estado):
+        if observador is not None:
+            observador(OBJETIVO, nodo_inicial.estado, None, 0.0, 0)
         return ResultadoBusqueda(
             encontrado=True,
             camino=nodo_inicial.obtener_camino(),
@@ -218,62 +740,140 @@ def busqueda_profundidad(problema: ProblemaDeRuta, limite: Optional[int] = None)
             nodos_expandidos=1
         )
     
-    frontera = [nodo_inicial]
-    explorados = set()
+    grafo, inicial, objetivo = preparar_busqueda(problema)
+    
+    if inicial < 0:
+        return ResultadoBusqueda(encontrado=False, nodos_expandidos=1)
+    
+    desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+    pool = PoolNodos()
+    agregar, estados, costos_camino = pool.agregar, pool.estados, pool.costos
+    frontera = [agregar(inicial)]
+    explorados = bytearray(grafo.num_nodos)
     nodos_expandidos = 0
+    medir = metricas is not None
+    aristas_examinadas = pico_frontera = 0
+    observar = observador is not None
+    nombres = grafo.nombres
+    control = ControlPresupuesto(presupuesto)
+    revision = control.proxima
     
     while frontera:
+        if nodos_expandidos >= revision:
+            if control.revisar(nodos_expandidos):
+                break
+            revision = control.proxima
+        
+        if medir:
+            pico_frontera = max(pico_frontera, len(frontera))
+        
         nodo_actual = frontera.pop()
+        actual = estados[nodo_actual]
         
-        if nodo_actual.estado in explorados:
+        if explorados[actual]:
+            if observar:
+                observador(PODAR, nombres[actual], None, costos_camino[nodo_actual], 0)
             continue
         
-        explorados.add(nodo_actual.estado)
+        explorados[actual] = 1
         nodos_expandidos += 1
         
+        if observar:
+            observador(EXPANDIR, nombres[actual], None, costos_camino[nodo_actual], 0)
+        
         # Verificar límite de profundidad
-        if limite is not None and nodo_actual.profundidad >= limite:
+        if limite is not None and pool.profundidades[nodo_actual] >= limite:
             continue
         
-        for estado_sucesor, accion, costo in problema.obtener_sucesores(nodo_actual.estado):
-            if estado_sucesor not in explorados:
-                nodo_sucesor = Nodo(
-                    estado=estado_sucesor,
-                    padre=nodo_actual,
-                    accion=accion,
-                    costo_camino=nodo_actual.costo_camino + costo
-                )
+        if medir:
+            aristas_examinadas += desplazamientos[actual + 1] - desplazamientos[actual]
+        
+        for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+            estado_sucesor = destinos[k]
+            if not explorados[estado_sucesor]:
+                nodo_sucesor = agregar(estado_sucesor, nodo_actual, costos_camino[nodo_actual] + costos[k])
+                if observar:
+                    observador(GENERAR, nombres[estado_sucesor], nombres[actual], costos_camino[nodo_sucesor], 0)
                 
-                if problema.es_objetivo(nodo_sucesor.estado):
+                if estado_sucesor == objetivo:
+                    if observar:
+                        observador(OBJETIVO, nombres[estado_sucesor], nombres[actual], costos_camino[nodo_sucesor], 0)
+                    if medir:
+                        # El objetivo no entró en la pila: se sacaron len(pool) - 1 - len(frontera)
+                        aristas_examinadas -= desplazamientos[actual + 1] - k - 1
+                        obsoletos = len(pool) - 1 - len(frontera) - nodos_expandidos
+                        metricas.registrar(
+                            len(pool) - 1, aristas_examinadas - len(pool) + 1 + obsoletos,
+                            max(pico_frontera, len(frontera)), nodos_expandidos
+                        )
                     return ResultadoBusqueda(
                         encontrado=True,
-                        camino=nodo_sucesor.obtener_camino(),
-                        costo_total=nodo_sucesor.costo_camino,
+                        camino=camino_desde_pool(pool, nodo_sucesor, grafo),
+                        costo_total=costos_camino[nodo_sucesor],
                         nodos_expandidos=nodos_expandidos,
-                        nodos_frontera=len(frontera)
+                        nodos_frontera=len(frontera),
+                        metricas=metricas
                     )
                 
                 frontera.append(nodo_sucesor)
+            elif observar:
+                observador(PODAR, nombres[estado_sucesor], nombres[actual], costos_camino[nodo_actual] + costos[k], 0)
     
-    return ResultadoBusqueda(encontrado=False, nodos_expandidos=nodos_expandidos)
+    if medir:
+        # Cada nodo del pool entró una vez en la pila; los que ya salieron y no se expandieron eran obsoletos
+        obsoletos = len(pool) - len(frontera) - nodos_expandidos
+        metricas.registrar(
+            len(pool) - 1, aristas_examinadas - len(pool) + 1 + obsoletos, pico_frontera, nodos_expandidos
+        )
+    return ResultadoBusqueda(
+        encontrado=False,
+        nodos_expandidos=nodos_expandidos,
+        nodos_frontera=len(frontera),
+        metricas=metricas,
+        motivo_parada=control.motivo
+    )
 
 
-def busqueda_costo_uniforme(problema: ProblemaDeRuta) -> ResultadoBusqueda:
+def busqueda_costo_uniforme(
+    problema: Union[ProblemaDeRuta, EspacioEstados],
+    frontera: str = "auto",
+    metricas: Optional[MetricasBusqueda] = None,
+    presupuesto: Optional[PresupuestoBusqueda] = None,
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
     """
     Búsqueda de Costo Uniforme (UCS).
     
     Expande el nodo con el costo de camino más bajo.
     Garantiza encontrar la solución de menor costo.
     
+    Cada estado guarda su mejor costo conocido y su padre, y solo vuelve a entrar en
+    la frontera cuando ese costo mejora. El objetivo se prueba al extraerlo de la
+    frontera, así que el costo devuelto es el óptimo con cualquier cola.
+    
     Args:
         problema: El problema a resolver
+        frontera: Cola de prioridad a usar: "binario", "indexado", "dial", "radix" o
+            "auto" para elegirla según los costos del grafo (ver colas_prioridad.py)
+        metricas: Si se indica, se completan sus contadores y se adjunta al resultado
+        presupuesto: Límites de tiempo, expansiones y memoria, y token de cancelación
+            (ver presupuesto_busqueda.py); al agotarse se devuelve un resultado parcial
+        observador: Si se indica, recibe cada evento de la búsqueda a medida que ocurre
+            (ver ``Observador``)
     
     Returns:
         ResultadoBusqueda: Los resultados de la búsqueda
     """
+    if _es_implicito(problema):
+        if frontera not in ("auto", "binario"):
+            raise ValueError(f"La frontera '{frontera}' requiere un grafo compilado")
+        return _costo_uniforme_implicito(como_problema_implicito(problema), metricas, presupuesto, observador)
+    
     nodo_inicial = Nodo(problema.estado_inicial)
     
     if problema.es_objetivo(nodo_inicial.estado):
+        if observador is not None:
+            observador(OBJETIVO, nodo_inicial.estado, None, 0.0, 0)
         return ResultadoBusqueda(
             encontrado=True,
             camino=nodo_inicial.obtener_camino(),
@@ -281,67 +881,1073 @@ def busqueda_costo_uniforme(problema: ProblemaDeRuta) -> ResultadoBusqueda:
             nodos_expandidos=1
         )
     
-    frontera = [nodo_inicial]
-    explorados = set()
+    grafo, inicial, objetivo = preparar_busqueda(problema)
+    cola = crear_frontera(frontera, grafo)
+    
+    if inicial < 0:
+        return ResultadoBusqueda(encontrado=False, nodos_expandidos=1)
+    
+    n = grafo.num_nodos
+    desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+    insertar, extraer = cola.insertar, cola.extraer
+    mejor_costo = array('d', [math.inf]) * n
+    padres = array('i', [-1]) * n
+    explorados = bytearray(n)
+    mejor_costo[inicial] = 0.0
+    insertar(0, inicial)
     nodos_expandidos = 0
+    medir = metricas is not None
+    aristas_examinadas = pico_frontera = generados = obsoletos = 0
+    observar = observador is not None
+    nombres = grafo.nombres
+    control = ControlPresupuesto(presupuesto)
+    revision = control.proxima
     
-    while frontera:
-        nodo_actual = heapq.heappop(frontera)
+    while cola:
+        if nodos_expandidos >= revision:
+            if control.revisar(nodos_expandidos):
+                break
+            revision = control.proxima
+        
+        if medir:
+            pico_frontera = max(pico_frontera, len(cola))
+        
+        prioridad, actual = extraer()
         
-        if nodo_actual.estado in explorados:
+        if explorados[actual]:
+            obsoletos += 1
+            if observar:
+                observador(PODAR, nombres[actual], None, prioridad, 0)
             continue
         
-        explorados.add(nodo_actual.estado)
+        # El objetivo se prueba al extraerlo: solo entonces su costo es definitivo
+        if actual == objetivo:
+            if observar:
+                observador(OBJETIVO, nombres[actual], nombres[padres[actual]], mejor_costo[actual], 0)
+            if medir:
+                metricas.registrar(generados, aristas_examinadas - generados + obsoletos, pico_frontera, nodos_expandidos)
+            
+            ids = []
+            while actual >= 0:
+                ids.append(actual)
+                actual = padres[actual]
+            ids.reverse()
+            
+            return ResultadoBusqueda(
+                encontrado=True,
+                camino=grafo.reconstruir_camino(ids),
+                costo_total=mejor_costo[objetivo],
+                nodos_expandidos=nodos_expandidos,
+                nodos_frontera=len(cola),
+                metricas=metricas
+            )
+        
+        explorados[actual] = 1
         nodos_expandidos += 1
+        costo_actual = mejor_costo[actual]
         
-        for estado_sucesor, accion, costo in problema.obtener_sucesores(nodo_actual.estado):
-            if estado_sucesor not in explorados:
-                nodo_sucesor = Nodo(
-                    estado=estado_sucesor,
-                    padre=nodo_actual,
-                    accion=accion,
-                    costo_camino=nodo_actual.costo_camino + costo
-                )
-                
-                if problema.es_objetivo(nodo_sucesor.estado):
-                    return ResultadoBusqueda(
-                        encontrado=True,
-                        camino=nodo_sucesor.obtener_camino(),
-                        costo_total=nodo_sucesor.costo_camino,
-                        nodos_expandidos=nodos_expandidos,
-                        nodos_frontera=len(frontera)
-                    )
+        if observar:
+            observador(EXPANDIR, nombres[actual], None, costo_actual, 0)
+        
+        if medir:
+            aristas_examinadas += desplazamientos[actual + 1] - desplazamientos[actual]
+        
+        for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+            estado_sucesor = destinos[k]
+            if not explorados[estado_sucesor]:
+                costo_sucesor = costo_actual + costos[k]
                 
-                heapq.heappush(frontera, nodo_sucesor)
+                if costo_sucesor < mejor_costo[estado_sucesor]:
+                    mejor_costo[estado_sucesor] = costo_sucesor
+                    padres[estado_sucesor] = actual
+                    insertar(costo_sucesor, estado_sucesor)
+                    generados += 1
+                    if observar:
+                        observador(GENERAR, nombres[estado_sucesor], nombres[actual], costo_sucesor, 0)
+                elif observar:
+                    observador(PODAR, nombres[estado_sucesor], nombres[actual], costo_sucesor, 0)
+            elif observar:
+                observador(PODAR, nombres[estado_sucesor], nombres[actual], costo_actual + costos[k], 0)
+    
+    if medir:
+        metricas.registrar(generados, aristas_examinadas - generados + obsoletos, pico_frontera, nodos_expandidos)
+    return ResultadoBusqueda(
+        encontrado=False,
+        nodos_expandidos=nodos_expandidos,
+        nodos_frontera=len(cola),
+        metricas=metricas,
+        motivo_parada=control.motivo
+    )
+
+
+def _profundidad_limitada(
+    grafo: GrafoCompilado,
+    inicial: int,
+    objetivo: int,
+    limite: int,
+    en_camino: bytearray,
+    transposiciones: Dict[int, int],
+    max_transposiciones: int,
+    control: ControlPresupuesto,
+    previos: int = 0,
+    observador: Optional[Observador] = None
+) -> Tuple[Optional[List[int]], float, int, bool, int, int, int]:
+    """
+    Búsqueda en profundidad limitada en árbol, con pila explícita.
+    
+    Un estado solo se descarta si ya está en el camino actual (ciclo) o si la tabla de
+    transposiciones indica que en esta iteración ya se expandió a la misma profundidad
+    o a una menor, con al menos el mismo presupuesto restante.
+    
+    Args:
+        grafo: El grafo compilado
+        inicial: Id del estado inicial (que no es el objetivo)
+        objetivo: Id del estado objetivo (-1 si no existe)
+        limite: Profundidad máxima de los nodos generados
+        en_camino: Mapa de bits de los estados del camino actual (vacío al entrar y al salir)
+        transposiciones: Tabla {estado: menor profundidad a la que se expandió}, vacía al entrar
+        max_transposiciones: Número máximo de entradas de la tabla
+        control: Presupuesto de la búsqueda; si se agota, la iteración se abandona
+            (``control.motivo`` indica por qué)
+        previos: Nodos expandidos en las iteraciones anteriores
+        observador: Observador de la búsqueda (ver ``Observador``); los sucesores más
+            allá del límite no le llegan
+    
+    Returns:
+        Tuple: (ids del camino o None, costo del camino, nodos expandidos, si algún
+        nodo quedó sin expandir por el límite, aristas pendientes en la pila, sucesores
+        podados por ciclo o transposición, longitud máxima del camino en la pila)
+    """
+    desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+    
+    if limite == 0:
+        return None, 0.0, 0, desplazamientos[inicial] < desplazamientos[inicial + 1], 0, 0, 0
+    
+    # Camino actual y, para cada nodo del camino, la siguiente arista por explorar
+    camino = [inicial]
+    aristas = [desplazamientos[inicial]]
+    en_camino[inicial] = 1
+    transposiciones[inicial] = 0
+    nodos_expandidos = 1
+    cortado = False
+    podados = 0
+    longitud_maxima = 1
+    revision = control.proxima - previos
+    observar = observador is not None
+    nombres = grafo.nombres
+    
+    if observar:
+        observador(EXPANDIR, nombres[inicial], None, 0.0, 0)
+    
+    while camino:
+        actual = camino[-1]
+        k = aristas[-1]
+        
+        if k == desplazamientos[actual + 1]:
+            camino.pop()
+            aristas.pop()
+            en_camino[actual] = 0
+            continue
+        
+        aristas[-1] = k + 1
+        sucesor = destinos[k]
+        
+        # aristas[i] - 1 es la arista por la que se bajó desde camino[i]
+        if observar:
+            costo_sucesor = sum(costos[arista - 1] for arista in aristas)
+        
+        if en_camino[sucesor]:
+            podados += 1
+            if observar:
+                observador(PODAR, nombres[sucesor], nombres[actual], costo_sucesor, 0)
+            continue
+        
+        if sucesor == objetivo:
+            if observar:
+                observador(GENERAR, nombres[sucesor], nombres[actual], costo_sucesor, 0)
+                observador(OBJETIVO, nombres[sucesor], nombres[actual], costo_sucesor, 0)
+            costo_total = sum(costos[arista - 1] for arista in aristas)
+            pendientes = sum(
+                desplazamientos[nodo + 1] - arista for nodo, arista in zip(camino, aristas)
+            )
+            ids = camino + [sucesor]
+            for nodo in camino:
+                en_camino[nodo] = 0
+            return ids, costo_total, nodos_expandidos, cortado, pendientes, podados, longitud_maxima
+        
+        profundidad = len(camino)
+        
+        if profundidad == limite:
+            if desplazamientos[sucesor] < desplazamientos[sucesor + 1]:
+                cortado = True
+            continue
+        
+        anterior = transposiciones.get(sucesor)
+        if anterior is not None and anterior <= profundidad:
+            podados += 1
+            if observar:
+                observador(PODAR, nombres[sucesor], nombres[actual], costo_sucesor, 0)
+            continue
+        if anterior is not None or len(transposiciones) < max_transposiciones:
+            transposiciones[sucesor] = profundidad
+        
+        if nodos_expandidos >= revision:
+            if control.revisar(previos + nodos_expandidos):
+                for nodo in camino:
+                    en_camino[nodo] = 0
+                return None, 0.0, nodos_expandidos, True, 0, podados, longitud_maxima
+            revision = control.proxima - previos
+        
+        camino.append(sucesor)
+        aristas.append(desplazamientos[sucesor])
+        en_camino[sucesor] = 1
+        nodos_expandidos += 1
+        if profundidad >= longitud_maxima:
+            longitud_maxima = profundidad + 1
+        if observar:
+            observador(GENERAR, nombres[sucesor], nombres[actual], costo_sucesor, 0)
+            observador(EXPANDIR, nombres[sucesor], None, costo_sucesor, 0)
     
-    return ResultadoBusqueda(encontrado=False, nodos_expandidos=nodos_expandidos)
+    return None, 0.0, nodos_expandidos, cortado, 0, podados, longitud_maxima
 
 
-def busqueda_profundidad_iterativa(problema: ProblemaDeRuta, limite_maximo: int = 20) -> ResultadoBusqueda:
+def busqueda_profundidad_iterativa(
+    problema: Union[ProblemaDeRuta, EspacioEstados],
+    limite_maximo: int = 20,
+    max_transposiciones: int = 100_000,
+    metricas: Optional[MetricasBusqueda] = None,
+    presupuesto: Optional[PresupuestoBusqueda] = None,
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
     """
     Búsqueda en Profundidad Iterativa (IDDFS).
     
     Realiza DLS con límites de profundidad crecientes.
     Combina la completitud y optimalidad de BFS con la eficiencia de espacio de DFS.
     
+    Cada iteración es una búsqueda en árbol: evita los ciclos del camino actual y poda
+    con una tabla de transposiciones acotada (la menor profundidad a la que se expandió
+    cada estado en la iteración), así que encuentra la solución con menos pasos. Si una
+    iteración no deja ningún nodo sin expandir por el límite, las siguientes no pueden
+    llegar más lejos y la búsqueda termina.
+    
     Args:
         problema: El problema a resolver
         limite_maximo: Límite máximo de profundidad a explorar
+        max_transposiciones: Número máximo de estados en la tabla de transposiciones
+        metricas: Si se indica, se completan sus contadores (sumados sobre todas las
+            iteraciones; los picos son los de la iteración mayor) y se adjunta al resultado.
+            La frontera es el camino de la pila y los explorados, la tabla de transposiciones
+        presupuesto: Límites de tiempo, expansiones y memoria, y token de cancelación
+            (ver presupuesto_busqueda.py); al agotarse se devuelve un resultado parcial
+        observador: Si se indica, recibe cada evento de la búsqueda a medida que ocurre
+            (ver ``Observador``)
+    
+    Returns:
+        ResultadoBusqueda: Los resultados de la búsqueda; ``nodos_expandidos`` suma
+        todas las iteraciones y ``expandidos_por_iteracion`` las desglosa
+    """
+    if _es_implicito(problema):
+        return _profundidad_iterativa_implicita(
+            como_problema_implicito(problema), limite_maximo, max_transposiciones, metricas, presupuesto, observador
+        )
+    
+    nodo_inicial = Nodo(problema.estado_inicial)
+    
+    if problema.es_objetivo(nodo_inicial.estado):
+        if observador is not None:
+            observador(OBJETIVO, nodo_inicial.estado, None, 0.0, 0)
+        return ResultadoBusqueda(
+            encontrado=True,
+            camino=nodo_inicial.obtener_camino(),
+            costo_total=0,
+            nodos_expandidos=1
+        )
+    
+    grafo, inicial, objetivo = preparar_busqueda(problema)
+    
+    if inicial < 0:
+        return ResultadoBusqueda(encontrado=False, nodos_expandidos=1)
+    
+    en_camino = bytearray(grafo.num_nodos)
+    transposiciones: Dict[int, int] = {}
+    expandidos_por_iteracion = []
+    generados = podados = pico_frontera = pico_explorados = 0
+    control = ControlPresupuesto(presupuesto)
+    previos = 0
+    
+    for limite in range(limite_maximo + 1):
+        if previos >= control.proxima and control.revisar(previos):
+            break
+        
+        transposiciones.clear()
+        ids, costo_total, nodos_expandidos, cortado, pendientes, podados_iteracion, longitud = _profundidad_limitada(
+            grafo, inicial, objetivo, limite, en_camino, transposiciones, max_transposiciones, control, previos,
+            observador
+        )
+        expandidos_por_iteracion.append(nodos_expandidos)
+        previos += nodos_expandidos
+        # Cada nodo expandido salvo la raíz se generó al bajar a él
+        generados += max(nodos_expandidos - 1, 0) + (ids is not None)
+        podados += podados_iteracion
+        pico_frontera = max(pico_frontera, longitud)
+        pico_explorados = max(pico_explorados, len(transposiciones))
+        
+        if ids is not None:
+            if metricas is not None:
+                metricas.registrar(generados, podados, pico_frontera, pico_explorados)
+            return ResultadoBusqueda(
+                encontrado=True,
+                camino=grafo.reconstruir_camino(ids),
+                costo_total=costo_total,
+                nodos_expandidos=sum(expandidos_por_iteracion),
+                nodos_frontera=pendientes,
+                expandidos_por_iteracion=expandidos_por_iteracion,
+                metricas=metricas
+            )
+        
+        if not cortado or control.motivo is not None:
+            break
+    
+    if metricas is not None:
+        metricas.registrar(generados, podados, pico_frontera, pico_explorados)
+    return ResultadoBusqueda(
+        encontrado=False,
+        nodos_expandidos=sum(expandidos_por_iteracion),
+        expandidos_por_iteracion=expandidos_por_iteracion,
+        metricas=metricas,
+        motivo_parada=control.motivo
+    )
+
+
+def _resultado_implicito(
+    problema: ProblemaImplicito,
+    padres: Dict[Any, Any],
+    estado: Any,
+    nodos_expandidos: int,
+    nodos_frontera: int,
+    metricas: Optional[MetricasBusqueda],
+    costo_total: Optional[float] = None
+) -> ResultadoBusqueda:
+    """Resultado con el camino hasta ``estado`` según el diccionario de padres."""
+    estados = estados_camino(padres, estado)
+    return ResultadoBusqueda(
+        encontrado=True,
+        camino=problema.reconstruir_camino(estados),
+        costo_total=problema.costo_camino(estados) if costo_total is None else costo_total,
+        nodos_expandidos=nodos_expandidos,
+        nodos_frontera=nodos_frontera,
+        metricas=metricas
+    )
+
+
+def _amplitud_implicita(
+    problema: ProblemaImplicito,
+    metricas: Optional[MetricasBusqueda],
+    presupuesto: Optional[PresupuestoBusqueda],
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
+    """BFS sobre un problema implícito (ver ``busqueda_amplitud``)."""
+    inicial = problema.estado_inicial
+    
+    if problema.es_objetivo(inicial):
+        if observador is not None:
+            observador(OBJETIVO, inicial, None, 0.0, 0)
+        return _resultado_implicito(problema, {inicial: None}, inicial, 1, 0, None, 0)
+    
+    sucesores, es_objetivo = problema.sucesores, problema.es_objetivo
+    # El diccionario de padres es también el conjunto de estados alcanzados
+    padres = {inicial: None}
+    frontera = deque([inicial])
+    nodos_expandidos = podados = pico_frontera = 0
+    medir = metricas is not None
+    observar = observador is not None
+    # Costo del camino hasta cada estado alcanzado, solo para los eventos
+    costos_camino = {inicial: 0.0}
+    control = ControlPresupuesto(presupuesto)
+    revision = control.proxima
+    
+    while frontera:
+        if nodos_expandidos >= revision:
+            if control.revisar(nodos_expandidos):
+                break
+            revision = control.proxima
+        
+        if medir:
+            pico_frontera = max(pico_frontera, len(frontera))
+        
+        actual = frontera.popleft()
+        nodos_expandidos += 1
+        
+        if observar:
+            observador(EXPANDIR, actual, None, costos_camino[actual], 0)
+        
+        for sucesor, costo in sucesores(actual):
+            if sucesor in padres:
+                podados += 1
+                if observar:
+                    observador(PODAR, sucesor, actual, costos_camino[actual] + costo, 0)
+                continue
+            
+            padres[sucesor] = actual
+            if observar:
+                costos_camino[sucesor] = costos_camino[actual] + costo
+                observador(GENERAR, sucesor, actual, costos_camino[sucesor], 0)
+            
+            if es_objetivo(sucesor):
+                if observar:
+                    observador(OBJETIVO, sucesor, actual, costos_camino[sucesor], 0)
+                if medir:
+                    metricas.registrar(len(padres) - 1, podados, max(pico_frontera, len(frontera)), len(padres))
+                return _resultado_implicito(problema, padres, sucesor, nodos_expandidos, len(frontera), metricas)
+            
+            frontera.append(sucesor)
+    
+    if medir:
+        metricas.registrar(len(padres) - 1, podados, pico_frontera, len(padres))
+    return ResultadoBusqueda(
+        encontrado=False,
+        nodos_expandidos=nodos_expandidos,
+        nodos_frontera=len(frontera),
+        metricas=metricas,
+        motivo_parada=control.motivo
+    )
+
+
+def _profundidad_implicita(
+    problema: ProblemaImplicito,
+    limite: Optional[int],
+    metricas: Optional[MetricasBusqueda],
+    presupuesto: Optional[PresupuestoBusqueda],
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
+    """DFS o DLS sobre un problema implícito (ver ``busqueda_profundidad``)."""
+    inicial = problema.estado_inicial
+    
+    if problema.es_objetivo(inicial):
+        if observador is not None:
+            observador(OBJETIVO, inicial, None, 0.0, 0)
+        return _resultado_implicito(problema, {inicial: None}, inicial, 1, 0, None, 0)
+    
+    sucesores, es_objetivo = problema.sucesores, problema.es_objetivo
+    # Un estado puede estar varias veces en la pila; su padre (y su profundidad) es el de
+    # la última entrada, que es la primera en salir
+    padres = {inicial: None}
+    profundidades = {inicial: 0}
+    frontera = [inicial]
+    explorados = set()
+    nodos_expandidos = generados = podados = pico_frontera = 0
+    medir = metricas is not None
+    observar = observador is not None
+    # Costo del camino de la última entrada de cada estado, solo para los eventos
+    costos_camino = {inicial: 0.0}
+    control = ControlPresupuesto(presupuesto)
+    revision = control.proxima
+    
+    while frontera:
+        if nodos_expandidos >= revision:
+            if control.revisar(nodos_expandidos):
+                break
+            revision = control.proxima
+        
+        if medir:
+            pico_frontera = max(pico_frontera, len(frontera))
+        
+        actual = frontera.pop()
+        
+        if actual in explorados:
+            podados += 1
+            if observar:
+                observador(PODAR, actual, None, costos_camino[actual], 0)
+            continue
+        
+        explorados.add(actual)
+        nodos_expandidos += 1
+        
+        if observar:
+            observador(EXPANDIR, actual, None, costos_camino[actual], 0)
+        
+        # Verificar límite de profundidad
+        if limite is not None:
+            profundidad = profundidades[actual] + 1
+            if profundidad > limite:
+                continue
+        
+        for sucesor, costo in sucesores(actual):
+            if sucesor in explorados:
+                podados += 1
+                if observar:
+                    observador(PODAR, sucesor, actual, costos_camino[actual] + costo, 0)
+                continue
+            
+            padres[sucesor] = actual
+            generados += 1
+            if limite is not None:
+                profundidades[sucesor] = profundidad
+            if observar:
+                costos_camino[sucesor] = costos_camino[actual] + costo
+                observador(GENERAR, sucesor, actual, costos_camino[sucesor], 0)
+            
+            if es_objetivo(sucesor):
+                if observar:
+                    observador(OBJETIVO, sucesor, actual, costos_camino[sucesor], 0)
+                if medir:
+                    metricas.registrar(generados, podados, max(pico_frontera, len(frontera)), len(explorados))
+                return _resultado_implicito(problema, padres, sucesor, nodos_expandidos, len(frontera), metricas)
+            
+            frontera.append(sucesor)
+    
+    if medir:
+        metricas.registrar(generados, podados, pico_frontera, len(explorados))
+    return ResultadoBusqueda(
+        encontrado=False,
+        nodos_expandidos=nodos_expandidos,
+        nodos_frontera=len(frontera),
+        metricas=metricas,
+        motivo_parada=control.motivo
+    )
+
+
+def _costo_uniforme_implicito(
+    problema: ProblemaImplicito,
+    metricas: Optional[MetricasBusqueda],
+    presupuesto: Optional[PresupuestoBusqueda],
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
+    """UCS sobre un problema implícito (ver ``busqueda_costo_uniforme``)."""
+    inicial = problema.estado_inicial
+    
+    if problema.es_objetivo(inicial):
+        if observador is not None:
+            observador(OBJETIVO, inicial, None, 0.0, 0)
+        return _resultado_implicito(problema, {inicial: None}, inicial, 1, 0, None, 0)
+    
+    sucesores, es_objetivo = problema.sucesores, problema.es_objetivo
+    # Con costos no negativos, un estado explorado ya tiene su costo definitivo: basta el
+    # diccionario de mejores costos para descartar sucesores y entradas obsoletas
+    mejor_costo = {inicial: 0.0}
+    padres = {inicial: None}
+    cola = [(0.0, inicial)]
+    nodos_expandidos = generados = podados = pico_frontera = 0
+    medir = metricas is not None
+    observar = observador is not None
+    control = ControlPresupuesto(presupuesto)
+    revision = control.proxima
+    
+    while cola:
+        if nodos_expandidos >= revision:
+            if control.revisar(nodos_expandidos):
+                break
+            revision = control.proxima
+        
+        if medir:
+            pico_frontera = max(pico_frontera, len(cola))
+        
+        costo_actual, actual = heapq.heappop(cola)
+        
+        if costo_actual > mejor_costo[actual]:
+            podados += 1
+            if observar:
+                observador(PODAR, actual, None, costo_actual, 0)
+            continue
+        
+        if es_objetivo(actual):
+            if observar:
+                observador(OBJETIVO, actual, padres[actual], costo_actual, 0)
+            if medir:
+                metricas.registrar(generados, podados, pico_frontera, len(mejor_costo))
+            return _resultado_implicito(
+                problema, padres, actual, nodos_expandidos, len(cola), metricas, costo_actual
+            )
+        
+        nodos_expandidos += 1
+        
+        if observar:
+            observador(EXPANDIR, actual, None, costo_actual, 0)
+        
+        for sucesor, costo in sucesores(actual):
+            costo_sucesor = costo_actual + costo
+            
+            if costo_sucesor < mejor_costo.get(sucesor, math.inf):
+                mejor_costo[sucesor] = costo_sucesor
+                padres[sucesor] = actual
+                heapq.heappush(cola, (costo_sucesor, sucesor))
+                generados += 1
+                if observar:
+                    observador(GENERAR, sucesor, actual, costo_sucesor, 0)
+            else:
+                podados += 1
+                if observar:
+                    observador(PODAR, sucesor, actual, costo_sucesor, 0)
+    
+    if medir:
+        metricas.registrar(generados, podados, pico_frontera, len(mejor_costo))
+    return ResultadoBusqueda(
+        encontrado=False,
+        nodos_expandidos=nodos_expandidos,
+        nodos_frontera=len(cola),
+        metricas=metricas,
+        motivo_parada=control.motivo
+    )
+
+
+def _profundidad_limitada_implicita(
+    problema: ProblemaImplicito,
+    limite: int,
+    transposiciones: Dict[Any, int],
+    max_transposiciones: int,
+    control: ControlPresupuesto,
+    previos: int = 0,
+    observador: Optional[Observador] = None
+) -> Tuple[Optional[List[Any]], float, int, bool, int, int]:
+    """
+    Búsqueda en profundidad limitada en árbol sobre un problema implícito (ver
+    ``_profundidad_limitada``).
+    
+    Returns:
+        Tuple: (estados del camino o None, costo del camino, nodos expandidos, si algún
+        nodo quedó sin expandir por el límite, sucesores podados por ciclo o
+        transposición, longitud máxima del camino en la pila)
+    """
+    if limite == 0:
+        return None, 0.0, 0, True, 0, 0
+    
+    inicial = problema.estado_inicial
+    sucesores, es_objetivo = problema.sucesores, problema.es_objetivo
+    # Camino actual, costo acumulado hasta cada uno de sus estados y sus sucesores por explorar
+    camino = [inicial]
+    costos = [0.0]
+    pendientes = [iter(sucesores(inicial))]
+    en_camino = {inicial}
+    transposiciones[inicial] = 0
+    nodos_expandidos = 1
+    cortado = False
+    podados = 0
+    longitud_maxima = 1
+    revision = control.proxima - previos
+    observar = observador is not None
+    
+    if observar:
+        observador(EXPANDIR, inicial, None, 0.0, 0)
+    
+    while camino:
+        siguiente = next(pendientes[-1], None)
+        
+        if siguiente is None:
+            en_camino.discard(camino.pop())
+            costos.pop()
+            pendientes.pop()
+            continue
+        
+        sucesor, costo = siguiente
+        costo_sucesor = costos[-1] + costo
+        
+        if sucesor in en_camino:
+            podados += 1
+            if observar:
+                observador(PODAR, sucesor, camino[-1], costo_sucesor, 0)
+            continue
+        
+        if es_objetivo(sucesor):
+            if observar:
+                observador(GENERAR, sucesor, camino[-1], costo_sucesor, 0)
+                observador(OBJETIVO, sucesor, camino[-1], costo_sucesor, 0)
+            return camino + [sucesor], costo_sucesor, nodos_expandidos, cortado, podados, longitud_maxima
+        
+        profundidad = len(camino)
+        
+        if profundidad == limite:
+            cortado = True
+            continue
+        
+        anterior = transposiciones.get(sucesor)
+        if anterior is not None and anterior <= profundidad:
+            podados += 1
+            if observar:
+                observador(PODAR, sucesor, camino[-1], costo_sucesor, 0)
+            continue
+        if anterior is not None or len(transposiciones) < max_transposiciones:
+            transposiciones[sucesor] = profundidad
+        
+        if nodos_expandidos >= revision:
+            if control.revisar(previos + nodos_expandidos):
+                return None, 0.0, nodos_expandidos, True, podados, longitud_maxima
+            revision = control.proxima - previos
+        
+        if observar:
+            observador(GENERAR, sucesor, camino[-1], costo_sucesor, 0)
+            observador(EXPANDIR, sucesor, None, costo_sucesor, 0)
+        
+        camino.append(sucesor)
+        costos.append(costo_sucesor)
+        pendientes.append(iter(sucesores(sucesor)))
+        en_camino.add(sucesor)
+        nodos_expandidos += 1
+        if profundidad >= longitud_maxima:
+            longitud_maxima = profundidad + 1
+    
+    return None, 0.0, nodos_expandidos, cortado, podados, longitud_maxima
+
+
+def _profundidad_iterativa_implicita(
+    problema: ProblemaImplicito,
+    limite_maximo: int,
+    max_transposiciones: int,
+    metricas: Optional[MetricasBusqueda],
+    presupuesto: Optional[PresupuestoBusqueda],
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
+    """IDDFS sobre un problema implícito (ver ``busqueda_profundidad_iterativa``)."""
+    inicial = problema.estado_inicial
+    
+    if problema.es_objetivo(inicial):
+        if observador is not None:
+            observador(OBJETIVO, inicial, None, 0.0, 0)
+        return _resultado_implicito(problema, {inicial: None}, inicial, 1, 0, None, 0)
+    
+    transposiciones: Dict[Any, int] = {}
+    expandidos_por_iteracion = []
+    generados = podados = pico_frontera = pico_explorados = 0
+    control = ControlPresupuesto(presupuesto)
+    previos = 0
+    
+    for limite in range(limite_maximo + 1):
+        if previos >= control.proxima and control.revisar(previos):
+            break
+        
+        transposiciones.clear()
+        estados, costo_total, nodos_expandidos, cortado, podados_iteracion, longitud = _profundidad_limitada_implicita(
+            problema, limite, transposiciones, max_transposiciones, control, previos, observador
+        )
+        expandidos_por_iteracion.append(nodos_expandidos)
+        previos += nodos_expandidos
+        generados += max(nodos_expandidos - 1, 0) + (estados is not None)
+        podados += podados_iteracion
+        pico_frontera = max(pico_frontera, longitud)
+        pico_explorados = max(pico_explorados, len(transposiciones))
+        
+        if estados is not None:
+            if metricas is not None:
+                metricas.registrar(generados, podados, pico_frontera, pico_explorados)
+            return ResultadoBusqueda(
+                encontrado=True,
+                camino=problema.reconstruir_camino(estados),
+                costo_total=costo_total,
+                nodos_expandidos=sum(expandidos_por_iteracion),
+                nodos_frontera=len(estados) - 1,
+                expandidos_por_iteracion=expandidos_por_iteracion,
+                metricas=metricas
+            )
+        
+        if not cortado or control.motivo is not None:
+            break
+    
+    if metricas is not None:
+        metricas.registrar(generados, podados, pico_frontera, pico_explorados)
+    return ResultadoBusqueda(
+        encontrado=False,
+        nodos_expandidos=sum(expandidos_por_iteracion),
+        expandidos_por_iteracion=expandidos_por_iteracion,
+        metricas=metricas,
+        motivo_parada=control.motivo
+    )
+
+
+def _camino_bidireccional(
+    grafo: GrafoCompilado,
+    padres_ida: array,
+    padres_vuelta: array,
+    encuentro: int
+) -> List[Tuple[str, str]]:
+    """Une los caminos inicial → encuentro (búsqueda hacia adelante) y encuentro → objetivo (hacia atrás)."""
+    ids = []
+    nodo = encuentro
+    while nodo >= 0:
+        ids.append(nodo)
+        nodo = padres_ida[nodo]
+    ids.reverse()
+    
+    nodo = padres_vuelta[encuentro]
+    while nodo >= 0:
+        ids.append(nodo)
+        nodo = padres_vuelta[nodo]
+    
+    return grafo.reconstruir_camino(ids)
+
+
+def busqueda_amplitud_bidireccional(
+    problema: ProblemaDeRuta,
+    metricas: Optional[MetricasBusqueda] = None,
+    presupuesto: Optional[PresupuestoBusqueda] = None,
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
+    """
+    Búsqueda en Amplitud Bidireccional.
+    
+    Ejecuta dos BFS simultáneas, una desde el estado inicial y otra hacia atrás desde
+    el objetivo (sobre el grafo inverso), expandiendo en cada paso un nivel completo
+    de la frontera más pequeña. Se detiene en el primer nivel en que las búsquedas
+    se encuentran, eligiendo el punto de encuentro que da el camino más corto.
+    Encuentra la solución con menos pasos expandiendo del orden de b^(d/2) nodos.
+    
+    Args:
+        problema: El problema a resolver
+        metricas: Si se indica, se completan sus contadores (de ambos sentidos) y se
+            adjunta al resultado
+        presupuesto: Límites de tiempo, expansiones y memoria, y token de cancelación
+            (ver presupuesto_busqueda.py); si se agota después de que las búsquedas se
+            encontraran, se devuelve el mejor camino hallado hasta entonces
+        observador: Si se indica, recibe cada evento de la búsqueda a medida que ocurre
+            (ver ``Observador``)
     
     Returns:
         ResultadoBusqueda: Los resultados de la búsqueda
     """
-    nodos_expandidos_total = 0
+    nodo_inicial = Nodo(problema.estado_inicial)
+    
+    if problema.es_objetivo(nodo_inicial.estado):
+        if observador is not None:
+            observador(OBJETIVO, nodo_inicial.estado, None, 0.0, 0)
+        return ResultadoBusqueda(
+            encontrado=True,
+            camino=nodo_inicial.obtener_camino(),
+            costo_total=0,
+            nodos_expandidos=1
+        )
+    
+    grafo, inicial, objetivo = preparar_busqueda(problema)
     
-    for profundidad in range(limite_maximo + 1):
-        resultado = busqueda_profundidad(problema, limite=profundidad)
-        nodos_expandidos_total += resultado.nodos_expandidos
+    if inicial < 0 or objetivo < 0:
+        return ResultadoBusqueda(encontrado=False, nodos_expandidos=int(inicial >= 0))
+    
+    n = grafo.num_nodos
+    grafos = (grafo, grafo.invertido())
+    # Por sentido: padre (-1 en la raíz), profundidad (-1 si no se alcanzó) y costo acumulado
+    padres = (array('i', [-1]) * n, array('i', [-1]) * n)
+    profundidades = (array('i', [-1]) * n, array('i', [-1]) * n)
+    costos_acumulados = (array('d', bytes(8 * n)), array('d', bytes(8 * n)))
+    profundidades[0][inicial] = 0
+    profundidades[1][objetivo] = 0
+    fronteras = ([inicial], [objetivo])
+    nodos_expandidos = 0
+    medir = metricas is not None
+    aristas_examinadas = pico_frontera = generados = 0
+    observar = observador is not None
+    nombres = grafo.nombres
+    control = ControlPresupuesto(presupuesto)
+    revision = control.proxima
+    
+    while fronteras[0] and fronteras[1]:
+        if medir:
+            pico_frontera = max(pico_frontera, len(fronteras[0]) + len(fronteras[1]))
         
-        if resultado.encontrado:
-            resultado.nodos_expandidos = nodos_expandidos_total
-            return resultado
+        sentido = 0 if len(fronteras[0]) <= len(fronteras[1]) else 1
+        desplazamientos, destinos, costos = (
+            grafos[sentido].desplazamientos, grafos[sentido].destinos, grafos[sentido].costos
+        )
+        propias, ajenas = profundidades[sentido], profundidades[1 - sentido]
+        propios_padres, propios_costos = padres[sentido], costos_acumulados[sentido]
+        siguiente = []
+        mejor, encuentro = -1, -1
+        
+        for actual in fronteras[sentido]:
+            if nodos_expandidos >= revision:
+                if control.revisar(nodos_expandidos):
+                    break
+                revision = control.proxima
+            
+            nodos_expandidos += 1
+            
+            if observar:
+                observador(EXPANDIR, nombres[actual], None, propios_costos[actual], sentido)
+            
+            if medir:
+                aristas_examinadas += desplazamientos[actual + 1] - desplazamientos[actual]
+            
+            for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+                sucesor = destinos[k]
+                if propias[sucesor] < 0:
+                    propias[sucesor] = propias[actual] + 1
+                    propios_padres[sucesor] = actual
+                    propios_costos[sucesor] = propios_costos[actual] + costos[k]
+                    siguiente.append(sucesor)
+                    if observar:
+                        observador(GENERAR, nombres[sucesor], nombres[actual], propios_costos[sucesor], sentido)
+                    
+                    # Todos los sucesores de este nivel tienen la misma profundidad propia:
+                    # el mejor encuentro es el de menor profundidad en la otra búsqueda
+                    if ajenas[sucesor] >= 0 and (mejor < 0 or ajenas[sucesor] < mejor):
+                        mejor, encuentro = ajenas[sucesor], sucesor
+                elif observar:
+                    observador(PODAR, nombres[sucesor], nombres[actual], propios_costos[actual] + costos[k], sentido)
+        
+        fronteras = (siguiente, fronteras[1]) if sentido == 0 else (fronteras[0], siguiente)
+        generados += len(siguiente)
+        
+        if encuentro >= 0:
+            costo_total = costos_acumulados[0][encuentro] + costos_acumulados[1][encuentro]
+            if observar:
+                observador(OBJETIVO, nombres[encuentro], None, costo_total, sentido)
+            if medir:
+                metricas.registrar(
+                    generados, aristas_examinadas - generados,
+                    max(pico_frontera, len(fronteras[0]) + len(fronteras[1])), generados + 2
+                )
+            return ResultadoBusqueda(
+                encontrado=True,
+                camino=_camino_bidireccional(grafo, padres[0], padres[1], encuentro),
+                costo_total=costo_total,
+                nodos_expandidos=nodos_expandidos,
+                nodos_frontera=len(fronteras[0]) + len(fronteras[1]),
+                metricas=metricas,
+                motivo_parada=control.motivo
+            )
+        
+        if control.motivo is not None:
+            break
+    
+    if medir:
+        metricas.registrar(generados, aristas_examinadas - generados, pico_frontera, generados + 2)
+    return ResultadoBusqueda(
+        encontrado=False, nodos_expandidos=nodos_expandidos, metricas=metricas, motivo_parada=control.motivo
+    )
+
+
+def busqueda_costo_uniforme_bidireccional(
+    problema: ProblemaDeRuta,
+    metricas: Optional[MetricasBusqueda] = None,
+    presupuesto: Optional[PresupuestoBusqueda] = None,
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
+    """
+    Búsqueda de Costo Uniforme Bidireccional (Dijkstra bidireccional).
+    
+    Alterna una UCS desde el estado inicial y otra hacia atrás desde el objetivo
+    (sobre el grafo inverso), avanzando siempre por la cola con la clave mínima más
+    baja. Cada vez que una arista une ambas búsquedas se actualiza el mejor costo
+    conocido μ. La búsqueda se detiene cuando la suma de las claves mínimas de las
+    dos colas alcanza μ: ningún camino no descubierto puede ser más barato.
+    Garantiza encontrar la solución de menor costo.
+    
+    Args:
+        problema: El problema a resolver
+        metricas: Si se indica, se completan sus contadores (de ambos sentidos) y se
+            adjunta al resultado
+        presupuesto: Límites de tiempo, expansiones y memoria, y token de cancelación
+            (ver presupuesto_busqueda.py); si se agota después de que las búsquedas se
+            encontraran, se devuelve el mejor camino hallado hasta entonces
+        observador: Si se indica, recibe cada evento de la búsqueda a medida que ocurre
+            (ver ``Observador``)
+    
+    Returns:
+        ResultadoBusqueda: Los resultados de la búsqueda
+    """
+    nodo_inicial = Nodo(problema.estado_inicial)
+    
+    if problema.es_objetivo(nodo_inicial.estado):
+        if observador is not None:
+            observador(OBJETIVO, nodo_inicial.estado, None, 0.0, 0)
+        return ResultadoBusqueda(
+            encontrado=True,
+            camino=nodo_inicial.obtener_camino(),
+            costo_total=0,
+            nodos_expandidos=1
+        )
+    
+    grafo, inicial, objetivo = preparar_busqueda(problema)
+    
+    if inicial < 0 or objetivo < 0:
+        return ResultadoBusqueda(encontrado=False, nodos_expandidos=int(inicial >= 0))
     
-    return ResultadoBusqueda(encontrado=False, nodos_expandidos=nodos_expandidos_total)
+    n = grafo.num_nodos
+    grafos = (grafo, grafo.invertido())
+    padres = (array('i', [-1]) * n, array('i', [-1]) * n)
+    distancias = (array('d', [math.inf]) * n, array('d', [math.inf]) * n)
+    explorados = (bytearray(n), bytearray(n))
+    distancias[0][inicial] = 0.0
+    distancias[1][objetivo] = 0.0
+    fronteras = ([(0.0, inicial)], [(0.0, objetivo)])
+    mejor, encuentro = math.inf, -1
+    nodos_expandidos = 0
+    medir = metricas is not None
+    aristas_examinadas = pico_frontera = generados = obsoletos = 0
+    observar = observador is not None
+    nombres = grafo.nombres
+    control = ControlPresupuesto(presupuesto)
+    revision = control.proxima
+    
+    while fronteras[0] and fronteras[1]:
+        # Criterio de parada del caso ponderado
+        if fronteras[0][0][0] + fronteras[1][0][0] >= mejor:
+            break
+        
+        if nodos_expandidos >= revision:
+            if control.revisar(nodos_expandidos):
+                break
+            revision = control.proxima
+        
+        if medir:
+            pico_frontera = max(pico_frontera, len(fronteras[0]) + len(fronteras[1]))
+        
+        sentido = 0 if fronteras[0][0][0] <= fronteras[1][0][0] else 1
+        distancia, actual = heapq.heappop(fronteras[sentido])
+        
+        if explorados[sentido][actual]:
+            obsoletos += 1
+            if observar:
+                observador(PODAR, nombres[actual], None, distancia, sentido)
+            continue
+        
+        explorados[sentido][actual] = 1
+        nodos_expandidos += 1
+        
+        if observar:
+            observador(EXPANDIR, nombres[actual], None, distancia, sentido)
+        
+        if medir:
+            aristas_examinadas += grafos[sentido].desplazamientos[actual + 1] - grafos[sentido].desplazamientos[actual]
+        
+        desplazamientos, destinos, costos = (
+            grafos[sentido].desplazamientos, grafos[sentido].destinos, grafos[sentido].costos
+        )
+        propias, ajenas, propios_padres = distancias[sentido], distancias[1 - sentido], padres[sentido]
+        
+        for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+            sucesor = destinos[k]
+            nueva = distancia + costos[k]
+            
+            if nueva < propias[sucesor]:
+                propias[sucesor] = nueva
+                propios_padres[sucesor] = actual
+                heapq.heappush(fronteras[sentido], (nueva, sucesor))
+                generados += 1
+                if observar:
+                    observador(GENERAR, nombres[sucesor], nombres[actual], nueva, sentido)
+            elif observar:
+                observador(PODAR, nombres[sucesor], nombres[actual], nueva, sentido)
+            
+            if nueva + ajenas[sucesor] < mejor:
+                mejor, encuentro = nueva + ajenas[sucesor], sucesor
+    
+    if medir:
+        metricas.registrar(generados, aristas_examinadas - generados + obsoletos, pico_frontera, nodos_expandidos)
+    
+    if encuentro < 0:
+        return ResultadoBusqueda(
+            encontrado=False, nodos_expandidos=nodos_expandidos, metricas=metricas, motivo_parada=control.motivo
+        )
+    
+    if observar:
+        observador(OBJETIVO, nombres[encuentro], None, mejor, 0)
+    return ResultadoBusqueda(
+        encontrado=True,
+        camino=_camino_bidireccional(grafo, padres[0], padres[1], encuentro),
+        costo_total=mejor,
+        nodos_expandidos=nodos_expandidos,
+        nodos_frontera=len(fronteras[0]) + len(fronteras[1]),
+        metricas=metricas,
+        motivo_parada=control.motivo
+    )
 
 
 # Ejemplo de uso
@@ -397,3 +2003,15 @@ if __name__ == "__main__":
     print("4. Búsqueda en Profundidad Iterativa (IDDFS)")
     resultado_iddfs = busqueda_profundidad_iterativa(problema)
     print(resultado_iddfs)
+    print()
+    
+    # BFS bidireccional
+    print("5. Búsqueda en Amplitud Bidireccional")
+    resultado_bfs_bi = busqueda_amplitud_bidireccional(problema)
+    print(resultado_bfs_bi)
+    print()
+    
+    # UCS bidireccional
+    print("6. Búsqueda de Costo Uniforme Bidireccional")
+    resultado_ucs_bi = busqueda_costo_uniforme_bidireccional(problema)
+    print(resultado_ucs_bi)
@@ -0,0 +1,295 @@
+"""
+Módulo: BFS Paralela
+Descripción: Búsqueda en Amplitud por niveles repartida entre varios procesos.
+
+Los arreglos CSR del grafo, la máscara de visitados, la frontera del nivel y los
+búferes de candidatos del siguiente nivel viven en ``multiprocessing.shared_memory``.
+En cada nivel el proceso principal parte la frontera en fragmentos contiguos y asigna
+a cada uno, mediante sumas prefijas de los grados, un rango propio de los búferes de
+candidatos; cada trabajador escribe allí sus vecinos no visitados con
+``expandir_nivel`` y devuelve solo cuántos escribió. Las tareas son tres enteros, así
+que por nivel no se serializa ningún arreglo.
+
+El proceso principal concatena los rangos en el orden de los fragmentos y elimina los
+duplicados igual que ``recorrer_niveles``, de modo que distancias, padres y caminos
+coinciden exactamente con los de amplitud_vectorizada.py.
+"""
+
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from algoritmos_busqueda import MetricasBusqueda, Nodo, ProblemaDeRuta, ResultadoBusqueda, preparar_busqueda
+from amplitud_vectorizada import arreglos_csr, expandir_nivel, recorrer_niveles, resultado_niveles
+from grafo_compartido import abrir_segmento
+from grafo_compilado import GrafoCompilado
+from presupuesto_busqueda import ControlPresupuesto, PresupuestoBusqueda
+
+# Arreglos compartidos de cada trabajador: {nombre: (mapeo del bloque, vista NumPy)}
+_compartidos: Dict[str, Tuple[Any, np.ndarray]] = {}
+
+
+def _adjuntar(bloques: Dict[str, Tuple[str, str, int]]) -> None:
+    """
+    Inicializador de los trabajadores: abre por nombre los bloques de memoria compartida,
+    igual que ``GrafoCompartido.adjuntar`` (sin registrarlos en el resource tracker).
+    """
+    for clave, (nombre, tipo, longitud) in bloques.items():
+        bloque, buffer = abrir_segmento(nombre, escritura=True)
+        _compartidos[clave] = (bloque, np.ndarray(longitud, dtype=tipo, buffer=buffer))
+
+
+def _expandir_fragmento(inicio: int, fin: int, salida: int) -> int:
+    """
+    Expande ``frontera[inicio:fin]`` y escribe los candidatos a partir de ``salida``.
+
+    Returns:
+        int: Número de candidatos escritos
+    """
+    vista = {clave: arreglo for clave, (_, arreglo) in _compartidos.items()}
+    vecinos, aristas = expandir_nivel(
+        vista["desplazamientos"], vista["destinos"], vista["visitados"], vista["frontera"][inicio:fin]
+    )
+    cantidad = len(vecinos)
+    vista["vecinos"][salida:salida + cantidad] = vecinos
+    vista["aristas"][salida:salida + cantidad] = aristas
+    return cantidad
+
+
+class AmplitudParalela:
+    """
+    Motor de BFS por niveles con un grupo de procesos y memoria compartida.
+
+    Crear el motor copia el grafo a memoria compartida y arranca los procesos; después
+    se pueden resolver tantas consultas como se quiera sobre el mismo grafo. Debe
+    cerrarse con ``cerrar`` (o usarse como gestor de contexto) para terminar los
+    procesos y liberar la memoria compartida.
+    """
+
+    def __init__(
+        self,
+        grafo: GrafoCompilado,
+        num_procesos: Optional[int] = None,
+        umbral_paralelo: int = 50_000,
+        metodo_inicio: Optional[str] = None
+    ):
+        """
+        Inicializa el motor.
+
+        Args:
+            grafo: El grafo compilado
+            num_procesos: Número de trabajadores (por defecto, el número de CPUs)
+            umbral_paralelo: Los niveles con menos aristas se expanden en el proceso
+                principal, donde repartirlos costaría más que hacerlos
+            metodo_inicio: Método de inicio de multiprocessing ("fork", "spawn", ...)
+        """
+        self.grafo = grafo
+        self.num_procesos = num_procesos or os.cpu_count() or 1
+        self.umbral_paralelo = umbral_paralelo
+
+        n, m = grafo.num_nodos, grafo.num_aristas
+        desplazamientos, destinos, _ = arreglos_csr(grafo)
+        self._bloques: List[shared_memory.SharedMemory] = []
+        self._vistas: Dict[str, np.ndarray] = {}
+        descripcion: Dict[str, Tuple[str, str, int]] = {}
+
+        for clave, tipo, longitud in (
+            ("desplazamientos", "int64", n + 1), ("destinos", "int32", m),
+            ("visitados", "bool", n), ("frontera", "int32", n),
+            ("vecinos", "int32", m), ("aristas", "int64", m),
+        ):
+            tamano = max(1, longitud * np.dtype(tipo).itemsize)
+            bloque = shared_memory.SharedMemory(create=True, size=tamano)
+            self._bloques.append(bloque)
+            self._vistas[clave] = np.ndarray(longitud, dtype=tipo, buffer=bloque.buf)
+            descripcion[clave] = (bloque.name, tipo, longitud)
+
+        self._vistas["desplazamientos"][:] = desplazamientos
+        self._vistas["destinos"][:] = destinos
+
+        contexto = multiprocessing.get_context(metodo_inicio)
+        self._grupo = contexto.Pool(self.num_procesos, initializer=_adjuntar, initargs=(descripcion,))
+
+    def recorrer(
+        self,
+        origen: int,
+        objetivo: int = -1,
+        metricas: Optional[MetricasBusqueda] = None,
+        control: Optional[ControlPresupuesto] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int, int]:
+        """
+        BFS por niveles desde ``origen`` con el contrato de ``recorrer_niveles``.
+
+        Args:
+            origen: Id del nodo de partida
+            objetivo: Id del nodo objetivo (-1 para recorrer todo lo alcanzable)
+            metricas: Si se indica, se completan sus contadores
+            control: Presupuesto del recorrido, revisado antes de expandir cada nivel
+
+        Returns:
+            Tuple: (distancias en saltos, padres, arista por la que se llegó a cada nodo,
+            nodos expandidos, tamaño de la última frontera)
+        """
+        visitados = self._vistas["visitados"]
+        visitados[:] = False
+        return recorrer_niveles(self.grafo, origen, objetivo, self._expandir, visitados, metricas, control)
+
+    def distancias_saltos(self, origen: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Distancias en saltos y padres de todos los nodos (ver ``amplitud_vectorizada.distancias_saltos``).
+
+        Raises:
+            KeyError: Si el origen no pertenece al grafo
+        """
+        inicial = self.grafo.indice(origen)
+
+        if inicial < 0:
+            raise KeyError(origen)
+
+        distancias, padres, _, _, _ = self.recorrer(inicial)
+        return distancias, padres
+
+    def buscar(
+        self,
+        problema: ProblemaDeRuta,
+        metricas: Optional[MetricasBusqueda] = None,
+        presupuesto: Optional[PresupuestoBusqueda] = None
+    ) -> ResultadoBusqueda:
+        """
+        Resuelve un problema sobre el grafo del motor; equivale a ``busqueda_amplitud_vectorizada``.
+
+        Args:
+            problema: El problema a resolver (su grafo compilado debe ser el del motor)
+            metricas: Si se indica, se completan sus contadores y se adjunta al resultado
+            presupuesto: Límites de tiempo, expansiones y memoria, y token de cancelación
+                (ver presupuesto_busqueda.py), revisados al empezar cada nivel
+
+        Returns:
+            ResultadoBusqueda: Los resultados de la búsqueda
+        """
+        nodo_inicial = Nodo(problema.estado_inicial)
+
+        if problema.es_objetivo(nodo_inicial.estado):
+            return ResultadoBusqueda(
+                encontrado=True,
+                camino=nodo_inicial.obtener_camino(),
+                costo_total=0,
+                nodos_expandidos=1
+            )
+
+        grafo, inicial, objetivo = preparar_busqueda(problema)
+
+        if grafo is not self.grafo:
+            raise ValueError("El problema no usa el grafo de este motor")
+
+        if inicial < 0:
+            return ResultadoBusqueda(encontrado=False, nodos_expandidos=1)
+
+        control = ControlPresupuesto(presupuesto)
+        recorrido = self.recorrer(inicial, objetivo, metricas, control)
+        return resultado_niveles(grafo, objetivo, recorrido, metricas, control.motivo)
+
+    def cerrar(self) -> None:
+        """Termina los procesos y libera la memoria compartida."""
+        if self._grupo is not None:
+            self._grupo.terminate()
+            self._grupo.join()
+            self._grupo = None
+
+        self._vistas.clear()
+        for bloque in self._bloques:
+            bloque.close()
+            bloque.unlink()
+        self._bloques.clear()
+
+    def __enter__(self) -> 'AmplitudParalela':
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def _expandir(self, frontera: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Expande un nivel repartiéndolo entre los trabajadores (contrato de ``expandir_nivel``)."""
+        vistas = self._vistas
+        desplazamientos = vistas["desplazamientos"]
+        grados = desplazamientos[frontera + 1] - desplazamientos[frontera]
+        total = int(grados.sum())
+
+        if total < self.umbral_paralelo or self.num_procesos == 1:
+            return expandir_nivel(desplazamientos, vistas["destinos"], vistas["visitados"], frontera)
+
+        vistas["frontera"][:frontera.size] = frontera
+
+        # Fragmentos contiguos con un número parecido de aristas; cada uno escribe sus
+        # candidatos en su propio rango [salida, salida + aristas del fragmento)
+        acumulados = np.cumsum(grados)
+        cortes = np.searchsorted(
+            acumulados, np.arange(1, self.num_procesos) * total / self.num_procesos, side='right'
+        )
+        limites = [0, *sorted(set(int(c) for c in cortes) - {0, frontera.size}), frontera.size]
+        tareas = [
+            (inicio, fin, int(acumulados[inicio - 1]) if inicio > 0 else 0)
+            for inicio, fin in zip(limites, limites[1:])
+        ]
+
+        cantidades = self._grupo.starmap(_expandir_fragmento, tareas)
+
+        vecinos, aristas = vistas["vecinos"], vistas["aristas"]
+        return (
+            np.concatenate([vecinos[salida:salida + c] for (_, _, salida), c in zip(tareas, cantidades)]),
+            np.concatenate([aristas[salida:salida + c] for (_, _, salida), c in zip(tareas, cantidades)]),
+        )
+
+
+def busqueda_amplitud_paralela(
+    problema: ProblemaDeRuta,
+    num_procesos: Optional[int] = None,
+    metricas: Optional[MetricasBusqueda] = None,
+    presupuesto: Optional[PresupuestoBusqueda] = None
+) -> ResultadoBusqueda:
+    """
+    Búsqueda en Amplitud (BFS) por niveles repartida entre varios procesos.
+
+    Crea y cierra un ``AmplitudParalela`` en cada llamada; para varias consultas sobre
+    el mismo grafo conviene crear el motor una vez y usar ``AmplitudParalela.buscar``.
+
+    Args:
+        problema: El problema a resolver
+        num_procesos: Número de trabajadores (por defecto, el número de CPUs)
+        metricas: Si se indica, se completan sus contadores y se adjunta al resultado
+        presupuesto: Límites de tiempo, expansiones y memoria, y token de cancelación
+            (ver presupuesto_busqueda.py); el tiempo cuenta desde que el motor está listo
+
+    Returns:
+        ResultadoBusqueda: Los resultados de la búsqueda
+    """
+    with AmplitudParalela(problema.grafo_compilado, num_procesos) as motor:
+        return motor.buscar(problema, metricas, presupuesto)
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from amplitud_vectorizada import busqueda_amplitud_vectorizada
+
+    # Cuadrícula de 300 x 300 con conexiones a los 4 vecinos
+    lado = 300
+    grafo = {}
+    for fila in range(lado):
+        for columna in range(lado):
+            grafo[f"{fila},{columna}"] = [
+                (f"{fila + df},{columna + dc}", 1)
+                for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                if 0 <= fila + df < lado and 0 <= columna + dc < lado
+            ]
+
+    problema = ProblemaDeRuta(GrafoCompilado.desde_diccionario(grafo), "0,0", f"{lado - 1},{lado - 1}")
+
+    with AmplitudParalela(problema.grafo, num_procesos=2, umbral_paralelo=100) as motor:
+        paralela = motor.buscar(problema)
+
+    serie = busqueda_amplitud_vectorizada(problema)
+    print(paralela)
+    print("\nCoincide con la versión en serie:", paralela.camino == serie.camino)
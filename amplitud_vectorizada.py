@@ -0,0 +1,304 @@
+"""
+Módulo: BFS Vectorizada
+Descripción: Búsqueda en Amplitud por niveles sobre los arreglos CSR del grafo compilado,
+con NumPy.
+
+En lugar de sacar un nodo de la cola en cada iteración, cada paso expande la frontera
+completa de un nivel: recolecta de una vez las aristas de todos sus nodos, descarta los
+vecinos ya visitados y se queda con la primera aparición de cada vecino nuevo. Así el
+orden de descubrimiento, y por tanto los padres, coinciden con los de ``busqueda_amplitud``.
+"""
+
+from array import array
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from algoritmos_busqueda import MetricasBusqueda, Nodo, ProblemaDeRuta, ResultadoBusqueda, preparar_busqueda
+from grafo_compilado import GrafoCompilado
+from presupuesto_busqueda import ControlPresupuesto, PresupuestoBusqueda
+
+Grafo = Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado]
+
+
+def arreglos_csr(grafo: GrafoCompilado) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vistas NumPy de los arreglos CSR del grafo (sin copiarlos si son ``array.array``).
+
+    Args:
+        grafo: El grafo compilado
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (desplazamientos, destinos, costos)
+    """
+    return tuple(
+        np.frombuffer(arreglo, dtype=arreglo.typecode) if isinstance(arreglo, array)
+        else np.asarray(arreglo, dtype=tipo)
+        for arreglo, tipo in (
+            (grafo.desplazamientos, np.int64), (grafo.destinos, np.int32), (grafo.costos, np.float64)
+        )
+    )
+
+
+def expandir_nivel(
+    desplazamientos: np.ndarray,
+    destinos: np.ndarray,
+    visitados: np.ndarray,
+    frontera: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Recolecta las aristas de todos los nodos de ``frontera`` que llevan a nodos no visitados.
+
+    Las aristas se devuelven en el orden en que las recorrería la BFS secuencial (nodo a
+    nodo y, en cada nodo, arista a arista); un mismo vecino puede aparecer varias veces.
+
+    Args:
+        desplazamientos: Desplazamientos CSR (int64)
+        destinos: Destinos CSR (int32)
+        visitados: Máscara de nodos visitados (solo se lee)
+        frontera: Ids de los nodos a expandir
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (vecinos, posición de la arista de cada vecino)
+    """
+    inicios = desplazamientos[frontera]
+    grados = desplazamientos[frontera + 1] - inicios
+    total = int(grados.sum())
+
+    aristas = np.repeat(inicios - (np.cumsum(grados) - grados), grados) + np.arange(total)
+    vecinos = destinos[aristas]
+    nuevos = ~visitados[vecinos]
+    return vecinos[nuevos], aristas[nuevos]
+
+
+def recorrer_niveles(
+    grafo: GrafoCompilado,
+    origen: int,
+    objetivo: int = -1,
+    expandir: Optional[Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]] = None,
+    visitados: Optional[np.ndarray] = None,
+    metricas: Optional[MetricasBusqueda] = None,
+    control: Optional[ControlPresupuesto] = None
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int, int]:
+    """
+    BFS por niveles desde ``origen``; se detiene al terminar el nivel en que aparece ``objetivo``.
+
+    Args:
+        grafo: El grafo compilado
+        origen: Id del nodo de partida
+        objetivo: Id del nodo objetivo (-1 para recorrer todo lo alcanzable)
+        expandir: Función frontera -> (vecinos, aristas) con el contrato de
+            ``expandir_nivel`` (por defecto, ``expandir_nivel`` en este proceso)
+        visitados: Máscara booleana a usar (en ceros); por defecto se crea una nueva
+        metricas: Si se indica, se completan sus contadores (la frontera de pico es el
+            nivel más grande)
+        control: Presupuesto del recorrido, que se revisa antes de expandir cada nivel
+            (así que puede excederse en un nivel); si se agota, el recorrido se detiene y
+            ``control.motivo`` indica por qué
+
+    Returns:
+        Tuple: (distancias en saltos, padres, arista por la que se llegó a cada nodo,
+        nodos expandidos, tamaño de la última frontera)
+    """
+    desplazamientos, destinos, _ = arreglos_csr(grafo)
+    n = grafo.num_nodos
+
+    if visitados is None:
+        visitados = np.zeros(n, dtype=bool)
+    if expandir is None:
+        expandir = partial(expandir_nivel, desplazamientos, destinos, visitados)
+
+    distancias = np.full(n, -1, dtype=np.int32)
+    padres = np.full(n, -1, dtype=np.int32)
+    aristas_padre = np.full(n, -1, dtype=np.int64)
+
+    visitados[origen] = True
+    distancias[origen] = 0
+    frontera = np.array([origen], dtype=np.int32)
+    nodos_expandidos = 0
+    nivel = 0
+    aristas_examinadas = generados = pico_frontera = 0
+
+    while frontera.size and not (objetivo >= 0 and visitados[objetivo]):
+        if control is not None and nodos_expandidos >= control.proxima and control.revisar(nodos_expandidos):
+            break
+
+        nivel += 1
+        nodos_expandidos += frontera.size
+        if metricas is not None:
+            pico_frontera = max(pico_frontera, int(frontera.size))
+            aristas_examinadas += int((desplazamientos[frontera + 1] - desplazamientos[frontera]).sum())
+        vecinos, aristas = expandir(frontera)
+
+        # Primera aparición de cada vecino nuevo, en orden de descubrimiento
+        _, primeros = np.unique(vecinos, return_index=True)
+        primeros.sort()
+        frontera, aristas = vecinos[primeros], aristas[primeros]
+
+        visitados[frontera] = True
+        distancias[frontera] = nivel
+        padres[frontera] = np.searchsorted(desplazamientos, aristas, side='right') - 1
+        aristas_padre[frontera] = aristas
+        generados += int(frontera.size)
+
+    if metricas is not None:
+        metricas.registrar(
+            generados, aristas_examinadas - generados, max(pico_frontera, int(frontera.size)), generados + 1
+        )
+
+    return distancias, padres, aristas_padre, nodos_expandidos, int(frontera.size)
+
+
+def resultado_niveles(
+    grafo: GrafoCompilado,
+    objetivo: int,
+    recorrido: Tuple[np.ndarray, np.ndarray, np.ndarray, int, int],
+    metricas: Optional[MetricasBusqueda] = None,
+    motivo_parada: Optional[str] = None
+) -> ResultadoBusqueda:
+    """
+    Construye el ResultadoBusqueda de un recorrido de ``recorrer_niveles``.
+
+    Args:
+        grafo: El grafo compilado
+        objetivo: Id del nodo objetivo (-1 si no existe)
+        recorrido: La tupla devuelta por ``recorrer_niveles``
+        metricas: Métricas del recorrido a adjuntar al resultado
+        motivo_parada: Motivo por el que se detuvo el recorrido (None si terminó)
+
+    Returns:
+        ResultadoBusqueda: Los resultados de la búsqueda
+    """
+    distancias, padres, aristas_padre, nodos_expandidos, tam_frontera = recorrido
+
+    if objetivo < 0 or distancias[objetivo] < 0:
+        return ResultadoBusqueda(
+            encontrado=False,
+            nodos_expandidos=nodos_expandidos,
+            nodos_frontera=tam_frontera,
+            metricas=metricas,
+            motivo_parada=motivo_parada
+        )
+
+    ids = [objetivo]
+    costo_total = 0.0
+    while padres[ids[-1]] >= 0:
+        costo_total += grafo.costos[int(aristas_padre[ids[-1]])]
+        ids.append(int(padres[ids[-1]]))
+    ids.reverse()
+
+    return ResultadoBusqueda(
+        encontrado=True,
+        camino=grafo.reconstruir_camino(ids),
+        costo_total=costo_total,
+        nodos_expandidos=nodos_expandidos,
+        nodos_frontera=tam_frontera,
+        metricas=metricas
+    )
+
+
+def distancias_saltos(grafo: Grafo, origen: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Distancia en número de aristas y padre BFS de todos los nodos desde ``origen``.
+
+    Ambos arreglos están indexados por el id del nodo en el grafo compilado
+    (``GrafoCompilado.indice``) y valen -1 para los nodos inalcanzables (y el
+    padre también para el origen).
+
+    Args:
+        grafo: Diccionario {nodo: [(vecino, costo), ...]} o un GrafoCompilado
+        origen: El estado de partida
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (distancias int32, padres int32)
+
+    Raises:
+        KeyError: Si el origen no pertenece al grafo
+    """
+    compilado = grafo if isinstance(grafo, GrafoCompilado) else GrafoCompilado.desde_diccionario(grafo)
+    inicial = compilado.indice(origen)
+
+    if inicial < 0:
+        raise KeyError(origen)
+
+    distancias, padres, _, _, _ = recorrer_niveles(compilado, inicial)
+    return distancias, padres
+
+
+def busqueda_amplitud_vectorizada(
+    problema: ProblemaDeRuta,
+    metricas: Optional[MetricasBusqueda] = None,
+    presupuesto: Optional[PresupuestoBusqueda] = None
+) -> ResultadoBusqueda:
+    """
+    Búsqueda en Amplitud (BFS) por niveles con NumPy.
+
+    Devuelve el mismo camino que ``busqueda_amplitud``. Como cada paso expande un nivel
+    completo, ``nodos_expandidos`` cuenta todos los nodos de los niveles anteriores al
+    del objetivo y ``nodos_frontera`` el tamaño del nivel del objetivo.
+
+    Args:
+        problema: El problema a resolver
+        metricas: Si se indica, se completan sus contadores y se adjunta al resultado
+        presupuesto: Límites de tiempo, expansiones y memoria, y token de cancelación
+            (ver presupuesto_busqueda.py), revisados al empezar cada nivel
+
+    Returns:
+        ResultadoBusqueda: Los resultados de la búsqueda
+    """
+    nodo_inicial = Nodo(problema.estado_inicial)
+
+    if problema.es_objetivo(nodo_inicial.estado):
+        return ResultadoBusqueda(
+            encontrado=True,
+            camino=nodo_inicial.obtener_camino(),
+            costo_total=0,
+            nodos_expandidos=1
+        )
+
+    grafo, inicial, objetivo = preparar_busqueda(problema)
+
+    if inicial < 0:
+        return ResultadoBusqueda(encontrado=False, nodos_expandidos=1)
+
+    control = ControlPresupuesto(presupuesto)
+    recorrido = recorrer_niveles(grafo, inicial, objetivo, metricas=metricas, control=control)
+    return resultado_niveles(grafo, objetivo, recorrido, metricas, control.motivo)
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    grafo_rumania = {
+        'Oradea': [('Zerind', 71), ('Sibiu', 151)],
+        'Zerind': [('Oradea', 71), ('Sibiu', 99), ('Arad', 75)],
+        'Arad': [('Zerind', 75), ('Sibiu', 140), ('Timisoara', 118)],
+        'Timisoara': [('Arad', 118), ('Lugoj', 111)],
+        'Lugoj': [('Timisoara', 111), ('Mehadia', 70)],
+        'Mehadia': [('Lugoj', 70), ('Drobeta', 75)],
+        'Drobeta': [('Mehadia', 75)],
+        'Sibiu': [('Oradea', 151), ('Zerind', 99), ('Arad', 140), ('Fagaras', 99), ('Rimnicu Vilcea', 80)],
+        'Rimnicu Vilcea': [('Sibiu', 80), ('Craiova', 146), ('Pitesti', 97)],
+        'Craiova': [('Rimnicu Vilcea', 146), ('Pitesti', 138), ('Drobeta', 120)],
+        'Fagaras': [('Sibiu', 99), ('Bucharest', 211)],
+        'Pitesti': [('Rimnicu Vilcea', 97), ('Craiova', 138), ('Bucharest', 101)],
+        'Bucharest': [('Fagaras', 211), ('Pitesti', 101), ('Giurgiu', 90), ('Urziceni', 85)],
+        'Giurgiu': [('Bucharest', 90)],
+        'Urziceni': [('Bucharest', 85), ('Hirsova', 98), ('Vaslui', 142)],
+        'Hirsova': [('Urziceni', 98), ('Eforie', 86)],
+        'Eforie': [('Hirsova', 86)],
+        'Vaslui': [('Urziceni', 142), ('Iasi', 92)],
+        'Iasi': [('Vaslui', 92), ('Neamt', 87)],
+        'Neamt': [('Iasi', 87)]
+    }
+
+    compilado = GrafoCompilado.desde_diccionario(grafo_rumania)
+    distancias, padres = distancias_saltos(compilado, 'Arad')
+
+    print("=== Saltos desde Arad ===\n")
+    for i, nombre in enumerate(compilado.nombres):
+        padre = compilado.nombres[padres[i]] if padres[i] >= 0 else "-"
+        print(f"{nombre:<16} {distancias[i]:>3}   (padre: {padre})")
+
+    print("\n=== Arad → Bucharest ===\n")
+    print(busqueda_amplitud_vectorizada(ProblemaDeRuta(compilado, 'Arad', 'Bucharest')))
@@ -0,0 +1,93 @@
+"""
+Benchmark: Pertenencia a la frontera en BFS
+Descripción: Compara la BFS anterior, que buscaba cada sucesor en una lista construida
+a partir de la frontera, con la actual, que usa un mapa de bits de estados alcanzados.
+
+Uso:
+    python benchmarks/bench_amplitud_frontera.py [lado_maximo]
+"""
+
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from algoritmos_busqueda import Nodo, ProblemaDeRuta, ResultadoBusqueda, busqueda_amplitud
+from grafos_sinteticos import generar_cuadricula, nombre_celda
+
+
+def busqueda_amplitud_anterior(problema: ProblemaDeRuta) -> ResultadoBusqueda:
+    """BFS tal como estaba antes: la pertenencia a la frontera es lineal en su tamaño."""
+    nodo_inicial = Nodo(problema.estado_inicial)
+
+    if problema.es_objetivo(nodo_inicial.estado):
+        return ResultadoBusqueda(
+            encontrado=True,
+            camino=nodo_inicial.obtener_camino(),
+            costo_total=0,
+            nodos_expandidos=1
+        )
+
+    frontera = deque([nodo_inicial])
+    explorados = set()
+    nodos_expandidos = 0
+
+    while frontera:
+        nodo_actual = frontera.popleft()
+        explorados.add(nodo_actual.estado)
+        nodos_expandidos += 1
+
+        for estado_sucesor, accion, costo in problema.obtener_sucesores(nodo_actual.estado):
+            if estado_sucesor not in explorados and estado_sucesor not in [n.estado for n in frontera]:
+                nodo_sucesor = Nodo(
+                    estado=estado_sucesor,
+                    padre=nodo_actual,
+                    accion=accion,
+                    costo_camino=nodo_actual.costo_camino + costo
+                )
+
+                if problema.es_objetivo(nodo_sucesor.estado):
+                    return ResultadoBusqueda(
+                        encontrado=True,
+                        camino=nodo_sucesor.obtener_camino(),
+                        costo_total=nodo_sucesor.costo_camino,
+                        nodos_expandidos=nodos_expandidos,
+                        nodos_frontera=len(frontera)
+                    )
+
+                frontera.append(nodo_sucesor)
+
+    return ResultadoBusqueda(encontrado=False, nodos_expandidos=nodos_expandidos)
+
+
+def medir(funcion, problema: ProblemaDeRuta):
+    """Ejecuta la búsqueda y devuelve (resultado, segundos)."""
+    inicio = time.perf_counter()
+    resultado = funcion(problema)
+    return resultado, time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    lado_maximo = int(sys.argv[1]) if len(sys.argv) > 1 else 160
+
+    print("=== BFS: pertenencia a la frontera (cuadrícula, esquina a esquina) ===\n")
+    print(f"{'Nodos':>8} {'Antes (s)':>11} {'Después (s)':>12} {'Aceleración':>12}")
+
+    lado = 10
+    while lado <= lado_maximo:
+        grafo = generar_cuadricula(lado)
+        problema = ProblemaDeRuta(grafo, nombre_celda(0, 0), nombre_celda(lado - 1, lado - 1))
+        problema.grafo_compilado  # La compilación no forma parte de la medición
+
+        anterior, t_anterior = medir(busqueda_amplitud_anterior, problema)
+        actual, t_actual = medir(busqueda_amplitud, problema)
+
+        # Los contadores deben coincidir exactamente
+        assert (anterior.nodos_expandidos, anterior.nodos_frontera, anterior.camino) == \
+            (actual.nodos_expandidos, actual.nodos_frontera, actual.camino)
+
+        print(f"{lado * lado:>8} {t_anterior:>11.4f} {t_actual:>12.4f} {t_anterior / t_actual:>11.1f}x")
+        lado *= 2
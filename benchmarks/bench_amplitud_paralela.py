@@ -0,0 +1,47 @@
+"""
+Benchmark: BFS paralela
+Descripción: Mide cómo escala la BFS por niveles con 1, 2, 4 y 8 procesos sobre un grafo
+aleatorio de diámetro pequeño (niveles muy anchos) y comprueba que el resultado es
+idéntico al de la versión en serie.
+
+Uso:
+    python benchmarks/bench_amplitud_paralela.py [num_nodos] [grado]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from amplitud_paralela import AmplitudParalela
+from amplitud_vectorizada import distancias_saltos
+from grafos_sinteticos import generar_aleatorio_compilado
+
+
+if __name__ == "__main__":
+    num_nodos = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    grado = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+
+    grafo = generar_aleatorio_compilado(num_nodos, grado)
+
+    inicio = time.perf_counter()
+    distancias_serie, padres_serie = distancias_saltos(grafo, "0")
+    t_serie = time.perf_counter() - inicio
+
+    print(f"=== BFS paralela: {grafo.num_nodos} nodos, {grafo.num_aristas} aristas, "
+          f"{distancias_serie.max() + 1} niveles ({os.cpu_count()} CPUs) ===\n")
+    print(f"{'Procesos':>9} {'Tiempo (s)':>11} {'Aceleración':>12}")
+    print(f"{'serie':>9} {t_serie:>11.3f} {1:>11.2f}x")
+
+    for num_procesos in (1, 2, 4, 8):
+        # El arranque de los procesos y la copia del grafo no forman parte de la medición
+        with AmplitudParalela(grafo, num_procesos) as motor:
+            inicio = time.perf_counter()
+            distancias, padres = motor.distancias_saltos("0")
+            segundos = time.perf_counter() - inicio
+
+        assert (distancias == distancias_serie).all() and (padres == padres_serie).all()
+        print(f"{num_procesos:>9} {segundos:>11.3f} {t_serie / segundos:>11.2f}x")
@@ -0,0 +1,53 @@
+"""
+Benchmark: BFS vectorizada
+Descripción: Compara el recorrido completo de BFS (el objetivo no existe) con la versión
+nodo a nodo y con la versión por niveles de NumPy, sobre cuadrículas crecientes.
+
+Uso:
+    python benchmarks/bench_amplitud_vectorizada.py [lado_maximo]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from algoritmos_busqueda import ProblemaDeRuta, busqueda_amplitud
+from amplitud_vectorizada import busqueda_amplitud_vectorizada, distancias_saltos
+from grafos_sinteticos import generar_cuadricula, nombre_celda
+
+
+def medir(funcion, *args):
+    """Ejecuta la función y devuelve (resultado, segundos)."""
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    lado_maximo = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    print("=== BFS: recorrido completo de una cuadrícula ===\n")
+    print(f"{'Nodos':>9} {'Aristas':>9} {'Nodo a nodo (s)':>16} {'NumPy (s)':>10} {'Aceleración':>12}")
+
+    lado = 125
+    while lado <= lado_maximo:
+        grafo = generar_cuadricula(lado)
+        problema = ProblemaDeRuta(grafo, nombre_celda(0, 0), "inexistente")
+        compilado = problema.grafo_compilado  # La compilación no forma parte de la medición
+
+        secuencial, t_secuencial = medir(busqueda_amplitud, problema)
+        vectorizada, t_vectorizada = medir(busqueda_amplitud_vectorizada, problema)
+
+        # Ambas recorren todos los nodos alcanzables
+        assert secuencial.nodos_expandidos == vectorizada.nodos_expandidos == compilado.num_nodos
+
+        # La distancia a la esquina opuesta es la de Manhattan
+        distancias, _ = distancias_saltos(compilado, nombre_celda(0, 0))
+        assert distancias[compilado.indice(nombre_celda(lado - 1, lado - 1))] == 2 * (lado - 1)
+
+        print(f"{compilado.num_nodos:>9} {compilado.num_aristas:>9} {t_secuencial:>16.3f} "
+              f"{t_vectorizada:>10.3f} {t_secuencial / t_vectorizada:>11.1f}x")
+        lado *= 2
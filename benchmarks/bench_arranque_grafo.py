@@ -0,0 +1,79 @@
+"""
+Benchmark: Arranque en frío
+Descripción: Compara el tiempo hasta la primera respuesta partiendo de un grafo guardado
+como JSON (cargar el diccionario y compilarlo) y partiendo del formato binario abierto
+con ``GrafoCompilado.cargar`` (proyección en memoria, sin decodificar nombres).
+
+Uso:
+    python benchmarks/bench_arranque_grafo.py [num_nodos] [grado]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from algoritmos_busqueda import ProblemaDeRuta, busqueda_amplitud
+from convertir_grafo import convertir_diccionario
+from grafo_compilado import GrafoCompilado
+from grafos_sinteticos import generar_aleatorio_compilado
+
+
+def medir(funcion, *args):
+    """Ejecuta la función y devuelve (resultado, segundos)."""
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def cargar_json(ruta: str):
+    """Carga un grafo JSON {"nodo": [["vecino", costo], ...]} como diccionario de tuplas."""
+    with open(ruta, encoding='utf-8') as archivo:
+        return {
+            nodo: [(vecino, costo) for vecino, costo in vecinos]
+            for nodo, vecinos in json.load(archivo).items()
+        }
+
+
+if __name__ == "__main__":
+    num_nodos = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    grado = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    directorio = tempfile.mkdtemp()
+    ruta_json = os.path.join(directorio, "grafo.json")
+    ruta_binaria = os.path.join(directorio, "grafo.grf")
+
+    original = generar_aleatorio_compilado(num_nodos, grado)
+    with open(ruta_json, 'w', encoding='utf-8') as archivo:
+        json.dump(dict(original), archivo)
+    _, t_conversion = medir(convertir_diccionario, original, ruta_binaria)
+
+    consulta = ("0", str(num_nodos - 1))
+
+    # Arranque desde JSON: diccionario, compilación (en la primera búsqueda) y consulta
+    grafo, t_json = medir(cargar_json, ruta_json)
+    problema = ProblemaDeRuta(grafo, *consulta)
+    _, t_compilacion = medir(lambda: problema.grafo_compilado)
+    resultado_json, t_consulta_json = medir(busqueda_amplitud, problema)
+
+    # Arranque desde el formato binario: proyección del archivo y consulta
+    compilado, t_cargar = medir(GrafoCompilado.cargar, ruta_binaria)
+    resultado_binario, t_consulta_binaria = medir(busqueda_amplitud, ProblemaDeRuta(compilado, *consulta))
+
+    assert resultado_json.camino == resultado_binario.camino
+    assert compilado.huella() == original.huella()
+
+    print(f"=== Arranque en frío: {num_nodos} nodos, {num_nodos * grado} aristas ===\n")
+    print(f"JSON:    {os.path.getsize(ruta_json) / 2 ** 20:>8.1f} MiB")
+    print(f"Binario: {os.path.getsize(ruta_binaria) / 2 ** 20:>8.1f} MiB "
+          f"(conversión {t_conversion:.2f} s)\n")
+    print(f"{'Origen':<9} {'Carga (s)':>10} {'Compilación (s)':>16} {'1ª consulta (s)':>16} {'Total (s)':>10}")
+    print(f"{'JSON':<9} {t_json:>10.3f} {t_compilacion:>16.3f} {t_consulta_json:>16.3f} "
+          f"{t_json + t_compilacion + t_consulta_json:>10.3f}")
+    print(f"{'Binario':<9} {t_cargar:>10.3f} {'-':>16} {t_consulta_binaria:>16.3f} "
+          f"{t_cargar + t_consulta_binaria:>10.3f}")
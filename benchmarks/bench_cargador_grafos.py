@@ -0,0 +1,61 @@
+"""
+Benchmark: Carga de listas de aristas
+Descripción: Mide el rendimiento (aristas por segundo) de ``cargar_aristas`` con un archivo
+DIMACS y uno CSV generados a partir de un grafo aleatorio, y compara el pico de memoria
+(tracemalloc) con el tamaño del texto.
+
+Uso:
+    python benchmarks/bench_cargador_grafos.py [num_nodos] [grado]
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cargador_grafos import cargar_aristas
+from grafos_sinteticos import generar_aleatorio_compilado
+
+
+def escribir_aristas(grafo, ruta_dimacs: str, ruta_csv: str) -> None:
+    """Escribe las aristas del grafo en formato DIMACS (nodos 1..n) y CSV (nombres)."""
+    desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+
+    with open(ruta_dimacs, 'w') as dimacs, open(ruta_csv, 'w') as csv:
+        dimacs.write(f"c grafo aleatorio\np sp {grafo.num_nodos} {grafo.num_aristas}\n")
+        csv.write("origen,destino,costo\n")
+        for origen in range(grafo.num_nodos):
+            for k in range(desplazamientos[origen], desplazamientos[origen + 1]):
+                dimacs.write(f"a {origen + 1} {destinos[k] + 1} {costos[k]:.0f}\n")
+                csv.write(f"n{origen},n{destinos[k]},{costos[k]:.0f}\n")
+
+
+if __name__ == "__main__":
+    num_nodos = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    grado = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    directorio = tempfile.mkdtemp()
+    rutas = {"DIMACS": os.path.join(directorio, "grafo.gr"), "CSV": os.path.join(directorio, "grafo.csv")}
+    escribir_aristas(generar_aleatorio_compilado(num_nodos, grado), rutas["DIMACS"], rutas["CSV"])
+
+    print(f"=== Carga de {num_nodos * grado} aristas ({num_nodos} nodos) ===\n")
+    print(f"{'Formato':<8} {'Texto (MiB)':>12} {'Tiempo (s)':>11} {'Aristas/s':>12} "
+          f"{'Aristas únicas':>15} {'Pico (MiB)':>11}")
+
+    for formato, ruta in rutas.items():
+        grafo, estadisticas = cargar_aristas(ruta)
+
+        # El pico se mide en una segunda carga: tracemalloc ralentiza cada asignación
+        tracemalloc.start()
+        cargar_aristas(ruta)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert estadisticas.aristas_leidas == num_nodos * grado and grafo.num_nodos == num_nodos
+
+        print(f"{formato:<8} {os.path.getsize(ruta) / 2 ** 20:>12.1f} {estadisticas.segundos:>11.2f} "
+              f"{estadisticas.aristas_por_segundo:>12,.0f} {estadisticas.aristas:>15} {pico / 2 ** 20:>11.1f}")
@@ -0,0 +1,59 @@
+"""
+Benchmark: Fronteras de UCS
+Descripción: Compara el tiempo de la Búsqueda de Costo Uniforme con cada cola de
+prioridad de colas_prioridad.py sobre cuadrículas con costos enteros pequeños
+(de 1 a 10) y grandes (de 1 a 100 000), y muestra cuál elige el modo "auto".
+
+Uso:
+    python benchmarks/bench_colas_prioridad.py [lado] [num_consultas]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from algoritmos_busqueda import ProblemaDeRuta, busqueda_costo_uniforme
+from colas_prioridad import elegir_frontera
+from grafo_compilado import GrafoCompilado
+from grafos_sinteticos import generar_cuadricula_ponderada
+
+TIPOS = ("binario", "indexado", "dial", "radix")
+
+
+if __name__ == "__main__":
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 150
+    num_consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    for costo_maximo in (10, 100_000):
+        grafo = GrafoCompilado.desde_diccionario(
+            generar_cuadricula_ponderada(lado, costo_maximo=costo_maximo)
+        )
+        aleatorio = random.Random(0)
+        problemas = [
+            ProblemaDeRuta(grafo, aleatorio.choice(grafo.nombres), aleatorio.choice(grafo.nombres))
+            for _ in range(num_consultas)
+        ]
+
+        print(f"=== UCS en cuadrícula {lado}x{lado}, costos de 1 a {costo_maximo} "
+              f"(auto: {elegir_frontera(grafo)}) ===\n")
+        print(f"{'Frontera':<10} {'Tiempo (s)':>11} {'ms/consulta':>12} {'Frontera media':>15}")
+
+        referencia = None
+        for tipo in TIPOS:
+            inicio = time.perf_counter()
+            resultados = [busqueda_costo_uniforme(problema, frontera=tipo) for problema in problemas]
+            segundos = time.perf_counter() - inicio
+
+            # Todas las colas deben encontrar rutas del mismo costo (el óptimo)
+            costos = [(resultado.encontrado, resultado.costo_total) for resultado in resultados]
+            assert referencia in (None, costos)
+            referencia = costos
+
+            frontera_media = sum(r.nodos_frontera for r in resultados) / len(resultados)
+            print(f"{tipo:<10} {segundos:>11.3f} {1000 * segundos / num_consultas:>12.2f} "
+                  f"{frontera_media:>15.1f}")
+        print()
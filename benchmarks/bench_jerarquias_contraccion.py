@@ -0,0 +1,89 @@
+"""
+Benchmark: Jerarquías de Contracción
+Descripción: Verifica las consultas de la jerarquía contra la búsqueda de costo uniforme y mide
+el rendimiento (consultas por segundo) de ambas.
+
+La verificación comprueba, para cada consulta:
+    - que la jerarquía y busqueda_costo_uniforme coincidan en si existe solución y en su
+      costo, que es el mínimo;
+    - que el camino desempaquetado use aristas del grafo original y sume ese costo.
+
+Uso:
+    python benchmarks/bench_jerarquias_contraccion.py [lado] [num_consultas]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from algoritmos_busqueda import ProblemaDeRuta, busqueda_costo_uniforme
+from grafo_compilado import GrafoCompilado
+from grafos_sinteticos import generar_cuadricula_dirigida, generar_cuadricula_ponderada
+from jerarquias_contraccion import JerarquiaContraccion
+
+
+def costo_del_camino(grafo: GrafoCompilado, camino) -> float:
+    """Suma los costos de las aristas del camino; falla si alguna no existe en el grafo."""
+    total = 0.0
+    for (anterior, _), (actual, _) in zip(camino, camino[1:]):
+        total += min(costo for vecino, costo in grafo[anterior] if vecino == actual)
+    return total
+
+
+def verificar(grafo: GrafoCompilado, jerarquia: JerarquiaContraccion, consultas) -> None:
+    """Compara la jerarquía con busqueda_costo_uniforme."""
+    for origen, destino in consultas:
+        problema = ProblemaDeRuta(grafo, origen, destino)
+        ch = jerarquia.consultar(origen, destino)
+        ucs = busqueda_costo_uniforme(problema)
+
+        assert ch.encontrado == ucs.encontrado, (origen, destino)
+        if ch.encontrado:
+            assert ch.costo_total == ucs.costo_total, (origen, destino)
+            assert ch.camino[0] == (origen, "Inicio") and ch.camino[-1][0] == destino
+            assert costo_del_camino(grafo, ch.camino) == ch.costo_total, (origen, destino)
+
+
+def consultas_por_segundo(funcion, consultas) -> float:
+    """Ejecuta todas las consultas y devuelve el rendimiento obtenido."""
+    inicio = time.perf_counter()
+    for origen, destino in consultas:
+        funcion(origen, destino)
+    return len(consultas) / (time.perf_counter() - inicio)
+
+
+if __name__ == "__main__":
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    num_consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    casos = [
+        (f"cuadrícula {lado}x{lado}", generar_cuadricula_ponderada(lado)),
+        (f"cuadrícula dirigida {lado}x{lado}", generar_cuadricula_dirigida(lado)),
+    ]
+
+    for nombre, diccionario in casos:
+        grafo = GrafoCompilado.desde_diccionario(diccionario)
+
+        inicio = time.perf_counter()
+        jerarquia = JerarquiaContraccion.construir(grafo)
+        t_construccion = time.perf_counter() - inicio
+
+        generador = random.Random(1)
+        consultas = [tuple(generador.sample(grafo.nombres, 2)) for _ in range(num_consultas)]
+
+        verificar(grafo, jerarquia, consultas[:100])
+
+        qps_ch = consultas_por_segundo(jerarquia.consultar, consultas)
+        qps_ucs = consultas_por_segundo(
+            lambda o, d: busqueda_costo_uniforme(ProblemaDeRuta(grafo, o, d)), consultas
+        )
+
+        print(f"=== {nombre} ===")
+        print(f"Construcción: {t_construccion:.2f} s, {jerarquia.num_atajos} atajos")
+        print(f"Verificación contra UCS: {min(100, num_consultas)} consultas correctas")
+        print(f"UCS: {qps_ucs:10.0f} consultas/s ({1000 / qps_ucs:.3f} ms/consulta)")
+        print(f"CH:  {qps_ch:10.0f} consultas/s ({1000 / qps_ch:.3f} ms/consulta)\n")
@@ -0,0 +1,56 @@
+"""
+Benchmark: Heurística ALT
+Descripción: Compara los nodos expandidos y el tiempo de A* sin heurística (equivalente a
+Dijkstra) y con la heurística ALT sobre una cuadrícula con costos aleatorios.
+
+Uso:
+    python benchmarks/bench_landmarks_alt.py [lado] [num_consultas] [num_landmarks]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from algoritmos_busqueda import ProblemaDeRuta
+from busqueda_informada import busqueda_a_estrella
+from grafo_compilado import GrafoCompilado
+from grafos_sinteticos import generar_cuadricula_ponderada
+from landmarks_alt import PreprocesamientoALT
+
+
+if __name__ == "__main__":
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    num_consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    num_landmarks = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+
+    grafo = GrafoCompilado.desde_diccionario(generar_cuadricula_ponderada(lado))
+
+    inicio = time.perf_counter()
+    heuristica = PreprocesamientoALT.construir(grafo, num_landmarks).heuristica()
+    t_preprocesamiento = time.perf_counter() - inicio
+
+    generador = random.Random(1)
+    consultas = [tuple(generador.sample(grafo.nombres, 2)) for _ in range(num_consultas)]
+
+    totales = {"sin heurística": [0, 0.0], "ALT": [0, 0.0]}
+    for origen, destino in consultas:
+        problema = ProblemaDeRuta(grafo, origen, destino)
+        costos = []
+        for nombre, h in (("sin heurística", None), ("ALT", heuristica)):
+            inicio = time.perf_counter()
+            resultado = busqueda_a_estrella(problema, h)
+            totales[nombre][1] += time.perf_counter() - inicio
+            totales[nombre][0] += resultado.nodos_expandidos
+            costos.append(resultado.costo_total)
+        # La heurística es admisible: el costo debe ser el mismo
+        assert costos[0] == costos[1]
+
+    print(f"=== A* con ALT: cuadrícula {lado}x{lado}, {num_consultas} consultas, {num_landmarks} landmarks ===\n")
+    print(f"Preprocesamiento: {t_preprocesamiento:.2f} s\n")
+    print(f"{'Variante':<16} {'Expandidos/consulta':>20} {'ms/consulta':>12}")
+    for nombre, (expandidos, segundos) in totales.items():
+        print(f"{nombre:<16} {expandidos / num_consultas:>20.0f} {1000 * segundos / num_consultas:>12.2f}")
@@ -0,0 +1,171 @@
+"""
+Benchmark: Memoria del árbol de búsqueda
+Descripción: Compara el pico de memoria (tracemalloc) y el tiempo de BFS, DFS y UCS con
+nodos como objetos con ``__dict__`` (la representación anterior), con objetos ``Nodo`` con
+``__slots__`` y con la implementación actual de cada búsqueda (BFS y DFS guardan el árbol
+en un ``PoolNodos``; UCS guarda el mejor costo y el padre de cada estado en arreglos).
+
+Cada búsqueda recorre el grafo completo (el objetivo no existe), de modo que el tamaño
+del árbol depende solo del grafo.
+
+Uso:
+    python benchmarks/bench_memoria_nodos.py [lado]
+"""
+
+import heapq
+import sys
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from algoritmos_busqueda import (
+    Nodo, ProblemaDeRuta, busqueda_amplitud, busqueda_costo_uniforme, busqueda_profundidad,
+    preparar_busqueda
+)
+from grafos_sinteticos import generar_cuadricula_ponderada, nombre_celda
+
+
+class NodoConDict:
+    """Nodo tal como estaba antes: cada instancia lleva su propio ``__dict__``."""
+
+    def __init__(self, estado, padre=None, accion=None, costo_camino=0):
+        self.estado = estado
+        self.padre = padre
+        self.accion = accion
+        self.costo_camino = costo_camino
+        self.profundidad = 0 if padre is None else padre.profundidad + 1
+
+    def __lt__(self, otro):
+        return self.costo_camino < otro.costo_camino
+
+
+def amplitud_con_objetos(problema: ProblemaDeRuta, clase_nodo) -> int:
+    """BFS con un objeto por nodo generado; devuelve los nodos expandidos."""
+    grafo, inicial, _ = preparar_busqueda(problema)
+    desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+    frontera = deque([clase_nodo(inicial)])
+    alcanzados = bytearray(grafo.num_nodos)
+    alcanzados[inicial] = 1
+    nodos_expandidos = 0
+
+    while frontera:
+        nodo_actual = frontera.popleft()
+        actual = nodo_actual.estado
+        nodos_expandidos += 1
+
+        for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+            if not alcanzados[destinos[k]]:
+                alcanzados[destinos[k]] = 1
+                frontera.append(
+                    clase_nodo(destinos[k], nodo_actual, None, nodo_actual.costo_camino + costos[k])
+                )
+
+    return nodos_expandidos
+
+
+def profundidad_con_objetos(problema: ProblemaDeRuta, clase_nodo) -> int:
+    """DFS con un objeto por nodo generado; devuelve los nodos expandidos."""
+    grafo, inicial, _ = preparar_busqueda(problema)
+    desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+    frontera = [clase_nodo(inicial)]
+    explorados = bytearray(grafo.num_nodos)
+    nodos_expandidos = 0
+
+    while frontera:
+        nodo_actual = frontera.pop()
+        actual = nodo_actual.estado
+
+        if explorados[actual]:
+            continue
+
+        explorados[actual] = 1
+        nodos_expandidos += 1
+
+        for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+            if not explorados[destinos[k]]:
+                frontera.append(
+                    clase_nodo(destinos[k], nodo_actual, None, nodo_actual.costo_camino + costos[k])
+                )
+
+    return nodos_expandidos
+
+
+def costo_uniforme_con_objetos(problema: ProblemaDeRuta, clase_nodo) -> int:
+    """UCS con un objeto por nodo generado; devuelve los nodos expandidos."""
+    grafo, inicial, _ = preparar_busqueda(problema)
+    desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+    frontera = [clase_nodo(inicial)]
+    explorados = bytearray(grafo.num_nodos)
+    nodos_expandidos = 0
+
+    while frontera:
+        nodo_actual = heapq.heappop(frontera)
+        actual = nodo_actual.estado
+
+        if explorados[actual]:
+            continue
+
+        explorados[actual] = 1
+        nodos_expandidos += 1
+
+        for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+            if not explorados[destinos[k]]:
+                heapq.heappush(
+                    frontera,
+                    clase_nodo(destinos[k], nodo_actual, None, nodo_actual.costo_camino + costos[k])
+                )
+
+    return nodos_expandidos
+
+
+def medir(funcion, problema: ProblemaDeRuta):
+    """Devuelve (nodos expandidos, pico de memoria en bytes, segundos) de ``funcion(problema)``."""
+    # El tiempo se mide sin tracemalloc, que ralentiza mucho cada asignación
+    inicio = time.perf_counter()
+    funcion(problema)
+    segundos = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    expandidos = funcion(problema)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return expandidos, pico, segundos
+
+
+if __name__ == "__main__":
+    lado = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+    problema = ProblemaDeRuta(generar_cuadricula_ponderada(lado), nombre_celda(0, 0), "inexistente")
+    problema.grafo_compilado  # La compilación no forma parte de la medición
+
+    algoritmos = [
+        ("BFS", amplitud_con_objetos, busqueda_amplitud),
+        ("DFS", profundidad_con_objetos, busqueda_profundidad),
+        ("UCS", costo_uniforme_con_objetos, busqueda_costo_uniforme),
+    ]
+
+    print(f"=== Memoria del árbol de búsqueda ({lado * lado} nodos, recorrido completo) ===\n")
+    print(f"{'Algoritmo':<10} {'Variante':<20} {'Pico (MiB)':>11} {'Bytes/nodo':>11} {'Tiempo (s)':>11}")
+
+    for nombre, con_objetos, actual in algoritmos:
+        variantes = [
+            ("Nodo con __dict__", lambda p: con_objetos(p, NodoConDict)),
+            ("Nodo con __slots__", lambda p: con_objetos(p, Nodo)),
+            ("Actual", lambda p: actual(p).nodos_expandidos),
+        ]
+
+        expandidos_esperados = None
+        for variante, funcion in variantes:
+            expandidos, pico, segundos = medir(funcion, problema)
+
+            # Todas las variantes deben recorrer el mismo grafo completo
+            assert expandidos_esperados in (None, expandidos)
+            expandidos_esperados = expandidos
+
+            print(f"{nombre:<10} {variante:<20} {pico / 2 ** 20:>11.2f} "
+                  f"{pico / expandidos:>11.0f} {segundos:>11.3f}")
+        print()
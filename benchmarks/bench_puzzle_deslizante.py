@@ -0,0 +1,120 @@
+"""
+Benchmark: Puzzle deslizante
+Descripción: Mide BFS, DFS, UCS e IDDFS sobre el 8-puzzle y el 15-puzzle como problemas
+implícitos (ver espacio_estados.py), con los estados empaquetados en enteros
+(puzzle_deslizante.py) y, como referencia, con los estados como tuplas de fichas.
+
+Los 8-puzzles son configuraciones resolubles uniformes; los 15-puzzles se obtienen del
+objetivo con movimientos al azar, porque las búsquedas no informadas no resuelven uno
+uniforme. DFS solo se mide en el 8-puzzle, cuyo espacio (181 440 estados) puede recorrer
+entero. El pico de memoria (tracemalloc) se mide aparte, sobre el puzzle de solución
+más larga.
+
+Uso:
+    python benchmarks/bench_puzzle_deslizante.py [num_puzzles] [movimientos_15]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Tuple
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from algoritmos_busqueda import (
+    busqueda_amplitud, busqueda_costo_uniforme, busqueda_profundidad, busqueda_profundidad_iterativa
+)
+from espacio_estados import ProblemaImplicito
+from puzzle_deslizante import PuzzleDeslizante
+
+
+class PuzzleTuplas(ProblemaImplicito):
+    """El mismo puzzle con cada estado como tupla de fichas (un objeto de n elementos)."""
+
+    def __init__(self, puzzle: PuzzleDeslizante):
+        super().__init__(tuple(puzzle.decodificar(puzzle.estado_inicial)))
+        self.objetivo = tuple(puzzle.decodificar(puzzle.objetivo))
+        lado = puzzle.lado
+        self._vecinas = [
+            [hueco + df * lado + dc for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+             if 0 <= hueco // lado + df < lado and 0 <= hueco % lado + dc < lado]
+            for hueco in range(lado * lado)
+        ]
+
+    def sucesores(self, estado: Tuple[int, ...]) -> List[Tuple[Tuple[int, ...], float]]:
+        hueco = estado.index(0)
+        resultado = []
+        for vecina in self._vecinas[hueco]:
+            fichas = list(estado)
+            fichas[hueco], fichas[vecina] = fichas[vecina], 0
+            resultado.append((tuple(fichas), 1))
+        return resultado
+
+    def es_objetivo(self, estado: Tuple[int, ...]) -> bool:
+        return estado == self.objetivo
+
+
+def medir(funcion, puzzles: List[ProblemaImplicito]) -> Tuple[List[int], int, float]:
+    """Devuelve (longitud de cada solución, nodos expandidos, segundos) en total."""
+    longitudes, expandidos, segundos = [], 0, 0.0
+    for puzzle in puzzles:
+        inicio = time.perf_counter()
+        resultado = funcion(puzzle)
+        segundos += time.perf_counter() - inicio
+        longitudes.append(len(resultado.camino) - 1)
+        expandidos += resultado.nodos_expandidos
+    return longitudes, expandidos, segundos
+
+
+def pico_memoria(funcion, puzzle: ProblemaImplicito) -> int:
+    """Pico de memoria (tracemalloc) de ``funcion(puzzle)``, en bytes."""
+    tracemalloc.start()
+    funcion(puzzle)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return pico
+
+
+if __name__ == "__main__":
+    num_puzzles = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    movimientos_15 = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    conjuntos = [
+        ("8-puzzle", [PuzzleDeslizante.aleatorio(3, semilla) for semilla in range(num_puzzles)], True),
+        (f"15-puzzle ({movimientos_15} mov.)",
+         [PuzzleDeslizante.aleatorio(4, semilla, movimientos_15) for semilla in range(num_puzzles)], False),
+    ]
+    algoritmos = [
+        ("BFS", busqueda_amplitud),
+        ("DFS", busqueda_profundidad),
+        ("UCS", busqueda_costo_uniforme),
+        ("IDDFS", lambda p: busqueda_profundidad_iterativa(p, limite_maximo=40)),
+    ]
+
+    print(f"=== Puzzle deslizante ({num_puzzles} puzzles por conjunto) ===\n")
+    print(f"{'Conjunto':<22} {'Algoritmo':<10} {'Estados':<10} {'Expandidos':>11} "
+          f"{'Tiempo (s)':>11} {'Exp./s':>10} {'Pico (MiB)':>11}")
+
+    for conjunto, puzzles, con_dfs in conjuntos:
+        variantes = [("entero", puzzles), ("tupla", [PuzzleTuplas(puzzle) for puzzle in puzzles])]
+
+        for nombre, algoritmo in algoritmos:
+            if nombre == "DFS" and not con_dfs:
+                continue
+
+            longitudes_esperadas = None
+            for codificacion, problemas in variantes:
+                longitudes, expandidos, segundos = medir(algoritmo, problemas)
+                pico = pico_memoria(algoritmo, problemas[longitudes.index(max(longitudes))])
+
+                # Ambas codificaciones encuentran soluciones de la misma longitud
+                assert longitudes_esperadas in (None, longitudes)
+                longitudes_esperadas = longitudes
+
+                print(f"{conjunto:<22} {nombre:<10} {codificacion:<10} {expandidos:>11} "
+                      f"{segundos:>11.2f} {expandidos / segundos:>10.0f} {pico / 2 ** 20:>11.1f}")
+
+            print(f"{'':<22} {'':<10} {'pasos':<10} {', '.join(map(str, longitudes_esperadas))}")
+        print()
@@ -0,0 +1,371 @@
+"""
+Benchmark: Suite de búsqueda
+Descripción: Mide tiempo, nodos expandidos y pico de memoria de los algoritmos de
+algoritmos_busqueda.py (y de los motores alternativos) sobre cuatro familias de grafos
+sintéticos con semilla, de 10^2 a 10^6 nodos, y guarda cada ejecución en un historial JSON
+para compararla con una ejecución de referencia.
+
+Familias de grafos (ver grafos_sinteticos.py):
+
+- cuadricula: cuadrícula de 4 vecinos con un 25 % de celdas bloqueadas
+- geometrico: grafo geométrico aleatorio de grado medio 8
+- libre_escala: Barabási-Albert con m = 3
+- red_vial: red plana con avenidas rápidas, calles cortadas y diagonales
+
+Las consultas son deterministas: para cada grafo se eligen orígenes al azar (con la
+semilla) y, para cada uno, un destino al azar entre los nodos alcanzables desde él.
+
+El tiempo de cada consulta es el mínimo de ``--repeticiones`` ejecuciones. El pico de
+memoria (tracemalloc) se mide aparte, sobre la primera consulta, porque tracemalloc
+ralentiza cada asignación.
+
+Uso:
+    python benchmarks/bench_suite_busqueda.py [--tamanos 100,1000,10000] [--completo]
+        [--grafos ...] [--algoritmos ...] [--consultas N] [--repeticiones N]
+        [--historial ruta.json] [--comparar [ID]] [--fijar-base] [--umbral 0.15] [--minimo-ms 0.5]
+
+Ejemplos:
+    # Ejecución de referencia
+    python benchmarks/bench_suite_busqueda.py --fijar-base
+    # Tras un cambio: medir y comparar con la referencia (código de salida 1 si hay regresiones)
+    python benchmarks/bench_suite_busqueda.py --comparar
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from algoritmos_busqueda import (
+    ProblemaDeRuta, busqueda_amplitud, busqueda_amplitud_bidireccional, busqueda_costo_uniforme,
+    busqueda_costo_uniforme_bidireccional, busqueda_profundidad, busqueda_profundidad_iterativa
+)
+from amplitud_vectorizada import busqueda_amplitud_vectorizada, distancias_saltos
+from busqueda_informada import busqueda_a_estrella
+from grafo_compilado import GrafoCompilado
+from grafos_sinteticos import (
+    generar_cuadricula_obstaculos, generar_geometrico_aleatorio, generar_libre_escala, generar_red_vial
+)
+from metricas_busqueda import medir_busqueda
+
+HISTORIAL = Path(__file__).resolve().parent / "historial_busqueda.json"
+TAMANOS = (100, 1_000, 10_000, 100_000)
+TAMANOS_COMPLETOS = TAMANOS + (1_000_000,)
+
+# Familia -> función (num_nodos, semilla) -> GrafoCompilado
+GRAFOS: Dict[str, Callable[[int, int], GrafoCompilado]] = {
+    "cuadricula": lambda n, semilla: generar_cuadricula_obstaculos(round(n ** 0.5), 0.25, semilla),
+    "geometrico": lambda n, semilla: generar_geometrico_aleatorio(n, 8, semilla),
+    "libre_escala": lambda n, semilla: generar_libre_escala(n, 3, semilla),
+    "red_vial": lambda n, semilla: generar_red_vial(n, semilla),
+}
+
+
+class Consulta:
+    """Una consulta del conjunto estándar: origen, destino y su distancia en saltos."""
+
+    def __init__(self, origen: str, destino: str, saltos: int):
+        self.origen = origen
+        self.destino = destino
+        self.saltos = saltos
+
+
+# Algoritmo -> (función, parámetros según la consulta, número máximo de nodos del grafo).
+# IDDFS recibe como límite la distancia en saltos de la consulta y solo se mide en grafos
+# pequeños: en una cuadrícula su costo crece con el producto de profundidad y nodos.
+ALGORITMOS: Dict[str, Tuple[Callable, Callable[[Consulta], Dict[str, Any]], Optional[int]]] = {
+    "bfs": (busqueda_amplitud, lambda consulta: {}, None),
+    "dfs": (busqueda_profundidad, lambda consulta: {}, None),
+    "ucs": (busqueda_costo_uniforme, lambda consulta: {}, None),
+    "iddfs": (busqueda_profundidad_iterativa, lambda consulta: {"limite_maximo": consulta.saltos}, 2_000),
+    "bfs_bidireccional": (busqueda_amplitud_bidireccional, lambda consulta: {}, None),
+    "ucs_bidireccional": (busqueda_costo_uniforme_bidireccional, lambda consulta: {}, None),
+    "a_estrella": (busqueda_a_estrella, lambda consulta: {}, None),
+    "bfs_vectorizada": (busqueda_amplitud_vectorizada, lambda consulta: {}, None),
+}
+
+
+def generar_consultas(grafo: GrafoCompilado, num_consultas: int, semilla: int) -> List[Consulta]:
+    """
+    Elige consultas deterministas con destino alcanzable.
+
+    Args:
+        grafo: El grafo compilado
+        num_consultas: Número de consultas
+        semilla: Semilla del generador aleatorio
+
+    Returns:
+        List[Consulta]: Las consultas (los orígenes aislados se descartan y se elige otro)
+    """
+    generador = random.Random(semilla)
+    consultas = []
+
+    while len(consultas) < num_consultas:
+        origen = generador.randrange(grafo.num_nodos)
+        distancias, _ = distancias_saltos(grafo, grafo.nombres[origen])
+        alcanzables = (distancias > 0).nonzero()[0]
+        if len(alcanzables) == 0:
+            continue
+        destino = int(alcanzables[generador.randrange(len(alcanzables))])
+        consultas.append(Consulta(grafo.nombres[origen], grafo.nombres[destino], int(distancias[destino])))
+
+    return consultas
+
+
+def medir_algoritmo(
+    grafo: GrafoCompilado,
+    consultas: List[Consulta],
+    algoritmo: Callable,
+    parametros: Callable[[Consulta], Dict[str, Any]],
+    repeticiones: int,
+    memoria: bool
+) -> Dict[str, Any]:
+    """
+    Ejecuta un algoritmo sobre todas las consultas.
+
+    Returns:
+        Dict: Tiempo total y medio por consulta, expandidos medios, costo total de las
+        soluciones (para detectar cambios de comportamiento) y pico de memoria
+    """
+    segundos = 0.0
+    expandidos = 0
+    costo_total = 0.0
+
+    for consulta in consultas:
+        mejor = float("inf")
+        for _ in range(repeticiones):
+            problema = ProblemaDeRuta(grafo, consulta.origen, consulta.destino)
+            inicio = time.perf_counter()
+            resultado = algoritmo(problema, **parametros(consulta))
+            mejor = min(mejor, time.perf_counter() - inicio)
+        segundos += mejor
+        expandidos += resultado.nodos_expandidos
+        costo_total += resultado.costo_total
+
+    pico = None
+    if memoria:
+        consulta = consultas[0]
+        pico = medir_busqueda(
+            algoritmo, ProblemaDeRuta(grafo, consulta.origen, consulta.destino),
+            memoria=True, **parametros(consulta)
+        ).metricas.pico_memoria
+
+    return {
+        "segundos": segundos,
+        "ms_por_consulta": 1000 * segundos / len(consultas),
+        "expandidos_por_consulta": expandidos / len(consultas),
+        "costo_total": round(costo_total, 6),
+        "pico_memoria": pico,
+    }
+
+
+def ejecutar(
+    tamanos: List[int],
+    grafos: List[str],
+    algoritmos: List[str],
+    num_consultas: int,
+    repeticiones: int,
+    semilla: int,
+    memoria: bool
+) -> List[Dict[str, Any]]:
+    """
+    Ejecuta la suite e imprime cada medición a medida que se obtiene.
+
+    Returns:
+        List[Dict]: Un registro por (grafo, tamaño, algoritmo)
+    """
+    resultados = []
+    print(f"{'Grafo':<13} {'Nodos':>9} {'Aristas':>10} {'Algoritmo':<18} {'ms/consulta':>12} "
+          f"{'Expandidos':>11} {'Pico (KiB)':>11}")
+
+    for familia in grafos:
+        for tamano in tamanos:
+            grafo = GRAFOS[familia](tamano, semilla)
+            consultas = generar_consultas(grafo, num_consultas, semilla)
+
+            for nombre in algoritmos:
+                algoritmo, parametros, max_nodos = ALGORITMOS[nombre]
+                if max_nodos is not None and grafo.num_nodos > max_nodos:
+                    continue
+
+                medicion = medir_algoritmo(grafo, consultas, algoritmo, parametros, repeticiones, memoria)
+                registro = {
+                    "grafo": familia, "tamano": tamano, "nodos": grafo.num_nodos,
+                    "aristas": grafo.num_aristas, "algoritmo": nombre, "consultas": num_consultas,
+                    **medicion
+                }
+                resultados.append(registro)
+
+                pico = f"{medicion['pico_memoria'] / 1024:>11.0f}" if medicion["pico_memoria"] is not None else f"{'-':>11}"
+                print(f"{familia:<13} {grafo.num_nodos:>9} {grafo.num_aristas:>10} {nombre:<18} "
+                      f"{medicion['ms_por_consulta']:>12.3f} {medicion['expandidos_por_consulta']:>11.0f} {pico}",
+                      flush=True)
+
+    return resultados
+
+
+def cargar_historial(ruta: Path) -> Dict[str, Any]:
+    """Lee el historial ({"base": id o None, "ejecuciones": [...]}); vacío si no existe."""
+    if not ruta.exists():
+        return {"base": None, "ejecuciones": []}
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+def guardar_historial(ruta: Path, historial: Dict[str, Any]) -> None:
+    """Escribe el historial de forma atómica (archivo temporal y reemplazo)."""
+    temporal = ruta.with_suffix(ruta.suffix + ".tmp")
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        json.dump(historial, archivo, indent=1, ensure_ascii=False)
+    os.replace(temporal, ruta)
+
+
+def commit_actual() -> Optional[str]:
+    """Commit de git del árbol medido (None fuera de un repositorio)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).resolve().parent,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparar(
+    base: Dict[str, Any],
+    actual: Dict[str, Any],
+    umbral: float,
+    minimo_ms: float = 0.5
+) -> List[str]:
+    """
+    Compara dos ejecuciones e imprime la tabla de cambios.
+
+    Una medición es una regresión si su tiempo por consulta crece más que ``umbral``
+    (fracción) y supera ``minimo_ms``, por debajo del cual domina el ruido. Un cambio en
+    los expandidos o en el costo de las soluciones se informa como cambio de
+    comportamiento, porque las consultas son deterministas.
+
+    Args:
+        base: La ejecución de referencia
+        actual: La ejecución nueva
+        umbral: Aumento relativo de tiempo tolerado
+        minimo_ms: Tiempo por consulta por debajo del cual no se informan regresiones
+
+    Returns:
+        List[str]: Descripción de cada regresión
+    """
+    clave = lambda registro: (registro["grafo"], registro["tamano"], registro["algoritmo"])
+    anteriores = {clave(registro): registro for registro in base["resultados"]}
+    regresiones = []
+
+    print(f"\n=== Comparación con {base['id']} (commit {base.get('commit')}) ===\n")
+    print(f"{'Grafo':<13} {'Tamaño':>9} {'Algoritmo':<18} {'Base (ms)':>10} {'Actual (ms)':>12} {'Cambio':>8}  Notas")
+
+    for registro in actual["resultados"]:
+        anterior = anteriores.get(clave(registro))
+        if anterior is None:
+            continue
+
+        antes, ahora = anterior["ms_por_consulta"], registro["ms_por_consulta"]
+        cambio = ahora / antes - 1 if antes else 0.0
+        notas = []
+
+        if cambio > umbral and ahora > minimo_ms:
+            notas.append("REGRESIÓN")
+            regresiones.append(f"{registro['grafo']} {registro['tamano']} {registro['algoritmo']}: {cambio:+.0%}")
+        elif cambio < -umbral and antes > minimo_ms:
+            notas.append("mejora")
+
+        if (anterior["expandidos_por_consulta"], anterior["costo_total"]) != (
+            registro["expandidos_por_consulta"], registro["costo_total"]
+        ):
+            notas.append("cambio de comportamiento (expandidos o costos)")
+
+        print(f"{registro['grafo']:<13} {registro['tamano']:>9} {registro['algoritmo']:<18} {antes:>10.3f} "
+              f"{ahora:>12.3f} {cambio:>+8.0%}  {', '.join(notas)}")
+
+    return regresiones
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """Punto de entrada; devuelve 1 si la comparación encuentra regresiones."""
+    lista = lambda texto: [parte for parte in texto.split(",") if parte]
+    analizador = argparse.ArgumentParser(description="Suite de benchmarks de los algoritmos de búsqueda")
+    analizador.add_argument("--tamanos", type=lambda texto: [int(parte) for parte in lista(texto)],
+                            default=list(TAMANOS), help="Tamaños (número de nodos) separados por comas")
+    analizador.add_argument("--completo", action="store_true", help="Incluir grafos de 10^6 nodos")
+    analizador.add_argument("--grafos", type=lista, default=list(GRAFOS), help="Familias de grafos")
+    analizador.add_argument("--algoritmos", type=lista, default=list(ALGORITMOS), help="Algoritmos a medir")
+    analizador.add_argument("--consultas", type=int, default=10, help="Consultas por grafo")
+    analizador.add_argument("--repeticiones", type=int, default=3, help="Ejecuciones por consulta (se usa la mínima)")
+    analizador.add_argument("--semilla", type=int, default=0)
+    analizador.add_argument("--sin-memoria", action="store_true", help="No medir el pico de memoria")
+    analizador.add_argument("--historial", type=Path, default=HISTORIAL, help="Archivo JSON del historial")
+    analizador.add_argument("--no-guardar", action="store_true", help="No agregar la ejecución al historial")
+    analizador.add_argument("--fijar-base", action="store_true", help="Usar esta ejecución como referencia")
+    analizador.add_argument("--comparar", nargs="?", const="base", default=None, metavar="ID",
+                            help="Comparar con la ejecución ID (por defecto, la referencia o la anterior)")
+    analizador.add_argument("--umbral", type=float, default=0.15, help="Aumento de tiempo tolerado (fracción)")
+    analizador.add_argument("--minimo-ms", type=float, default=0.5,
+                            help="Tiempo por consulta por debajo del cual no se informan regresiones")
+    opciones = analizador.parse_args(argumentos)
+
+    desconocidos = set(opciones.grafos) - set(GRAFOS) | set(opciones.algoritmos) - set(ALGORITMOS)
+    if desconocidos:
+        analizador.error(f"grafos o algoritmos desconocidos: {', '.join(sorted(desconocidos))}")
+
+    tamanos = list(TAMANOS_COMPLETOS) if opciones.completo else opciones.tamanos
+    historial = cargar_historial(opciones.historial)
+
+    print(f"=== Suite de búsqueda: {opciones.consultas} consultas por grafo, semilla {opciones.semilla} ===\n")
+    ejecucion = {
+        "id": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit_actual(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "parametros": {
+            "tamanos": tamanos, "grafos": opciones.grafos, "algoritmos": opciones.algoritmos,
+            "consultas": opciones.consultas, "repeticiones": opciones.repeticiones, "semilla": opciones.semilla
+        },
+        "resultados": ejecutar(
+            tamanos, opciones.grafos, opciones.algoritmos, opciones.consultas,
+            opciones.repeticiones, opciones.semilla, not opciones.sin_memoria
+        ),
+    }
+
+    regresiones = []
+    if opciones.comparar is not None:
+        ejecuciones = {anterior["id"]: anterior for anterior in historial["ejecuciones"]}
+        if opciones.comparar != "base":
+            base = ejecuciones.get(opciones.comparar)
+        else:
+            base = ejecuciones.get(historial["base"]) or (historial["ejecuciones"] or [None])[-1]
+
+        if base is None:
+            print(f"\nNo hay una ejecución de referencia en {opciones.historial}")
+        else:
+            regresiones = comparar(base, ejecucion, opciones.umbral, opciones.minimo_ms)
+            print(f"\n{len(regresiones)} regresiones" + "".join(f"\n  {texto}" for texto in regresiones))
+
+    if not opciones.no_guardar:
+        historial["ejecuciones"].append(ejecucion)
+        if opciones.fijar_base:
+            historial["base"] = ejecucion["id"]
+        guardar_historial(opciones.historial, historial)
+        print(f"\nEjecución {ejecucion['id']} guardada en {opciones.historial}")
+
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""
+Módulo: Grafos Sintéticos
+Descripción: Generadores de grafos en formato diccionario (y, para los tamaños que no
+caben cómodamente en un diccionario, directamente compilados) para los benchmarks.
+"""
+
+import math
+import random
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# Agregar directorio raíz al path para importar módulos
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from grafo_compilado import GrafoCompilado
+
+
+def nombre_celda(fila: int, columna: int) -> str:
+    """Nombre del nodo que representa la celda (fila, columna) de una cuadrícula."""
+    return f"{fila},{columna}"
+
+
+def generar_cuadricula(lado: int) -> Dict[str, List[Tuple[str, float]]]:
+    """
+    Genera una cuadrícula de lado x lado con conexiones a los 4 vecinos y costo 1.
+
+    Args:
+        lado: Número de filas (y de columnas) de la cuadrícula
+
+    Returns:
+        Dict: Grafo {nodo: [(vecino, costo), ...]}
+    """
+    grafo = {}
+
+    for fila in range(lado):
+        for columna in range(lado):
+            vecinos = []
+            for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                f, c = fila + df, columna + dc
+                if 0 <= f < lado and 0 <= c < lado:
+                    vecinos.append((nombre_celda(f, c), 1))
+            grafo[nombre_celda(fila, columna)] = vecinos
+
+    return grafo
+
+
+def generar_cuadricula_ponderada(lado: int, semilla: int = 0, costo_maximo: int = 10) -> Dict[str, List[Tuple[str, float]]]:
+    """
+    Genera una cuadrícula de lado x lado con costos enteros aleatorios y simétricos.
+
+    Args:
+        lado: Número de filas (y de columnas) de la cuadrícula
+        semilla: Semilla del generador aleatorio
+        costo_maximo: Costo máximo de una arista (el mínimo es 1)
+
+    Returns:
+        Dict: Grafo {nodo: [(vecino, costo), ...]}
+    """
+    generador = random.Random(semilla)
+    grafo = {nombre_celda(f, c): [] for f in range(lado) for c in range(lado)}
+
+    for fila in range(lado):
+        for columna in range(lado):
+            for f, c in ((fila + 1, columna), (fila, columna + 1)):
+                if f < lado and c < lado:
+                    costo = generador.randint(1, costo_maximo)
+                    grafo[nombre_celda(fila, columna)].append((nombre_celda(f, c), costo))
+                    grafo[nombre_celda(f, c)].append((nombre_celda(fila, columna), costo))
+
+    return grafo
+
+
+def generar_cuadricula_dirigida(
+    lado: int,
+    semilla: int = 0,
+    costo_maximo: int = 10,
+    prob_sentido_unico: float = 0.2
+) -> Dict[str, List[Tuple[str, float]]]:
+    """
+    Genera una cuadrícula con aristas no simétricas, parecida a una red de calles:
+    cada sentido de una conexión tiene su propio costo y una fracción de las
+    conexiones es de sentido único.
+
+    Args:
+        lado: Número de filas (y de columnas) de la cuadrícula
+        semilla: Semilla del generador aleatorio
+        costo_maximo: Costo máximo de una arista (el mínimo es 1)
+        prob_sentido_unico: Probabilidad de que una conexión tenga un solo sentido
+
+    Returns:
+        Dict: Grafo {nodo: [(vecino, costo), ...]}
+    """
+    generador = random.Random(semilla)
+    grafo = {nombre_celda(f, c): [] for f in range(lado) for c in range(lado)}
+
+    for fila in range(lado):
+        for columna in range(lado):
+            for f, c in ((fila + 1, columna), (fila, columna + 1)):
+                if f < lado and c < lado:
+                    a, b = nombre_celda(fila, columna), nombre_celda(f, c)
+                    if generador.random() < 0.5:
+                        a, b = b, a
+                    grafo[a].append((b, generador.randint(1, costo_maximo)))
+                    if generador.random() >= prob_sentido_unico:
+                        grafo[b].append((a, generador.randint(1, costo_maximo)))
+
+    return grafo
+
+
+def generar_aleatorio_compilado(num_nodos: int, grado: int = 8, semilla: int = 0) -> GrafoCompilado:
+    """
+    Genera un grafo dirigido aleatorio de grado de salida fijo, ya compilado.
+
+    Su diámetro es logarítmico, así que los niveles de una BFS son muy anchos.
+
+    Args:
+        num_nodos: Número de nodos (se llaman "0", "1", ...)
+        grado: Número de aristas que salen de cada nodo (destinos uniformes)
+        semilla: Semilla del generador aleatorio
+
+    Returns:
+        GrafoCompilado: El grafo, con costos enteros entre 1 y 10
+    """
+    generador = np.random.default_rng(semilla)
+    num_aristas = num_nodos * grado
+
+    desplazamientos = array('q', range(0, num_aristas + 1, grado))
+    destinos = array('i', generador.integers(0, num_nodos, num_aristas, dtype=np.int32).tobytes())
+    costos = array('d', generador.integers(1, 11, num_aristas).astype(np.float64).tobytes())
+
+    return GrafoCompilado([str(i) for i in range(num_nodos)], desplazamientos, destinos, costos)
+
+
+def generar_cuadricula_obstaculos(lado: int, densidad: float = 0.25, semilla: int = 0) -> GrafoCompilado:
+    """
+    Genera una cuadrícula de lado x lado con 4 vecinos y celdas bloqueadas al azar, ya compilada.
+
+    Solo las celdas libres son nodos; con densidades cercanas a 0.4 la cuadrícula se
+    fragmenta en muchas componentes.
+
+    Args:
+        lado: Número de filas (y de columnas) de la cuadrícula
+        densidad: Probabilidad de que una celda esté bloqueada
+        semilla: Semilla del generador aleatorio
+
+    Returns:
+        GrafoCompilado: El grafo no dirigido, con costo 1 y nodos llamados "fila,columna"
+    """
+    generador = np.random.default_rng(semilla)
+    libres = (generador.random((lado, lado)) >= densidad)
+    ids = np.cumsum(libres).reshape(lado, lado).astype(np.int32) - 1
+
+    horizontales = libres[:, :-1] & libres[:, 1:]
+    verticales = libres[:-1, :] & libres[1:, :]
+    origenes = np.concatenate((ids[:, :-1][horizontales], ids[:-1, :][verticales]))
+    destinos = np.concatenate((ids[:, 1:][horizontales], ids[1:, :][verticales]))
+
+    filas, columnas = np.nonzero(libres)
+    nombres = [nombre_celda(f, c) for f, c in zip(filas.tolist(), columnas.tolist())]
+
+    return GrafoCompilado.desde_aristas(
+        nombres, origenes, destinos, np.ones(len(origenes)), deduplicar=False, simetrizar=True
+    )
+
+
+def generar_geometrico_aleatorio(num_nodos: int, grado: float = 8, semilla: int = 0) -> GrafoCompilado:
+    """
+    Genera un grafo geométrico aleatorio, ya compilado.
+
+    Los nodos son puntos uniformes en el cuadrado unidad y se unen los pares a distancia
+    menor que un radio elegido para que el grado medio sea ``grado``. Los pares se buscan
+    por celdas de lado igual al radio, comparando cada celda con ella misma y con 4 vecinas.
+
+    Args:
+        num_nodos: Número de nodos (se llaman "0", "1", ...)
+        grado: Grado medio esperado
+        semilla: Semilla del generador aleatorio
+
+    Returns:
+        GrafoCompilado: El grafo no dirigido, con la distancia euclídea (x 1000) como costo
+    """
+    generador = np.random.default_rng(semilla)
+    puntos = generador.random((num_nodos, 2))
+    radio = math.sqrt(grado / (math.pi * num_nodos))
+    celdas_por_lado = max(int(1 / radio), 1)
+
+    # Puntos ordenados por celda, con el rango de cada celda en el orden
+    celda_xy = np.minimum((puntos * celdas_por_lado).astype(np.int64), celdas_por_lado - 1)
+    celda = celda_xy[:, 0] * celdas_por_lado + celda_xy[:, 1]
+    orden = np.argsort(celda, kind='stable').astype(np.int32)
+    inicios = np.searchsorted(celda[orden], np.arange(celdas_por_lado ** 2 + 1))
+
+    origenes, destinos, costos = [], [], []
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        vecina_x, vecina_y = celda_xy[:, 0] + dx, celda_xy[:, 1] + dy
+        valida = (vecina_x < celdas_por_lado) & (vecina_y >= 0) & (vecina_y < celdas_por_lado)
+        puntos_validos = np.nonzero(valida)[0]
+        vecina = vecina_x[valida] * celdas_por_lado + vecina_y[valida]
+        cantidades = inicios[vecina + 1] - inicios[vecina]
+
+        # Todos los pares (punto, punto de la celda vecina)
+        a = np.repeat(puntos_validos, cantidades)
+        b = orden[np.repeat(inicios[vecina] - (np.cumsum(cantidades) - cantidades), cantidades)
+                  + np.arange(int(cantidades.sum()))]
+        distancias = np.hypot(*(puntos[a] - puntos[b]).T)
+        elegidos = (distancias < radio) & ((a < b) if (dx, dy) == (0, 0) else True)
+
+        origenes.append(a[elegidos])
+        destinos.append(b[elegidos])
+        costos.append(np.round(distancias[elegidos] * 1000, 3))
+
+    return GrafoCompilado.desde_aristas(
+        [str(i) for i in range(num_nodos)], np.concatenate(origenes), np.concatenate(destinos),
+        np.concatenate(costos), deduplicar=False, simetrizar=True
+    )
+
+
+def generar_libre_escala(num_nodos: int, m: int = 3, semilla: int = 0) -> GrafoCompilado:
+    """
+    Genera un grafo libre de escala (Barabási-Albert), ya compilado.
+
+    Cada nodo nuevo se une a ``m`` nodos elegidos con probabilidad proporcional a su grado.
+    Se usa el método de Batagelj y Brandes: el destino de la arista k es el extremo de una
+    posición uniforme entre las 2k anteriores de la lista de extremos, y las posiciones
+    impares (destinos de aristas anteriores) se resuelven saltando de puntero en puntero.
+
+    Args:
+        num_nodos: Número de nodos (se llaman "0", "1", ...)
+        m: Aristas que aporta cada nodo
+        semilla: Semilla del generador aleatorio
+
+    Returns:
+        GrafoCompilado: El grafo no dirigido (sin lazos ni aristas repetidas), con costos
+        enteros entre 1 y 10
+    """
+    generador = np.random.default_rng(semilla)
+    num_aristas = num_nodos * m
+    k = np.arange(num_aristas, dtype=np.int64)
+    posiciones = (generador.random(num_aristas) * 2 * k).astype(np.int64)
+
+    origenes = (k // m).astype(np.int32)
+    # Posición par 2j: el origen de la arista j; impar 2j + 1: el destino de la arista j
+    destinos = np.where(posiciones % 2 == 0, posiciones // 2 // m, -1)
+    punteros = np.where(posiciones % 2 == 1, posiciones // 2, k)
+    pendientes = np.nonzero(destinos < 0)[0]
+
+    while len(pendientes):
+        destinos[pendientes] = destinos[punteros[pendientes]]
+        punteros[pendientes] = punteros[punteros[pendientes]]
+        pendientes = pendientes[destinos[pendientes] < 0]
+
+    distintos = origenes != destinos
+    costos = generador.integers(1, 11, num_aristas).astype(np.float64)
+
+    return GrafoCompilado.desde_aristas(
+        [str(i) for i in range(num_nodos)], origenes[distintos], destinos[distintos].astype(np.int32),
+        costos[distintos], simetrizar=True
+    )
+
+
+def generar_red_vial(num_nodos: int, semilla: int = 0, prob_calle: float = 0.85) -> GrafoCompilado:
+    """
+    Genera un grafo plano parecido a una red de carreteras, ya compilado.
+
+    Los nodos son los cruces de una cuadrícula con posiciones perturbadas; cada tramo entre
+    cruces vecinos existe con probabilidad ``prob_calle``, salvo en las avenidas (una de
+    cada 8 filas y columnas), que son continuas y tres veces más rápidas. Algunas manzanas
+    tienen una diagonal (como mucho una, así que el grafo sigue siendo plano). El costo de
+    un tramo es su tiempo de recorrido: longitud / velocidad.
+
+    Args:
+        num_nodos: Número aproximado de nodos (se usa el cuadrado perfecto más cercano)
+        semilla: Semilla del generador aleatorio
+        prob_calle: Probabilidad de que exista un tramo de calle (fuera de las avenidas)
+
+    Returns:
+        GrafoCompilado: El grafo no dirigido, con nodos llamados "0", "1", ...
+    """
+    generador = np.random.default_rng(semilla)
+    lado = max(int(round(math.sqrt(num_nodos))), 2)
+    ids = np.arange(lado * lado, dtype=np.int32).reshape(lado, lado)
+    filas, columnas = np.divmod(np.arange(lado * lado), lado)
+    posiciones = np.stack((filas, columnas), axis=1) + generador.uniform(-0.3, 0.3, (lado * lado, 2))
+    avenida_fila, avenida_columna = (np.arange(lado) % 8 == 0), (np.arange(lado) % 8 == 0)
+
+    # Tramos horizontales (a lo largo de una fila) y verticales (a lo largo de una columna)
+    rapida_h = np.broadcast_to(avenida_fila[:, None], (lado, lado - 1))
+    rapida_v = np.broadcast_to(avenida_columna[None, :], (lado - 1, lado))
+    existe_h = rapida_h | (generador.random((lado, lado - 1)) < prob_calle)
+    existe_v = rapida_v | (generador.random((lado - 1, lado)) < prob_calle)
+
+    # Una diagonal en el 5 % de las manzanas, en una de las dos orientaciones
+    diagonal = generador.random((lado - 1, lado - 1)) < 0.05
+    descendente = generador.random((lado - 1, lado - 1)) < 0.5
+    origen_d = np.where(descendente, ids[:-1, :-1], ids[:-1, 1:])[diagonal]
+    destino_d = np.where(descendente, ids[1:, 1:], ids[1:, :-1])[diagonal]
+
+    origenes = np.concatenate((ids[:, :-1][existe_h], ids[:-1, :][existe_v], origen_d))
+    destinos = np.concatenate((ids[:, 1:][existe_h], ids[1:, :][existe_v], destino_d))
+    velocidades = np.concatenate((
+        np.where(rapida_h[existe_h], 3.0, 1.0), np.where(rapida_v[existe_v], 3.0, 1.0), np.ones(len(origen_d))
+    ))
+    longitudes = np.hypot(*(posiciones[origenes] - posiciones[destinos]).T)
+
+    return GrafoCompilado.desde_aristas(
+        [str(i) for i in range(lado * lado)], origenes, destinos, np.round(100 * longitudes / velocidades, 2),
+        deduplicar=False, simetrizar=True
+    )
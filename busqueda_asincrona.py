@@ -0,0 +1,302 @@
+"""
+Módulo: Búsqueda Asíncrona
+Descripción: Variantes asyncio de las funciones de búsqueda, para usarlas desde un servicio
+asíncrono sin bloquear el bucle de eventos. Devuelven los mismos ResultadoBusqueda que
+las versiones síncronas.
+
+Hay dos modos:
+
+- En un ejecutor (``buscar_en_ejecutor``): la búsqueda corre en un ThreadPoolExecutor (por
+  defecto, el del bucle) o en un ProcessPoolExecutor. Con hilos, el GIL mantiene el bucle
+  respondiendo pero las búsquedas no corren en paralelo; para repartirlas entre núcleos
+  hace falta un ProcessPoolExecutor, al que el problema viaja serializado (para grafos
+  grandes conviene grafo_compartido.py). Si la tarea se cancela (``task.cancel()``,
+  ``asyncio.wait_for``), una búsqueda en un hilo se detiene en su próxima revisión de
+  presupuesto (ver presupuesto_busqueda.py); en un proceso, la búsqueda ya iniciada
+  termina y su resultado se descarta.
+- Cooperativo (``buscar_cooperativo``): el bucle recorre la traza de la búsqueda (ver
+  traza_busqueda.py) y se cede el control cada ``cada`` expansiones. La búsqueda corre en
+  el hilo de la traza, que solo se adelanta un par de lotes de eventos a la corrutina,
+  así que avanza al ritmo que el bucle le deja; recorrer la traza la hace unas 2 veces
+  más lenta.
+
+``BusquedasAsincronas`` reúne ambos modos tras un semáforo que limita cuántas búsquedas
+corren a la vez, para no ocupar más núcleos de los disponibles.
+"""
+
+import asyncio
+import copy
+import functools
+import inspect
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Optional
+
+from algoritmos_busqueda import ProblemaDeRuta, ResultadoBusqueda
+from presupuesto_busqueda import PresupuestoBusqueda, TokenCancelacion
+from traza_busqueda import EXPANDIR, FIN, trazar
+
+
+@functools.lru_cache(maxsize=None)
+def _acepta_presupuesto(algoritmo: Callable[..., ResultadoBusqueda]) -> bool:
+    """Indica si la función de búsqueda recibe el parámetro ``presupuesto``."""
+    try:
+        return 'presupuesto' in inspect.signature(algoritmo).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+async def buscar_en_ejecutor(
+    algoritmo: Callable[..., ResultadoBusqueda],
+    problema: ProblemaDeRuta,
+    *args: Any,
+    ejecutor: Optional[Executor] = None,
+    **kwargs: Any
+) -> ResultadoBusqueda:
+    """
+    Ejecuta ``algoritmo(problema, *args, **kwargs)`` en un ejecutor sin bloquear el bucle.
+
+    Args:
+        algoritmo: La función de búsqueda
+        problema: El problema a resolver
+        *args: Argumentos adicionales del algoritmo
+        ejecutor: ThreadPoolExecutor o ProcessPoolExecutor (None para el ejecutor por
+            defecto del bucle)
+        **kwargs: Argumentos adicionales del algoritmo
+
+    Returns:
+        ResultadoBusqueda: Los resultados de la búsqueda
+    """
+    bucle = asyncio.get_running_loop()
+    token = None
+
+    # En un hilo, la cancelación de la tarea llega a la búsqueda con un token propio que
+    # hereda el del presupuesto recibido (si lo hay)
+    if not isinstance(ejecutor, ProcessPoolExecutor) and _acepta_presupuesto(algoritmo):
+        presupuesto = kwargs.get('presupuesto')
+        if presupuesto is None:
+            token = TokenCancelacion()
+            presupuesto = PresupuestoBusqueda(cancelacion=token)
+        else:
+            token = TokenCancelacion(presupuesto.cancelacion)
+            presupuesto = copy.copy(presupuesto)
+            presupuesto.cancelacion = token
+        kwargs['presupuesto'] = presupuesto
+
+    try:
+        return await bucle.run_in_executor(ejecutor, functools.partial(algoritmo, problema, *args, **kwargs))
+    except asyncio.CancelledError:
+        if token is not None:
+            token.cancelar()
+        raise
+
+
+async def buscar_cooperativo(
+    algoritmo: Callable[..., ResultadoBusqueda],
+    problema: ProblemaDeRuta,
+    *args: Any,
+    cada: int = 1000,
+    **kwargs: Any
+) -> ResultadoBusqueda:
+    """
+    Ejecuta ``algoritmo(problema, *args, **kwargs)`` recorriendo su traza desde el bucle,
+    al que cede el control cada ``cada`` expansiones.
+
+    Recorre la traza del algoritmo, así que solo admite funciones de búsqueda que acepten
+    ``observador`` (ver traza_busqueda.py). Si la tarea se cancela, cerrar la traza
+    detiene la búsqueda.
+
+    Args:
+        algoritmo: Una función de búsqueda con traza
+        problema: El problema a resolver
+        *args: Argumentos adicionales del algoritmo
+        cada: Expansiones entre cesiones del control al bucle
+        **kwargs: Argumentos adicionales del algoritmo
+
+    Returns:
+        ResultadoBusqueda: Los resultados de la búsqueda
+
+    Raises:
+        ValueError: Si el algoritmo no tiene versión con traza o ``cada`` no es positivo
+    """
+    if cada < 1:
+        raise ValueError("cada debe ser al menos 1")
+
+    traza = trazar(algoritmo, problema, *args, **kwargs)
+    expandidos = 0
+    siguiente_cesion = cada
+
+    try:
+        for evento in traza:
+            if evento.tipo == EXPANDIR:
+                expandidos += 1
+                if expandidos == siguiente_cesion:
+                    siguiente_cesion += cada
+                    await asyncio.sleep(0)
+            elif evento.tipo == FIN:
+                return evento.resultado
+    finally:
+        # Cerrar la traza libera la búsqueda si la tarea se canceló en una cesión
+        traza.close()
+
+    raise RuntimeError("La traza terminó sin evento fin")
+
+
+class BusquedasAsincronas:
+    """
+    Ejecuta búsquedas desde asyncio limitando cuántas corren a la vez.
+
+    Cada instancia debe usarse desde un único bucle de eventos.
+    """
+
+    def __init__(
+        self,
+        max_concurrentes: Optional[int] = None,
+        ejecutor: Optional[Executor] = None,
+        cada: Optional[int] = None
+    ):
+        """
+        Inicializa el ejecutor de búsquedas.
+
+        Args:
+            max_concurrentes: Número máximo de búsquedas simultáneas (por defecto, el
+                número de CPUs); las demás esperan su turno
+            ejecutor: Ejecutor de las búsquedas (None para el ejecutor por defecto del bucle)
+            cada: Si se indica, las búsquedas corren en modo cooperativo (en el propio
+                bucle, cediendo el control cada ``cada`` expansiones) en lugar de en el ejecutor
+        """
+        self.max_concurrentes = max_concurrentes or os.cpu_count() or 1
+        self.ejecutor = ejecutor
+        self.cada = cada
+        self.en_curso = 0
+        self.en_espera = 0
+        self._semaforo = asyncio.Semaphore(self.max_concurrentes)
+
+    async def buscar(
+        self,
+        algoritmo: Callable[..., ResultadoBusqueda],
+        problema: ProblemaDeRuta,
+        *args: Any,
+        **kwargs: Any
+    ) -> ResultadoBusqueda:
+        """
+        Resuelve ``algoritmo(problema, *args, **kwargs)`` cuando haya un turno libre.
+
+        Args:
+            algoritmo: La función de búsqueda
+            problema: El problema a resolver
+            *args, **kwargs: Parámetros adicionales del algoritmo
+
+        Returns:
+            ResultadoBusqueda: Los resultados de la búsqueda
+        """
+        self.en_espera += 1
+        try:
+            await self._semaforo.acquire()
+        finally:
+            self.en_espera -= 1
+
+        self.en_curso += 1
+        try:
+            if self.cada is not None:
+                return await buscar_cooperativo(algoritmo, problema, *args, cada=self.cada, **kwargs)
+            return await buscar_en_ejecutor(algoritmo, problema, *args, ejecutor=self.ejecutor, **kwargs)
+        finally:
+            self.en_curso -= 1
+            self._semaforo.release()
+
+
+def asincrona(
+    algoritmo: Callable[..., ResultadoBusqueda],
+    busquedas: BusquedasAsincronas
+) -> Callable[..., Awaitable[ResultadoBusqueda]]:
+    """
+    Envuelve una función de búsqueda en una corrutina que se ejecuta con ``busquedas``.
+
+    Args:
+        algoritmo: La función de búsqueda
+        busquedas: El ejecutor de búsquedas a usar
+
+    Returns:
+        Callable: Corrutina con la misma firma que ``algoritmo``
+    """
+    @functools.wraps(algoritmo)
+    async def envoltura(problema: ProblemaDeRuta, *args: Any, **kwargs: Any) -> ResultadoBusqueda:
+        return await busquedas.buscar(algoritmo, problema, *args, **kwargs)
+
+    return envoltura
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    import time
+
+    from algoritmos_busqueda import busqueda_amplitud, busqueda_costo_uniforme
+
+    # Cuadrícula de 250 x 250 con costos que dependen de la posición
+    lado = 250
+    grafo = {}
+    for fila in range(lado):
+        for columna in range(lado):
+            grafo[f"{fila},{columna}"] = [
+                (f"{fila + df},{columna + dc}", 1 + (fila * 7 + columna * 13) % 5)
+                for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                if 0 <= fila + df < lado and 0 <= columna + dc < lado
+            ]
+    problema = ProblemaDeRuta(grafo, "0,0", f"{lado - 1},{lado - 1}")
+    problema.grafo_compilado
+
+    async def latido(latencias: list, detener: asyncio.Event) -> None:
+        """Mide cuánto tarda el bucle en atender una espera de 1 ms."""
+        while not detener.is_set():
+            inicio = time.perf_counter()
+            await asyncio.sleep(0.001)
+            latencias.append(time.perf_counter() - inicio - 0.001)
+
+    async def con_latido(corrutina: Awaitable) -> Any:
+        latencias, detener = [], asyncio.Event()
+        tarea = asyncio.create_task(latido(latencias, detener))
+        await asyncio.sleep(0)
+        inicio = time.perf_counter()
+        try:
+            return await corrutina
+        finally:
+            detener.set()
+            await tarea
+            print(f"  {1000 * (time.perf_counter() - inicio):.0f} ms; "
+                  f"peor espera del bucle: {1000 * max(latencias, default=0):.1f} ms")
+
+    async def principal() -> None:
+        print("=== Síncrona (bloquea el bucle) ===")
+
+        async def bloqueante() -> ResultadoBusqueda:
+            return busqueda_costo_uniforme(problema)
+
+        resultado = await con_latido(bloqueante())
+        print(f"  Costo: {resultado.costo_total:.0f}\n")
+
+        print("=== En el ejecutor de hilos ===")
+        resultado = await con_latido(buscar_en_ejecutor(busqueda_costo_uniforme, problema))
+        print(f"  Costo: {resultado.costo_total:.0f}\n")
+
+        print("=== Cooperativa (cede cada 500 expansiones) ===")
+        resultado = await con_latido(buscar_cooperativo(busqueda_costo_uniforme, problema, cada=500))
+        print(f"  Costo: {resultado.costo_total:.0f}\n")
+
+        print("=== Cancelación por tiempo con asyncio.wait_for ===")
+        try:
+            await asyncio.wait_for(buscar_en_ejecutor(busqueda_costo_uniforme, problema), timeout=0.02)
+        except asyncio.TimeoutError:
+            print("  Cancelada a los 20 ms\n")
+
+        print("=== 8 búsquedas con a lo sumo 2 a la vez ===")
+        busquedas = BusquedasAsincronas(max_concurrentes=2)
+        bfs = asincrona(busqueda_amplitud, busquedas)
+        objetivos = [f"{lado - 1 - i},{lado - 1}" for i in range(8)]
+        resultados = await asyncio.gather(*(
+            bfs(ProblemaDeRuta(problema.grafo_compilado, "0,0", objetivo)) for objetivo in objetivos
+        ))
+        for objetivo, resultado in zip(objetivos, resultados):
+            print(f"  0,0 → {objetivo}: {len(resultado.camino) - 1} pasos")
+
+    asyncio.run(principal())
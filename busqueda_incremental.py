@@ -0,0 +1,358 @@
+"""
+Módulo: Búsqueda Incremental
+Descripción: Replanificación incremental de caminos de costo mínimo con D* Lite (LPA*
+mientras el estado inicial no cambia) sobre un ProblemaDeRuta editable.
+
+El planificador busca hacia atrás desde el objetivo: cada estado guarda g, su distancia
+al objetivo según la última búsqueda, y rhs, la que se deduce de g y de sus aristas de
+salida. Cuando cambia una arista u → v solo se recalcula rhs(u); la siguiente llamada a
+``planificar`` procesa únicamente los estados cuyos g y rhs dejaron de coincidir, y los que
+dependen de ellos, en orden de prioridad. Así, replanificar cuesta en proporción a la parte
+del árbol de caminos mínimos afectada por los cambios y no al tamaño del grafo.
+
+El planificador se suscribe a las ediciones del problema (``agregar_arista``,
+``eliminar_arista`` y ``actualizar_costo``). Si cambia el estado inicial (por ejemplo, un
+agente que avanza por el camino), conserva su búsqueda. Si cambia el objetivo, o el
+diccionario se modifica directamente y se llama a ``invalidar_compilacion``, la siguiente
+planificación empieza de cero.
+"""
+
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
+
+from algoritmos_busqueda import Nodo, ProblemaDeRuta, ResultadoBusqueda
+from busqueda_informada import Heuristica
+
+
+class PlanificadorIncremental:
+    """
+    Planificador D* Lite de un ProblemaDeRuta.
+
+    La heurística se evalúa como ``heuristica.estimar(inicio, estado)``, una cota del costo
+    desde el estado inicial hasta ``estado``, y debe ser consistente (por ejemplo, la
+    distancia en línea recta cuando ningún costo es menor que ella). Sin heurística el
+    planificador equivale a una búsqueda de costo uniforme incremental desde el objetivo.
+    """
+
+    def __init__(self, problema: ProblemaDeRuta, heuristica: Optional[Heuristica] = None):
+        """
+        Inicializa el planificador y lo suscribe a las ediciones del problema.
+
+        Args:
+            problema: El problema a resolver (su grafo puede ser un diccionario editable o
+                un GrafoCompilado)
+            heuristica: La heurística a usar (None equivale a h(n) = 0)
+        """
+        self.problema = problema
+        self.heuristica = heuristica
+        # Versión del problema con la que está sincronizado el planificador (-1: sin construir)
+        self._version = -1
+        problema.suscribir(self._al_editar)
+
+    def cerrar(self) -> None:
+        """Cancela la suscripción a las ediciones del problema."""
+        try:
+            self.problema.cancelar_suscripcion(self._al_editar)
+        except ValueError:
+            pass
+
+    def __enter__(self) -> 'PlanificadorIncremental':
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def planificar(self) -> ResultadoBusqueda:
+        """
+        Calcula (o repara) el camino de menor costo del estado inicial al objetivo actuales.
+
+        Returns:
+            ResultadoBusqueda: Los resultados; ``nodos_expandidos`` cuenta solo los estados
+            procesados en esta llamada y ``nodos_frontera`` los que quedan en la cola
+        """
+        problema = self.problema
+
+        if problema.es_objetivo(problema.estado_inicial):
+            nodo_inicial = Nodo(problema.estado_inicial)
+            return ResultadoBusqueda(
+                encontrado=True,
+                camino=nodo_inicial.obtener_camino(),
+                costo_total=0,
+                nodos_expandidos=1
+            )
+
+        if self._version != problema.version or self._nombre_objetivo != problema.estado_objetivo:
+            self._reiniciar()
+        elif self._nombre_inicio != problema.estado_inicial:
+            self._mover_inicio(problema.estado_inicial)
+
+        inicio = self._indices.get(self._nombre_inicio, -1)
+
+        if inicio < 0:
+            return ResultadoBusqueda(encontrado=False, nodos_expandidos=1)
+
+        nodos_expandidos = self._calcular(inicio)
+        ids, costo_total = self._camino(inicio)
+
+        if ids is None:
+            return ResultadoBusqueda(
+                encontrado=False, nodos_expandidos=nodos_expandidos, nodos_frontera=len(self._claves)
+            )
+
+        nombres = self._nombres
+        camino = [(nombres[ids[0]], "Inicio")]
+        for anterior, actual in zip(ids, ids[1:]):
+            camino.append((nombres[actual], f"{nombres[anterior]} → {nombres[actual]}"))
+
+        return ResultadoBusqueda(
+            encontrado=True,
+            camino=camino,
+            costo_total=costo_total,
+            nodos_expandidos=nodos_expandidos,
+            nodos_frontera=len(self._claves)
+        )
+
+    def _reiniciar(self) -> None:
+        """Reconstruye las adyacencias desde el problema y empieza una búsqueda nueva."""
+        problema = self.problema
+        self._nombres: List[str] = []
+        self._indices: Dict[str, int] = {}
+        self._sucesores: List[Dict[int, float]] = []
+        self._predecesores: List[Dict[int, float]] = []
+        self._g: List[float] = []
+        self._rhs: List[float] = []
+
+        for nodo, vecinos in problema.grafo.items():
+            u = self._id(nodo)
+            for vecino, costo in vecinos:
+                v = self._id(vecino)
+                # Entre aristas repetidas cuenta la más barata
+                if costo < self._sucesores[u].get(v, math.inf):
+                    self._sucesores[u][v] = self._predecesores[v][u] = float(costo)
+
+        self._nombre_inicio = problema.estado_inicial
+        self._nombre_objetivo = problema.estado_objetivo
+        self._objetivo = self._indices.get(self._nombre_objetivo, -1)
+        self._km = 0.0
+        self._h: Dict[int, float] = {}
+        # Cola de prioridad con borrado perezoso: una entrada (k1, k2, estado) es válida
+        # solo si coincide con la clave actual del estado en ``_claves``
+        self._cola: List[Tuple[float, float, int]] = []
+        self._claves: Dict[int, Tuple[float, float]] = {}
+
+        if self._objetivo >= 0:
+            self._rhs[self._objetivo] = 0.0
+            self._actualizar(self._objetivo)
+
+        self._version = problema.version
+
+    def _id(self, nombre: str) -> int:
+        """Id de un estado, que se agrega (inalcanzable) si no existía."""
+        indice = self._indices.get(nombre)
+        if indice is None:
+            indice = self._indices[nombre] = len(self._nombres)
+            self._nombres.append(nombre)
+            self._sucesores.append({})
+            self._predecesores.append({})
+            self._g.append(math.inf)
+            self._rhs.append(math.inf)
+        return indice
+
+    def _heuristica(self, estado: int) -> float:
+        """Cota del costo desde el estado inicial hasta ``estado``."""
+        if self.heuristica is None:
+            return 0.0
+        valor = self._h.get(estado)
+        if valor is None:
+            valor = self._h[estado] = self.heuristica.estimar(self._nombre_inicio, self._nombres[estado])
+        return valor
+
+    def _actualizar(self, estado: int) -> None:
+        """Pone en la cola los estados inconsistentes (g != rhs) y saca los consistentes."""
+        g, rhs = self._g[estado], self._rhs[estado]
+        if g != rhs:
+            minimo = min(g, rhs)
+            clave = (minimo + self._heuristica(estado) + self._km, minimo)
+            if self._claves.get(estado) != clave:
+                self._claves[estado] = clave
+                heapq.heappush(self._cola, (clave[0], clave[1], estado))
+        else:
+            self._claves.pop(estado, None)
+
+    def _rhs_desde_sucesores(self, estado: int) -> float:
+        """Menor costo hasta el objetivo pasando por alguna arista de salida de ``estado``."""
+        g = self._g
+        return min((costo + g[v] for v, costo in self._sucesores[estado].items()), default=math.inf)
+
+    def _mover_inicio(self, nombre: str) -> None:
+        """Cambia el estado inicial conservando la búsqueda (corrección km de D* Lite)."""
+        if self.heuristica is not None:
+            self._km += self.heuristica.estimar(self._nombre_inicio, nombre)
+        self._nombre_inicio = nombre
+        self._h.clear()
+
+    def _al_editar(self, origen: str, destino: str, anterior: Optional[float], nuevo: Optional[float]) -> None:
+        """Aplica al planificador una edición de la arista origen → destino del problema."""
+        problema = self.problema
+
+        # Si ya estaba desincronizado (o sin construir), la próxima planificación reinicia
+        if self._version != problema.version - 1:
+            return
+        self._version = problema.version
+
+        u, v = self._id(origen), self._id(destino)
+        costo_anterior = self._sucesores[u].get(v, math.inf)
+        costo_nuevo = min((costo for vecino, costo in problema.grafo.get(origen, ()) if vecino == destino), default=math.inf)
+
+        if costo_nuevo == costo_anterior:
+            return
+
+        if costo_nuevo < math.inf:
+            self._sucesores[u][v] = self._predecesores[v][u] = float(costo_nuevo)
+        else:
+            del self._sucesores[u][v], self._predecesores[v][u]
+
+        if u != self._objetivo:
+            if costo_nuevo < costo_anterior:
+                self._rhs[u] = min(self._rhs[u], costo_nuevo + self._g[v])
+            elif self._rhs[u] == costo_anterior + self._g[v]:
+                self._rhs[u] = self._rhs_desde_sucesores(u)
+        self._actualizar(u)
+
+    def _calcular(self, inicio: int) -> int:
+        """
+        Procesa la cola hasta que el estado inicial es consistente y ninguna clave pendiente
+        es menor que la suya.
+
+        Returns:
+            int: Número de estados expandidos
+        """
+        g, rhs, predecesores = self._g, self._rhs, self._predecesores
+        cola, claves = self._cola, self._claves
+        objetivo, km = self._objetivo, self._km
+        heuristica, actualizar = self._heuristica, self._actualizar
+        nodos_expandidos = 0
+
+        while cola:
+            k1, k2, u = cola[0]
+
+            if claves.get(u) != (k1, k2):
+                heapq.heappop(cola)
+                continue
+
+            minimo_inicio = min(g[inicio], rhs[inicio])
+            if (k1, k2) >= (minimo_inicio + heuristica(inicio) + km, minimo_inicio) and rhs[inicio] == g[inicio]:
+                break
+
+            g_u, rhs_u = g[u], rhs[u]
+            minimo = min(g_u, rhs_u)
+            clave = (minimo + heuristica(u) + km, minimo)
+
+            # Clave desactualizada por un cambio de estado inicial: se reinserta
+            if (k1, k2) < clave:
+                claves[u] = clave
+                heapq.heapreplace(cola, (clave[0], clave[1], u))
+                continue
+
+            heapq.heappop(cola)
+            del claves[u]
+            nodos_expandidos += 1
+
+            if g_u > rhs_u:
+                # Sobreconsistente: su distancia baja y puede mejorar la de sus predecesores
+                g[u] = rhs_u
+                for p, costo in predecesores[u].items():
+                    if p != objetivo and costo + rhs_u < rhs[p]:
+                        rhs[p] = costo + rhs_u
+                        actualizar(p)
+            else:
+                # Subconsistente: su distancia subió; los predecesores que pasaban por él se recalculan
+                g[u] = math.inf
+                for p, costo in predecesores[u].items():
+                    if p != objetivo and rhs[p] == costo + g_u:
+                        rhs[p] = self._rhs_desde_sucesores(p)
+                        actualizar(p)
+                actualizar(u)
+
+        return nodos_expandidos
+
+    def _camino(self, inicio: int) -> Tuple[Optional[List[int]], float]:
+        """Sigue desde el inicio el sucesor que minimiza costo + g hasta el objetivo."""
+        g, sucesores = self._g, self._sucesores
+
+        if g[inicio] == math.inf:
+            return None, 0.0
+
+        ids = [inicio]
+        costo_total = 0.0
+        actual = inicio
+
+        while actual != self._objetivo:
+            mejor, siguiente, costo_siguiente = math.inf, -1, 0.0
+            for v, costo in sucesores[actual].items():
+                if costo + g[v] < mejor:
+                    mejor, siguiente, costo_siguiente = costo + g[v], v, costo
+
+            if siguiente < 0 or len(ids) > len(g):
+                return None, 0.0
+
+            ids.append(siguiente)
+            costo_total += costo_siguiente
+            actual = siguiente
+
+        return ids, costo_total
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from busqueda_informada import HeuristicaFuncion, busqueda_a_estrella
+
+    # Red vial en cuadrícula de 150 x 150 (calles de doble sentido, costos de 1 a 9 por tramo)
+    lado = 150
+    grafo = {}
+    for fila in range(lado):
+        for columna in range(lado):
+            grafo[f"{fila},{columna}"] = [
+                (f"{fila + df},{columna + dc}", 1 + (fila * 7 + columna * 13) % 9)
+                for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                if 0 <= fila + df < lado and 0 <= columna + dc < lado
+            ]
+
+    def manhattan(estado: str, objetivo: str) -> float:
+        (f1, c1), (f2, c2) = (map(int, e.split(",")) for e in (estado, objetivo))
+        return abs(f1 - f2) + abs(c1 - c2)
+
+    heuristica = HeuristicaFuncion(manhattan)
+    problema = ProblemaDeRuta(grafo, "5,5", f"{lado - 6},{lado - 6}")
+
+    with PlanificadorIncremental(problema, heuristica) as planificador:
+        def comparar(titulo: str) -> ResultadoBusqueda:
+            resultado = planificador.planificar()
+            desde_cero = busqueda_a_estrella(problema, heuristica)
+            print(f"=== {titulo} ===")
+            print(f"Costo: {resultado.costo_total:.0f} (A* desde cero: {desde_cero.costo_total:.0f})")
+            print(f"Expandidos: {resultado.nodos_expandidos} (A* desde cero: {desde_cero.nodos_expandidos})\n")
+            return resultado
+
+        resultado = comparar("Planificación inicial")
+
+        # Obras: se cierran todas las calles de una cuadra de 5 x 5 atravesada por el camino
+        fila, columna = map(int, resultado.camino[100][0].split(","))
+        cerrados = {f"{f},{c}" for f in range(fila - 2, fila + 3) for c in range(columna - 2, columna + 3)}
+        for nodo in cerrados:
+            for vecino, _ in list(problema.grafo[nodo]):
+                problema.eliminar_arista(nodo, vecino)
+                problema.eliminar_arista(vecino, nodo)
+        resultado = comparar(f"Obras alrededor de {fila},{columna}")
+
+        # Tráfico: cinco tramos del nuevo camino cuestan el triple
+        for i in range(150, 155):
+            origen, destino = resultado.camino[i][0], resultado.camino[i + 1][0]
+            costo = dict(problema.grafo[origen])[destino]
+            problema.actualizar_costo(origen, destino, 3 * costo)
+        resultado = comparar("Tráfico en 5 tramos")
+
+        # El agente avanza 20 pasos por el camino
+        problema.estado_inicial = resultado.camino[20][0]
+        comparar(f"Agente en {problema.estado_inicial}")
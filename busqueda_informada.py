@@ -0,0 +1,519 @@
+"""
+Módulo: Algoritmos de Búsqueda Informada
+Descripción: Implementación de A* y de la búsqueda voraz primero el mejor con heurísticas intercambiables.
+
+Las heurísticas se evalúan solo en los nodos que la búsqueda llega a generar y guardan esos
+valores por grafo y por objetivo, de modo que las consultas repetidas hacia un mismo destino
+no vuelven a evaluarlas. Para aprovechar esa caché
+entre consultas conviene compilar el grafo una sola vez y pasar el mismo GrafoCompilado a
+cada ProblemaDeRuta.
+"""
+
+import heapq
+import math
+import weakref
+from array import array
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from algoritmos_busqueda import (
+    EXPANDIR, GENERAR, OBJETIVO, PODAR, MetricasBusqueda, Nodo, Observador, PoolNodos, ProblemaDeRuta,
+    ResultadoBusqueda, camino_desde_pool, preparar_busqueda
+)
+from grafo_compilado import GrafoCompilado
+from presupuesto_busqueda import ControlPresupuesto, PresupuestoBusqueda
+
+
+class Heuristica:
+    """
+    Estimación del costo restante desde un estado hasta el objetivo.
+
+    Las subclases implementan ``estimar``. El método ``valores`` devuelve los valores
+    hacia un objetivo, que se evalúan a medida que se consultan, y los conserva para los
+    últimos ``max_objetivos`` objetivos consultados en cada grafo.
+    """
+
+    def __init__(self, max_objetivos: int = 8):
+        """
+        Inicializa la caché de valores.
+
+        Args:
+            max_objetivos: Número máximo de objetivos cuyos valores se conservan por grafo
+        """
+        self.max_objetivos = max_objetivos
+        self._cache: Dict[int, Tuple[weakref.ref, OrderedDict]] = {}
+
+    def estimar(self, estado: str, objetivo: str) -> float:
+        """Estima el costo desde ``estado`` hasta ``objetivo``."""
+        raise NotImplementedError
+
+    def valores(self, grafo: GrafoCompilado, objetivo: str) -> Sequence[float]:
+        """
+        Obtiene los valores de la heurística hacia ``objetivo`` indexados por id de nodo.
+
+        Args:
+            grafo: El grafo compilado
+            objetivo: El estado objetivo
+
+        Returns:
+            Sequence[float]: Valor de la heurística para cada nodo del grafo
+        """
+        clave = id(grafo)
+        entrada = self._cache.get(clave)
+
+        if entrada is None or entrada[0]() is not grafo:
+            # La entrada se elimina sola cuando el grafo deja de existir
+            referencia = weakref.ref(grafo, lambda _, clave=clave: self._cache.pop(clave, None))
+            entrada = (referencia, OrderedDict())
+            self._cache[clave] = entrada
+
+        por_objetivo = entrada[1]
+        valores = por_objetivo.get(objetivo)
+
+        if valores is None:
+            valores = self.calcular_valores(grafo, objetivo)
+            por_objetivo[objetivo] = valores
+            if len(por_objetivo) > self.max_objetivos:
+                por_objetivo.popitem(last=False)
+        else:
+            por_objetivo.move_to_end(objetivo)
+
+        return valores
+
+    def calcular_valores(self, grafo: GrafoCompilado, objetivo: str) -> Sequence[float]:
+        """Crea los valores hacia ``objetivo`` (sin caché); cada nodo se evalúa la primera vez que se consulta."""
+        return _ValoresPerezosos(self, grafo, objetivo)
+
+
+class _ValoresPerezosos(dict):
+    """Valores de una heurística hacia un objetivo, por id de nodo, calculados a medida que se consultan."""
+
+    __slots__ = ('estimar', 'nombres', 'objetivo')
+
+    def __init__(self, heuristica: Heuristica, grafo: GrafoCompilado, objetivo: str):
+        super().__init__()
+        self.estimar = heuristica.estimar
+        self.nombres = grafo.nombres
+        self.objetivo = objetivo
+
+    def __missing__(self, estado: int) -> float:
+        valor = self[estado] = self.estimar(self.nombres[estado], self.objetivo)
+        return valor
+
+
+class HeuristicaNula(Heuristica):
+    """Heurística h(n) = 0. Con ella A* se comporta como la búsqueda de costo uniforme."""
+
+    def estimar(self, estado: str, objetivo: str) -> float:
+        return 0.0
+
+    def calcular_valores(self, grafo: GrafoCompilado, objetivo: str) -> Sequence[float]:
+        return defaultdict(float)
+
+
+class HeuristicaDistanciaRecta(Heuristica):
+    """
+    Distancia en línea recta calculada a partir de las coordenadas de los nodos.
+
+    Es admisible siempre que ningún costo de arista sea menor que la distancia
+    euclídea (multiplicada por ``escala``) entre sus extremos.
+    """
+
+    def __init__(
+        self,
+        coordenadas: Dict[str, Tuple[float, float]],
+        escala: float = 1.0,
+        max_objetivos: int = 8
+    ):
+        """
+        Inicializa la heurística.
+
+        Args:
+            coordenadas: Diccionario {nodo: (x, y)}
+            escala: Factor que convierte unidades de coordenadas en unidades de costo
+            max_objetivos: Número máximo de objetivos cuyos valores se conservan por grafo
+        """
+        super().__init__(max_objetivos)
+        self.coordenadas = coordenadas
+        self.escala = escala
+
+    def estimar(self, estado: str, objetivo: str) -> float:
+        """Distancia euclídea escalada; 0 si falta alguna de las coordenadas."""
+        origen = self.coordenadas.get(estado)
+        destino = self.coordenadas.get(objetivo)
+
+        if origen is None or destino is None:
+            return 0.0
+
+        return self.escala * math.hypot(origen[0] - destino[0], origen[1] - destino[1])
+
+
+class HeuristicaTabla(Heuristica):
+    """Heurística leída de tablas precalculadas {objetivo: {estado: valor}}."""
+
+    def __init__(self, tablas: Dict[str, Dict[str, float]], max_objetivos: int = 8):
+        """
+        Inicializa la heurística.
+
+        Args:
+            tablas: Diccionario {objetivo: {estado: valor}}; los estados ausentes valen 0
+            max_objetivos: Número máximo de objetivos cuyos valores se conservan por grafo
+        """
+        super().__init__(max_objetivos)
+        self.tablas = tablas
+
+    def estimar(self, estado: str, objetivo: str) -> float:
+        return self.tablas.get(objetivo, {}).get(estado, 0.0)
+
+
+class HeuristicaFuncion(Heuristica):
+    """Adapta cualquier función ``(estado, objetivo) -> float`` a la interfaz Heuristica."""
+
+    def __init__(self, funcion: Callable[[str, str], float], max_objetivos: int = 8):
+        super().__init__(max_objetivos)
+        self.funcion = funcion
+
+    def estimar(self, estado: str, objetivo: str) -> float:
+        return self.funcion(estado, objetivo)
+
+
+def busqueda_a_estrella(
+    problema: ProblemaDeRuta,
+    heuristica: Optional[Heuristica] = None,
+    metricas: Optional[MetricasBusqueda] = None,
+    presupuesto: Optional[PresupuestoBusqueda] = None,
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
+    """
+    Búsqueda A*.
+
+    Expande el nodo con menor f(n) = g(n) + h(n). Con una heurística admisible
+    garantiza encontrar la solución de menor costo. Un estado se reabre si se
+    alcanza con un costo menor, por lo que no hace falta que la heurística sea consistente.
+
+    Args:
+        problema: El problema a resolver
+        heuristica: La heurística a usar (None equivale a h(n) = 0)
+        metricas: Si se indica, se completan sus contadores y se adjunta al resultado
+        presupuesto: Límites de tiempo, expansiones y memoria, y token de cancelación
+            (ver presupuesto_busqueda.py); si se agota, el resultado parcial trae el
+            camino hasta el estado alcanzado que la heurística estima más cercano al objetivo
+        observador: Si se indica, recibe cada evento de la búsqueda a medida que ocurre
+            (ver ``Observador``)
+
+    Returns:
+        ResultadoBusqueda: Los resultados de la búsqueda
+    """
+    nodo_inicial = Nodo(problema.estado_inicial)
+
+    if problema.es_objetivo(nodo_inicial.estado):
+        if observador is not None:
+            observador(OBJETIVO, nodo_inicial.estado, None, 0.0, 0)
+        return ResultadoBusqueda(
+            encontrado=True,
+            camino=nodo_inicial.obtener_camino(),
+            costo_total=0,
+            nodos_expandidos=1
+        )
+
+    grafo, inicial, objetivo = preparar_busqueda(problema)
+
+    if inicial < 0:
+        return ResultadoBusqueda(encontrado=False, nodos_expandidos=1)
+
+    h = (heuristica or HeuristicaNula()).valores(grafo, problema.estado_objetivo)
+    desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+    mejor_costo = array('d', [math.inf]) * grafo.num_nodos
+    mejor_costo[inicial] = 0.0
+    pool = PoolNodos()
+    agregar, estados, costos_camino = pool.agregar, pool.estados, pool.costos
+
+    # Entradas (f, h, índice del nodo): a igual f se prefiere el nodo más cercano al
+    # objetivo y, después, el generado antes (los índices crecen en orden de inserción)
+    frontera = [(h[inicial], h[inicial], agregar(inicial))]
+    nodos_expandidos = 0
+    medir = metricas is not None
+    aristas_examinadas = pico_frontera = obsoletos = 0
+    observar = observador is not None
+    nombres = grafo.nombres
+    control = ControlPresupuesto(presupuesto)
+    revision = control.proxima
+
+    while frontera:
+        if nodos_expandidos >= revision:
+            if control.revisar(nodos_expandidos):
+                break
+            revision = control.proxima
+
+        if medir:
+            pico_frontera = max(pico_frontera, len(frontera))
+
+        _, _, nodo_actual = heapq.heappop(frontera)
+        actual = estados[nodo_actual]
+        costo_actual = costos_camino[nodo_actual]
+
+        if costo_actual > mejor_costo[actual]:
+            obsoletos += 1
+            if observar:
+                observador(PODAR, nombres[actual], None, costo_actual, 0)
+            continue
+
+        nodos_expandidos += 1
+
+        if observar:
+            observador(EXPANDIR, nombres[actual], None, costo_actual, 0)
+
+        if actual == objetivo:
+            if observar:
+                observador(OBJETIVO, nombres[actual], None, costo_actual, 0)
+            if medir:
+                _registrar(metricas, pool, aristas_examinadas, obsoletos, pico_frontera, mejor_costo)
+            return ResultadoBusqueda(
+                encontrado=True,
+                camino=camino_desde_pool(pool, nodo_actual, grafo),
+                costo_total=costo_actual,
+                nodos_expandidos=nodos_expandidos,
+                nodos_frontera=len(frontera),
+                metricas=metricas
+            )
+
+        if medir:
+            aristas_examinadas += desplazamientos[actual + 1] - desplazamientos[actual]
+
+        for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+            estado_sucesor = destinos[k]
+            costo_sucesor = costo_actual + costos[k]
+
+            if costo_sucesor < mejor_costo[estado_sucesor]:
+                mejor_costo[estado_sucesor] = costo_sucesor
+                h_sucesor = h[estado_sucesor]
+                heapq.heappush(
+                    frontera,
+                    (costo_sucesor + h_sucesor, h_sucesor, agregar(estado_sucesor, nodo_actual, costo_sucesor))
+                )
+                if observar:
+                    observador(GENERAR, nombres[estado_sucesor], nombres[actual], costo_sucesor, 0)
+            elif observar:
+                observador(PODAR, nombres[estado_sucesor], nombres[actual], costo_sucesor, 0)
+
+    if medir:
+        _registrar(metricas, pool, aristas_examinadas, obsoletos, pico_frontera, mejor_costo)
+    if control.motivo is not None:
+        return _resultado_parcial(grafo, pool, h, nodos_expandidos, len(frontera), metricas, control.motivo, mejor_costo)
+    return ResultadoBusqueda(encontrado=False, nodos_expandidos=nodos_expandidos, metricas=metricas)
+
+
+def busqueda_voraz(
+    problema: ProblemaDeRuta,
+    heuristica: Heuristica,
+    metricas: Optional[MetricasBusqueda] = None,
+    presupuesto: Optional[PresupuestoBusqueda] = None,
+    observador: Optional[Observador] = None
+) -> ResultadoBusqueda:
+    """
+    Búsqueda Voraz Primero el Mejor (Greedy Best-First Search).
+
+    Expande el nodo que la heurística estima más cercano al objetivo, sin tener en
+    cuenta el costo acumulado. Suele expandir muy pocos nodos, pero no garantiza
+    encontrar la solución de menor costo.
+
+    Args:
+        problema: El problema a resolver
+        heuristica: La heurística a usar
+        metricas: Si se indica, se completan sus contadores y se adjunta al resultado
+        presupuesto: Límites de tiempo, expansiones y memoria, y token de cancelación
+            (ver presupuesto_busqueda.py); si se agota, el resultado parcial trae el
+            camino hasta el estado alcanzado que la heurística estima más cercano al objetivo
+        observador: Si se indica, recibe cada evento de la búsqueda a medida que ocurre
+            (ver ``Observador``)
+
+    Returns:
+        ResultadoBusqueda: Los resultados de la búsqueda
+    """
+    nodo_inicial = Nodo(problema.estado_inicial)
+
+    if problema.es_objetivo(nodo_inicial.estado):
+        if observador is not None:
+            observador(OBJETIVO, nodo_inicial.estado, None, 0.0, 0)
+        return ResultadoBusqueda(
+            encontrado=True,
+            camino=nodo_inicial.obtener_camino(),
+            costo_total=0,
+            nodos_expandidos=1
+        )
+
+    grafo, inicial, objetivo = preparar_busqueda(problema)
+
+    if inicial < 0:
+        return ResultadoBusqueda(encontrado=False, nodos_expandidos=1)
+
+    h = heuristica.valores(grafo, problema.estado_objetivo)
+    desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+    alcanzados = bytearray(grafo.num_nodos)
+    alcanzados[inicial] = 1
+    pool = PoolNodos()
+    agregar, estados, costos_camino = pool.agregar, pool.estados, pool.costos
+
+    # Entradas (h, índice del nodo): a igual h sale antes el nodo generado antes
+    frontera = [(h[inicial], agregar(inicial))]
+    nodos_expandidos = 0
+    medir = metricas is not None
+    aristas_examinadas = pico_frontera = 0
+    observar = observador is not None
+    nombres = grafo.nombres
+    control = ControlPresupuesto(presupuesto)
+    revision = control.proxima
+
+    while frontera:
+        if nodos_expandidos >= revision:
+            if control.revisar(nodos_expandidos):
+                break
+            revision = control.proxima
+
+        if medir:
+            pico_frontera = max(pico_frontera, len(frontera))
+
+        _, nodo_actual = heapq.heappop(frontera)
+        actual = estados[nodo_actual]
+        nodos_expandidos += 1
+
+        if observar:
+            observador(EXPANDIR, nombres[actual], None, costos_camino[nodo_actual], 0)
+
+        if actual == objetivo:
+            if observar:
+                observador(OBJETIVO, nombres[actual], None, costos_camino[nodo_actual], 0)
+            if medir:
+                _registrar(metricas, pool, aristas_examinadas, 0, pico_frontera)
+            return ResultadoBusqueda(
+                encontrado=True,
+                camino=camino_desde_pool(pool, nodo_actual, grafo),
+                costo_total=costos_camino[nodo_actual],
+                nodos_expandidos=nodos_expandidos,
+                nodos_frontera=len(frontera),
+                metricas=metricas
+            )
+
+        if medir:
+            aristas_examinadas += desplazamientos[actual + 1] - desplazamientos[actual]
+
+        for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+            estado_sucesor = destinos[k]
+
+            if not alcanzados[estado_sucesor]:
+                alcanzados[estado_sucesor] = 1
+                nodo_sucesor = agregar(estado_sucesor, nodo_actual, costos_camino[nodo_actual] + costos[k])
+                heapq.heappush(frontera, (h[estado_sucesor], nodo_sucesor))
+                if observar:
+                    observador(GENERAR, nombres[estado_sucesor], nombres[actual], costos_camino[nodo_sucesor], 0)
+            elif observar:
+                observador(PODAR, nombres[estado_sucesor], nombres[actual], costos_camino[nodo_actual] + costos[k], 0)
+
+    if medir:
+        _registrar(metricas, pool, aristas_examinadas, 0, pico_frontera)
+    if control.motivo is not None:
+        return _resultado_parcial(grafo, pool, h, nodos_expandidos, len(frontera), metricas, control.motivo)
+    return ResultadoBusqueda(encontrado=False, nodos_expandidos=nodos_expandidos, metricas=metricas)
+
+
+def _registrar(
+    metricas: MetricasBusqueda,
+    pool: PoolNodos,
+    aristas_examinadas: int,
+    obsoletos: int,
+    pico_frontera: int,
+    mejor_costo: Optional[array] = None
+) -> None:
+    """
+    Completa las métricas de A* o de la búsqueda voraz.
+
+    Cada nodo del pool salvo el inicial es un sucesor generado; las aristas examinadas que
+    no generaron nodo y las entradas obsoletas de la frontera son duplicados podados. Los
+    explorados son los estados alcanzados (con costo finito en A*, todos los del pool en la voraz).
+    """
+    generados = len(pool) - 1
+    explorados = len(mejor_costo) - mejor_costo.count(math.inf) if mejor_costo is not None else len(pool)
+    metricas.registrar(generados, aristas_examinadas - generados + obsoletos, pico_frontera, explorados)
+
+
+def _resultado_parcial(
+    grafo: GrafoCompilado,
+    pool: PoolNodos,
+    h: Sequence[float],
+    nodos_expandidos: int,
+    nodos_frontera: int,
+    metricas: Optional[MetricasBusqueda],
+    motivo: str,
+    mejor_costo: Optional[array] = None
+) -> ResultadoBusqueda:
+    """
+    Resultado de A* o de la búsqueda voraz detenida por su presupuesto.
+
+    El camino parcial llega al nodo del pool con menor h (a igual h, con menor costo); en
+    A* solo se consideran los nodos cuyo costo sigue siendo el mejor conocido de su estado.
+    """
+    estados, costos_camino = pool.estados, pool.costos
+    mejor = 0
+    for i in range(1, len(pool)):
+        estado = estados[i]
+        if mejor_costo is not None and costos_camino[i] > mejor_costo[estado]:
+            continue
+        if (h[estado], costos_camino[i]) < (h[estados[mejor]], costos_camino[mejor]):
+            mejor = i
+
+    return ResultadoBusqueda(
+        encontrado=False,
+        camino=camino_desde_pool(pool, mejor, grafo),
+        costo_total=costos_camino[mejor],
+        nodos_expandidos=nodos_expandidos,
+        nodos_frontera=nodos_frontera,
+        metricas=metricas,
+        motivo_parada=motivo
+    )
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    grafo_rumania = {
+        'Oradea': [('Zerind', 71), ('Sibiu', 151)],
+        'Zerind': [('Oradea', 71), ('Sibiu', 99), ('Arad', 75)],
+        'Arad': [('Zerind', 75), ('Sibiu', 140), ('Timisoara', 118)],
+        'Timisoara': [('Arad', 118), ('Lugoj', 111)],
+        'Lugoj': [('Timisoara', 111), ('Mehadia', 70)],
+        'Mehadia': [('Lugoj', 70), ('Drobeta', 75)],
+        'Drobeta': [('Mehadia', 75)],
+        'Sibiu': [('Oradea', 151), ('Zerind', 99), ('Arad', 140), ('Fagaras', 99), ('Rimnicu Vilcea', 80)],
+        'Rimnicu Vilcea': [('Sibiu', 80), ('Craiova', 146), ('Pitesti', 97)],
+        'Craiova': [('Rimnicu Vilcea', 146), ('Pitesti', 138), ('Drobeta', 120)],
+        'Fagaras': [('Sibiu', 99), ('Bucharest', 211)],
+        'Pitesti': [('Rimnicu Vilcea', 97), ('Craiova', 138), ('Bucharest', 101)],
+        'Bucharest': [('Fagaras', 211), ('Pitesti', 101), ('Giurgiu', 90), ('Urziceni', 85)],
+        'Giurgiu': [('Bucharest', 90)],
+        'Urziceni': [('Bucharest', 85), ('Hirsova', 98), ('Vaslui', 142)],
+        'Hirsova': [('Urziceni', 98), ('Eforie', 86)],
+        'Eforie': [('Hirsova', 86)],
+        'Vaslui': [('Urziceni', 142), ('Iasi', 92)],
+        'Iasi': [('Vaslui', 92), ('Neamt', 87)],
+        'Neamt': [('Iasi', 87)]
+    }
+
+    # Distancias en línea recta hasta Bucharest (km)
+    distancias_bucharest = {
+        'Arad': 366, 'Bucharest': 0, 'Craiova': 160, 'Drobeta': 242, 'Eforie': 161,
+        'Fagaras': 176, 'Giurgiu': 77, 'Hirsova': 151, 'Iasi': 226, 'Lugoj': 244,
+        'Mehadia': 241, 'Neamt': 234, 'Oradea': 380, 'Pitesti': 100, 'Rimnicu Vilcea': 193,
+        'Sibiu': 253, 'Timisoara': 329, 'Urziceni': 80, 'Vaslui': 199, 'Zerind': 374
+    }
+
+    grafo = GrafoCompilado.desde_diccionario(grafo_rumania)
+    heuristica = HeuristicaTabla({'Bucharest': distancias_bucharest})
+    problema = ProblemaDeRuta(grafo, 'Arad', 'Bucharest')
+
+    print("=== Búsqueda Informada: Arad → Bucharest ===\n")
+
+    print("1. Búsqueda A*")
+    print(busqueda_a_estrella(problema, heuristica))
+    print()
+
+    print("2. Búsqueda Voraz Primero el Mejor")
+    print(busqueda_voraz(problema, heuristica))
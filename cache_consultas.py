@@ -0,0 +1,270 @@
+"""
+Módulo: Caché de Consultas
+Descripción: Memoización de los resultados de búsqueda con desalojo LRU por número de entradas
+y por tamaño aproximado en bytes.
+
+La clave de cada entrada combina la huella del contenido del grafo, los estados inicial y
+objetivo, el algoritmo y sus parámetros (por ejemplo ``limite`` o ``limite_maximo``). Cuando
+el grafo de un problema cambia de huella, las entradas calculadas con la huella anterior
+de ese mismo grafo se invalidan automáticamente.
+
+La huella se calcula una vez por versión del grafo y se comparte entre todos los
+ProblemaDeRuta que lo usan a la vez (ver ``ProblemaDeRuta.huella``); un GrafoCompilado
+guarda además la suya. Para que los aciertos sobre un diccionario no la recalculen,
+basta con mantener vivo algún problema sobre ese grafo mientras se consulta la caché.
+
+El ``presupuesto`` no forma parte de la clave: los resultados parciales (los que se
+detuvieron por agotarlo) no se guardan, y uno completo vale para cualquier presupuesto.
+Las llamadas con ``metricas`` u ``observador`` no usan la caché: se ejecutan siempre para
+completar los contadores o notificar los eventos que se piden.
+"""
+
+import copy
+import functools
+import inspect
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from algoritmos_busqueda import ProblemaDeRuta, ResultadoBusqueda
+
+Clave = Tuple[str, str, str, str, Tuple[Tuple[str, Hashable], ...]]
+
+
+def tamano_aproximado(resultado: ResultadoBusqueda) -> int:
+    """
+    Estima la memoria (en bytes) que ocupa un resultado y su camino.
+
+    Args:
+        resultado: El resultado a medir
+
+    Returns:
+        int: Tamaño aproximado en bytes
+    """
+    tamano = sys.getsizeof(resultado) + sys.getsizeof(resultado.__dict__) + sys.getsizeof(resultado.camino)
+    for estado, accion in resultado.camino:
+        tamano += sys.getsizeof((estado, accion)) + sys.getsizeof(estado) + sys.getsizeof(accion)
+    return tamano
+
+
+class CacheConsultas:
+    """
+    Caché LRU de resultados de búsqueda.
+
+    Es segura para usarse desde varios hilos. Los resultados se devuelven como copias,
+    de modo que modificar un resultado devuelto no altera la entrada guardada.
+    """
+
+    def __init__(self, max_entradas: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_entradas: Número máximo de resultados guardados
+            max_bytes: Tamaño aproximado máximo de los resultados guardados
+        """
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.invalidaciones = 0
+        self.bytes_ocupados = 0
+        self._entradas: 'OrderedDict[Clave, Tuple[ResultadoBusqueda, int]]' = OrderedDict()
+        self._claves_por_huella: Dict[str, Set[Clave]] = {}
+        # Última huella vista de cada grafo en uso (ver ``ProblemaDeRuta.identidad_grafo``)
+        self._huella_por_grafo: 'weakref.WeakKeyDictionary[Hashable, str]' = weakref.WeakKeyDictionary()
+        self._candado = threading.Lock()
+
+    def buscar(
+        self,
+        algoritmo: Callable[..., ResultadoBusqueda],
+        problema: ProblemaDeRuta,
+        *args: Any,
+        **kwargs: Any
+    ) -> ResultadoBusqueda:
+        """
+        Devuelve el resultado de ``algoritmo(problema, *args, **kwargs)``, calculándolo solo si no está en caché.
+
+        Args:
+            algoritmo: Una función de búsqueda (busqueda_amplitud, busqueda_profundidad, ...)
+            problema: El problema a resolver
+            *args, **kwargs: Parámetros adicionales del algoritmo
+
+        Returns:
+            ResultadoBusqueda: Los resultados de la búsqueda
+        """
+        clave = self._clave(algoritmo, problema, args, kwargs)
+
+        if clave is None:
+            return algoritmo(problema, *args, **kwargs)
+
+        with self._candado:
+            self._registrar_huella(problema, clave[0])
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return _copiar(entrada[0])
+            self.fallos += 1
+
+        # La búsqueda se ejecuta fuera del candado para no bloquear a otros hilos
+        resultado = algoritmo(problema, *args, **kwargs)
+        self._guardar(clave, resultado)
+        return _copiar(resultado)
+
+    def invalidar_grafo(self, huella: str) -> int:
+        """
+        Elimina todas las entradas calculadas sobre el grafo con la huella dada.
+
+        Args:
+            huella: Huella del grafo (``ProblemaDeRuta.huella`` o ``huella_grafo``)
+
+        Returns:
+            int: Número de entradas eliminadas
+        """
+        with self._candado:
+            return self._invalidar(huella)
+
+    def limpiar(self) -> None:
+        """Elimina todas las entradas (los contadores se conservan)."""
+        with self._candado:
+            self._entradas.clear()
+            self._claves_por_huella.clear()
+            self._huella_por_grafo.clear()
+            self.bytes_ocupados = 0
+
+    def estadisticas(self) -> Dict[str, int]:
+        """Contadores de la caché: aciertos, fallos, desalojos, invalidaciones, entradas y bytes."""
+        with self._candado:
+            return {
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "invalidaciones": self.invalidaciones,
+                "entradas": len(self._entradas),
+                "bytes": self.bytes_ocupados,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def _clave(self, algoritmo: Callable, problema: ProblemaDeRuta, args: tuple, kwargs: dict) -> Optional[Clave]:
+        """
+        Construye la clave normalizando los parámetros (posicionales, nombrados y por defecto),
+        o devuelve None si la llamada pide ``metricas`` u ``observador`` y no debe usar la caché.
+        """
+        argumentos = inspect.signature(algoritmo).bind(problema, *args, **kwargs)
+        if argumentos.arguments.get('metricas') is not None or argumentos.arguments.get('observador') is not None:
+            return None
+        argumentos.apply_defaults()
+        parametros = tuple(
+            (nombre, valor) for nombre, valor in argumentos.arguments.items()
+            if valor is not problema and nombre not in ('presupuesto', 'metricas', 'observador')
+        )
+        nombre_algoritmo = f"{algoritmo.__module__}.{algoritmo.__qualname__}"
+        return (
+            problema.huella, problema.estado_inicial, problema.estado_objetivo,
+            nombre_algoritmo, parametros
+        )
+
+    def _registrar_huella(self, problema: ProblemaDeRuta, huella: str) -> None:
+        """Si el grafo de este problema cambió de huella, invalida las entradas de la huella anterior."""
+        identidad = problema.identidad_grafo
+        anterior = self._huella_por_grafo.get(identidad)
+        if anterior is not None and anterior != huella:
+            self._invalidar(anterior)
+        self._huella_por_grafo[identidad] = huella
+
+    def _guardar(self, clave: Clave, resultado: ResultadoBusqueda) -> None:
+        if resultado.motivo_parada is not None:
+            return
+
+        tamano = tamano_aproximado(resultado)
+        if tamano > self.max_bytes:
+            return
+
+        with self._candado:
+            if clave in self._entradas:
+                return
+
+            self._entradas[clave] = (_copiar(resultado), tamano)
+            self._claves_por_huella.setdefault(clave[0], set()).add(clave)
+            self.bytes_ocupados += tamano
+
+            while len(self._entradas) > self.max_entradas or self.bytes_ocupados > self.max_bytes:
+                antigua, (_, tamano_antigua) = self._entradas.popitem(last=False)
+                self._desalojar(antigua, tamano_antigua)
+                self.desalojos += 1
+
+    def _invalidar(self, huella: str) -> int:
+        claves = self._claves_por_huella.pop(huella, set())
+        for clave in claves:
+            _, tamano = self._entradas.pop(clave)
+            self.bytes_ocupados -= tamano
+        self.invalidaciones += len(claves)
+        return len(claves)
+
+    def _desalojar(self, clave: Clave, tamano: int) -> None:
+        """Actualiza el tamaño ocupado y el índice por huella tras retirar una entrada de ``_entradas``."""
+        self.bytes_ocupados -= tamano
+        claves = self._claves_por_huella.get(clave[0])
+        if claves is not None:
+            claves.discard(clave)
+            if not claves:
+                del self._claves_por_huella[clave[0]]
+
+
+def _copiar(resultado: ResultadoBusqueda) -> ResultadoBusqueda:
+    copia = copy.copy(resultado)
+    copia.camino = list(resultado.camino)
+    return copia
+
+
+def con_cache(algoritmo: Callable[..., ResultadoBusqueda], cache: CacheConsultas) -> Callable[..., ResultadoBusqueda]:
+    """
+    Envuelve una función de búsqueda para que consulte la caché antes de ejecutarse.
+
+    Args:
+        algoritmo: La función de búsqueda
+        cache: La caché a usar
+
+    Returns:
+        Callable: Función con la misma firma que ``algoritmo``
+    """
+    @functools.wraps(algoritmo)
+    def envoltura(problema: ProblemaDeRuta, *args: Any, **kwargs: Any) -> ResultadoBusqueda:
+        return cache.buscar(algoritmo, problema, *args, **kwargs)
+
+    return envoltura
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from algoritmos_busqueda import busqueda_costo_uniforme, busqueda_profundidad_iterativa
+
+    grafo = {
+        'Arad': [('Sibiu', 140), ('Timisoara', 118)],
+        'Sibiu': [('Arad', 140), ('Fagaras', 99), ('Rimnicu Vilcea', 80)],
+        'Timisoara': [('Arad', 118)],
+        'Fagaras': [('Sibiu', 99), ('Bucharest', 211)],
+        'Rimnicu Vilcea': [('Sibiu', 80), ('Pitesti', 97)],
+        'Pitesti': [('Rimnicu Vilcea', 97), ('Bucharest', 101)],
+        'Bucharest': [('Fagaras', 211), ('Pitesti', 101)]
+    }
+
+    cache = CacheConsultas(max_entradas=100)
+    ucs = con_cache(busqueda_costo_uniforme, cache)
+
+    for _ in range(3):
+        ucs(ProblemaDeRuta(grafo, 'Arad', 'Bucharest'))
+    cache.buscar(busqueda_profundidad_iterativa, ProblemaDeRuta(grafo, 'Arad', 'Bucharest'), limite_maximo=5)
+    print("Tras 4 consultas:", cache.estadisticas())
+
+    # Editar el grafo invalida las entradas calculadas sobre su contenido anterior
+    problema = ProblemaDeRuta(grafo, 'Arad', 'Bucharest')
+    problema.actualizar_costo('Fagaras', 'Bucharest', 150)
+    print(ucs(problema))
+    print("Tras editar el grafo:", cache.estadisticas())
@@ -0,0 +1,313 @@
+"""
+Módulo: Cargador de Grafos
+Descripción: Carga listas de aristas en CSV o en formato DIMACS (.gr) leyendo el archivo
+por bloques, sin cargar el texto completo en memoria.
+
+Cada bloque de líneas se interpreta e interna sus nodos a ids enteros en arreglos
+compactos (12 bytes por arista); al terminar, las aristas se deduplican, opcionalmente
+se simetrizan y se compilan con ``GrafoCompilado.desde_aristas``.
+
+Formatos:
+
+- CSV: una arista por fila ``origen,destino[,costo]``. Las filas vacías y las que empiezan
+  por ``#`` se ignoran; la primera fila puede ser un encabezado. Los campos no pueden
+  contener saltos de línea.
+- DIMACS (desafío de caminos mínimos): líneas ``c`` de comentario, una línea ``p sp <n> <m>``
+  y después los arcos ``a <origen> <destino> <costo>`` con nodos entre 1 y n. Los nodos se
+  llaman "1".."n" y tienen los ids 0..n-1.
+
+Los archivos terminados en ``.gz`` se descomprimen al vuelo.
+"""
+
+import csv
+import gzip
+import time
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from grafo_compilado import GrafoCompilado
+
+# Tamaño aproximado, en caracteres, del texto que se lee en cada bloque
+TAMANO_BLOQUE = 1 << 20
+
+
+class EstadisticasCarga:
+    """Estadísticas de una carga de aristas."""
+
+    def __init__(self):
+        self.lineas = 0
+        self.aristas_leidas = 0
+        self.aristas = 0
+        self.nodos = 0
+        self.segundos_lectura = 0.0
+        self.segundos = 0.0
+
+    @property
+    def aristas_por_segundo(self) -> float:
+        """Aristas leídas por segundo de carga (lectura, interpretación y compilación)."""
+        return self.aristas_leidas / self.segundos if self.segundos else 0.0
+
+    def __str__(self) -> str:
+        """Representación en string de las estadísticas."""
+        resultado = f"Líneas: {self.lineas}\n"
+        resultado += f"Aristas leídas: {self.aristas_leidas}\n"
+        resultado += f"Aristas en el grafo: {self.aristas}\n"
+        resultado += f"Nodos: {self.nodos}\n"
+        resultado += f"Tiempo: {self.segundos:.2f} s (lectura {self.segundos_lectura:.2f} s)\n"
+        resultado += f"Rendimiento: {self.aristas_por_segundo:,.0f} aristas/s"
+
+        return resultado
+
+
+def cargar_aristas(
+    ruta: str,
+    formato: str = "auto",
+    deduplicar: bool = True,
+    simetrizar: bool = False,
+    compilar: bool = True,
+    delimitador: str = ",",
+    columnas: Tuple[int, int, Optional[int]] = (0, 1, 2),
+    encabezado: Optional[bool] = None,
+    tamano_bloque: int = TAMANO_BLOQUE,
+    progreso: Optional[Callable[[EstadisticasCarga], None]] = None
+) -> Tuple[Union[GrafoCompilado, Dict[str, List[Tuple[str, float]]]], EstadisticasCarga]:
+    """
+    Carga un grafo desde una lista de aristas en CSV o DIMACS.
+
+    Args:
+        ruta: Ruta del archivo (``.gz`` para comprimidos)
+        formato: "csv", "dimacs" o "auto" (DIMACS si la extensión es ``.gr``)
+        deduplicar: Conservar solo la arista más barata entre cada par (origen, destino)
+        simetrizar: Agregar la arista inversa de cada arista (grafo no dirigido)
+        compilar: Devolver un GrafoCompilado (True) o un diccionario {nodo: [(vecino, costo), ...]}
+        delimitador: Separador de campos (CSV)
+        columnas: Columnas de origen, destino y costo (CSV); sin columna de costo, todas
+            las aristas cuestan 1
+        encabezado: Si la primera fila es un encabezado (CSV); None lo detecta porque su
+            costo no es un número
+        tamano_bloque: Caracteres aproximados por bloque de lectura
+        progreso: Función que recibe las estadísticas tras cada bloque
+
+    Returns:
+        Tuple: (grafo, estadísticas de la carga)
+
+    Raises:
+        ValueError: Si el formato no es válido o una línea no se puede interpretar
+    """
+    if formato == "auto":
+        formato = "dimacs" if ruta.removesuffix(".gz").endswith(".gr") else "csv"
+    if formato not in ("csv", "dimacs"):
+        raise ValueError(f"Formato desconocido: {formato!r} (use 'csv', 'dimacs' o 'auto')")
+
+    estadisticas = EstadisticasCarga()
+    inicio = time.perf_counter()
+    indices: Dict[str, int] = {}
+    origenes, destinos, costos = array('i'), array('i'), array('d')
+
+    if formato == "csv":
+        def interpretar(lineas: List[str], primera: int) -> None:
+            nonlocal encabezado
+            encabezado = _interpretar_csv(
+                ruta, lineas, primera, indices, origenes, destinos, costos,
+                delimitador, columnas, encabezado
+            )
+    else:
+        def interpretar(lineas: List[str], primera: int) -> None:
+            _interpretar_dimacs(ruta, lineas, primera, indices, origenes, destinos, costos)
+
+    apertura = gzip.open if ruta.endswith(".gz") else open
+    with apertura(ruta, 'rt', encoding='utf-8', newline='') as archivo:
+        while True:
+            lineas = archivo.readlines(tamano_bloque)
+            if not lineas:
+                break
+
+            interpretar(lineas, estadisticas.lineas + 1)
+            estadisticas.lineas += len(lineas)
+            estadisticas.aristas_leidas = len(origenes)
+            estadisticas.nodos = len(indices)
+            estadisticas.segundos = estadisticas.segundos_lectura = time.perf_counter() - inicio
+
+            if progreso is not None:
+                progreso(estadisticas)
+
+    grafo = GrafoCompilado.desde_aristas(list(indices), origenes, destinos, costos, deduplicar, simetrizar, indices)
+    estadisticas.aristas = grafo.num_aristas
+    resultado = grafo if compilar else {nombre: grafo[nombre] for nombre in grafo}
+    estadisticas.segundos = time.perf_counter() - inicio
+
+    return resultado, estadisticas
+
+
+def _interpretar_csv(
+    ruta: str,
+    lineas: List[str],
+    primera: int,
+    indices: Dict[str, int],
+    origenes: array,
+    destinos: array,
+    costos: array,
+    delimitador: str,
+    columnas: Tuple[int, int, Optional[int]],
+    encabezado: Optional[bool]
+) -> Optional[bool]:
+    """
+    Interpreta un bloque de filas CSV y agrega sus aristas a los arreglos.
+
+    Returns:
+        Optional[bool]: El estado del encabezado para el siguiente bloque (False una vez
+        vista la primera fila)
+    """
+    columna_origen, columna_destino, columna_costo = columnas
+    internar = indices.setdefault
+
+    for numero, fila in enumerate(csv.reader(lineas, delimiter=delimitador, skipinitialspace=True), primera):
+        if not fila or fila[0].startswith('#'):
+            continue
+
+        if encabezado:
+            encabezado = False
+            continue
+
+        try:
+            costo = float(fila[columna_costo]) if columna_costo is not None else 1.0
+            origen, destino = fila[columna_origen], fila[columna_destino]
+        except (IndexError, ValueError):
+            if encabezado is None:
+                encabezado = False
+                continue
+            raise ValueError(f"{ruta}:{numero}: fila no válida: {fila!r}") from None
+
+        encabezado = False
+        origenes.append(internar(origen, len(indices)))
+        destinos.append(internar(destino, len(indices)))
+        costos.append(costo)
+
+    return encabezado
+
+
+def _interpretar_dimacs(
+    ruta: str,
+    lineas: List[str],
+    primera: int,
+    indices: Dict[str, int],
+    origenes: array,
+    destinos: array,
+    costos: array
+) -> None:
+    """
+    Interpreta un bloque de líneas DIMACS y agrega sus aristas a los arreglos.
+
+    La línea ``p`` interna los nodos "1".."n" con ids 0..n-1, así que los arcos del bloque
+    se convierten de una vez con NumPy, sin consultar el diccionario. Si algo falla, el
+    bloque se recorre línea a línea para informar de la primera línea no válida.
+    """
+    arcos = []
+
+    for numero, linea in enumerate(lineas, primera):
+        tipo = linea[0]
+        if tipo == 'a':
+            arcos.append(linea)
+        elif tipo == 'p':
+            campos = linea.split()
+            if len(campos) != 4 or indices or arcos or not campos[2].isdigit():
+                raise ValueError(f"{ruta}:{numero}: línea no válida: {linea.rstrip()!r}")
+            indices.update((str(nodo), nodo - 1) for nodo in range(1, int(campos[2]) + 1))
+        elif tipo != 'c' and linea.strip():
+            raise ValueError(f"{ruta}:{numero}: línea no válida: {linea.rstrip()!r}")
+
+    if not arcos:
+        return
+
+    campos = ''.join(arcos).split()
+    try:
+        if len(campos) != 4 * len(arcos) or campos[::4].count('a') != len(arcos):
+            raise ValueError
+        ids_origen = np.array(campos[1::4], dtype=np.int64) - 1
+        ids_destino = np.array(campos[2::4], dtype=np.int64) - 1
+        costos_arcos = np.array(campos[3::4], dtype=np.float64)
+        if min(ids_origen.min(), ids_destino.min()) < 0 or max(ids_origen.max(), ids_destino.max()) >= len(indices):
+            raise ValueError
+    except ValueError:
+        _localizar_error_dimacs(ruta, lineas, primera, len(indices))
+        raise
+
+    origenes.frombytes(ids_origen.astype(np.int32).tobytes())
+    destinos.frombytes(ids_destino.astype(np.int32).tobytes())
+    costos.frombytes(costos_arcos.tobytes())
+
+
+def _localizar_error_dimacs(ruta: str, lineas: List[str], primera: int, num_nodos: int) -> None:
+    """Lanza ValueError indicando el primer arco no válido del bloque."""
+    for numero, linea in enumerate(lineas, primera):
+        if linea[0] != 'a':
+            continue
+        try:
+            _, origen, destino, costo = linea.split()
+            float(costo)
+            if not (1 <= int(origen) <= num_nodos and 1 <= int(destino) <= num_nodos):
+                raise ValueError
+        except ValueError:
+            motivo = "arco antes de la línea 'p'" if num_nodos == 0 else "línea no válida"
+            raise ValueError(f"{ruta}:{numero}: {motivo}: {linea.rstrip()!r}") from None
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    import os
+    import sys
+    import tempfile
+
+    if len(sys.argv) > 1:
+        grafo, estadisticas = cargar_aristas(
+            sys.argv[1], simetrizar="--simetrizar" in sys.argv,
+            progreso=lambda e: print(f"\r{e.aristas_leidas:,} aristas...", end="", file=sys.stderr)
+        )
+        print(file=sys.stderr)
+        print(estadisticas)
+        sys.exit(0)
+
+    from algoritmos_busqueda import ProblemaDeRuta, busqueda_costo_uniforme
+
+    # Carreteras de Rumania, una vez cada una (y una repetida con otro costo)
+    carreteras = """origen,destino,km
+Oradea,Zerind,71
+Oradea,Sibiu,151
+Zerind,Arad,75
+Arad,Sibiu,140
+Arad,Timisoara,118
+Timisoara,Lugoj,111
+Lugoj,Mehadia,70
+Mehadia,Drobeta,75
+Drobeta,Craiova,120
+Sibiu,Fagaras,99
+Sibiu,Rimnicu Vilcea,80
+Rimnicu Vilcea,Craiova,146
+Rimnicu Vilcea,Pitesti,97
+Craiova,Pitesti,138
+Fagaras,Bucharest,211
+Pitesti,Bucharest,101
+Bucharest,Giurgiu,90
+Bucharest,Urziceni,85
+Urziceni,Hirsova,98
+Hirsova,Eforie,86
+Urziceni,Vaslui,142
+Vaslui,Iasi,92
+Iasi,Neamt,87
+Zerind,Sibiu,99
+Sibiu,Fagaras,120
+"""
+
+    ruta = os.path.join(tempfile.mkdtemp(), "rumania.csv")
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        archivo.write(carreteras)
+
+    grafo, estadisticas = cargar_aristas(ruta, simetrizar=True)
+
+    print("=== Carga de rumania.csv ===\n")
+    print(estadisticas)
+    print("\nVecinos de Sibiu:", grafo['Sibiu'])
+    print()
+    print(busqueda_costo_uniforme(ProblemaDeRuta(grafo, 'Arad', 'Bucharest')))
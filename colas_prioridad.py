@@ -0,0 +1,276 @@
+"""
+Módulo: Colas de Prioridad
+Descripción: Fronteras intercambiables para la Búsqueda de Costo Uniforme.
+
+Todas las colas guardan elementos enteros (ids de estado) con su prioridad y comparten
+la misma interfaz: ``insertar(prioridad, elemento)``, ``extraer()`` y ``len()``.
+
+- ``MonticuloBinario``: montículo binario de ``heapq`` con borrado perezoso.
+- ``MonticuloIndexado``: montículo binario con disminución de clave; cada elemento
+  aparece una sola vez.
+- ``ColaDial``: cubetas de Dial para costos enteros en ``[0, C]``; O(1) por operación
+  más el avance circular sobre las C + 1 cubetas.
+- ``MonticuloRadix``: montículo radix para prioridades enteras monótonas; O(log C)
+  amortizado sin comparaciones entre elementos.
+
+Las colas de Dial y radix son monótonas: nunca se inserta una prioridad menor que
+la última extraída, lo que se cumple en UCS con costos no negativos.
+"""
+
+import heapq
+from array import array
+from typing import List, Tuple
+
+from grafo_compilado import GrafoCompilado
+
+TIPOS_FRONTERA = ("auto", "binario", "indexado", "dial", "radix")
+
+
+class MonticuloBinario:
+    """Montículo binario de pares (prioridad, elemento); admite duplicados (borrado perezoso)."""
+
+    def __init__(self):
+        self._monticulo: List[Tuple[float, int]] = []
+
+    def insertar(self, prioridad: float, elemento: int) -> None:
+        """Inserta un elemento; a igual prioridad sale antes el de menor id."""
+        heapq.heappush(self._monticulo, (prioridad, elemento))
+
+    def extraer(self) -> Tuple[float, int]:
+        """Extrae el par (prioridad, elemento) de menor prioridad."""
+        return heapq.heappop(self._monticulo)
+
+    def __len__(self) -> int:
+        return len(self._monticulo)
+
+
+class MonticuloIndexado:
+    """
+    Montículo binario indexado por elemento, con disminución de clave.
+
+    Insertar un elemento que ya está en la cola solo tiene efecto si la nueva
+    prioridad es menor, así que la cola nunca contiene duplicados.
+    """
+
+    def __init__(self, num_elementos: int):
+        """
+        Args:
+            num_elementos: Los elementos válidos son los enteros 0..num_elementos-1
+        """
+        self._elementos = array('i')
+        self._prioridades = array('d')
+        # Posición de cada elemento en el montículo (-1 si no está)
+        self._posiciones = array('i', [-1]) * num_elementos
+
+    def insertar(self, prioridad: float, elemento: int) -> None:
+        """Inserta un elemento o disminuye su prioridad si ya estaba con una mayor."""
+        posicion = self._posiciones[elemento]
+
+        if posicion < 0:
+            posicion = len(self._elementos)
+            self._elementos.append(elemento)
+            self._prioridades.append(prioridad)
+        elif prioridad < self._prioridades[posicion]:
+            self._prioridades[posicion] = prioridad
+        else:
+            return
+
+        self._subir(posicion, prioridad, elemento)
+
+    def extraer(self) -> Tuple[float, int]:
+        """Extrae el par (prioridad, elemento) de menor prioridad."""
+        elementos, prioridades = self._elementos, self._prioridades
+        elemento, prioridad = elementos[0], prioridades[0]
+        self._posiciones[elemento] = -1
+
+        ultimo, prioridad_ultimo = elementos.pop(), prioridades.pop()
+        if elementos:
+            self._bajar(ultimo, prioridad_ultimo)
+
+        return prioridad, elemento
+
+    def __len__(self) -> int:
+        return len(self._elementos)
+
+    def __contains__(self, elemento: int) -> bool:
+        return self._posiciones[elemento] >= 0
+
+    def _subir(self, posicion: int, prioridad: float, elemento: int) -> None:
+        elementos, prioridades, posiciones = self._elementos, self._prioridades, self._posiciones
+
+        while posicion > 0:
+            padre = (posicion - 1) >> 1
+            if prioridades[padre] <= prioridad:
+                break
+            elementos[posicion] = elementos[padre]
+            prioridades[posicion] = prioridades[padre]
+            posiciones[elementos[posicion]] = posicion
+            posicion = padre
+
+        elementos[posicion] = elemento
+        prioridades[posicion] = prioridad
+        posiciones[elemento] = posicion
+
+    def _bajar(self, elemento: int, prioridad: float) -> None:
+        """Coloca ``elemento`` en la raíz (que quedó libre) y lo hunde hasta su lugar."""
+        elementos, prioridades, posiciones = self._elementos, self._prioridades, self._posiciones
+        n = len(elementos)
+        posicion = 0
+
+        while True:
+            hijo = 2 * posicion + 1
+            if hijo >= n:
+                break
+            if hijo + 1 < n and prioridades[hijo + 1] < prioridades[hijo]:
+                hijo += 1
+            if prioridades[hijo] >= prioridad:
+                break
+            elementos[posicion] = elementos[hijo]
+            prioridades[posicion] = prioridades[hijo]
+            posiciones[elementos[posicion]] = posicion
+            posicion = hijo
+
+        elementos[posicion] = elemento
+        prioridades[posicion] = prioridad
+        posiciones[elemento] = posicion
+
+
+class ColaDial:
+    """
+    Cola de cubetas de Dial para prioridades enteras.
+
+    Con costos de arista en ``[0, C]``, todas las prioridades presentes en la cola
+    caben en una ventana de C + 1 valores, así que basta un arreglo circular de
+    C + 1 cubetas. Admite duplicados (borrado perezoso).
+    """
+
+    def __init__(self, costo_maximo: int):
+        """
+        Args:
+            costo_maximo: Costo máximo de una arista (C)
+        """
+        self._cubetas: List[List[int]] = [[] for _ in range(costo_maximo + 1)]
+        self._actual = 0
+        self._tamano = 0
+
+    def insertar(self, prioridad: float, elemento: int) -> None:
+        """Inserta un elemento con una prioridad entera en ``[última extraída, última extraída + C]``."""
+        cubetas = self._cubetas
+        cubetas[int(prioridad) % len(cubetas)].append(elemento)
+        self._tamano += 1
+
+    def extraer(self) -> Tuple[float, int]:
+        """Extrae un elemento de prioridad mínima (el último insertado entre los empatados)."""
+        cubetas = self._cubetas
+        num_cubetas = len(cubetas)
+        actual = self._actual
+
+        while not cubetas[actual % num_cubetas]:
+            actual += 1
+
+        self._actual = actual
+        self._tamano -= 1
+        return actual, cubetas[actual % num_cubetas].pop()
+
+    def __len__(self) -> int:
+        return self._tamano
+
+
+class MonticuloRadix:
+    """
+    Montículo radix para prioridades enteras monótonas.
+
+    Un elemento de prioridad p se guarda en la cubeta ``(p XOR última).bit_length()``,
+    donde ``última`` es la última prioridad extraída. Al vaciarse la cubeta 0 se
+    redistribuye la primera cubeta no vacía, y cada elemento solo puede bajar de
+    cubeta, lo que da O(log C) amortizado por operación. Admite duplicados.
+    """
+
+    def __init__(self):
+        self._cubetas: List[List[Tuple[int, int]]] = [[] for _ in range(65)]
+        self._ultima = 0
+        self._tamano = 0
+
+    def insertar(self, prioridad: float, elemento: int) -> None:
+        """Inserta un elemento con una prioridad entera no menor que la última extraída."""
+        prioridad = int(prioridad)
+        self._cubetas[(prioridad ^ self._ultima).bit_length()].append((prioridad, elemento))
+        self._tamano += 1
+
+    def extraer(self) -> Tuple[float, int]:
+        """Extrae un par (prioridad, elemento) de prioridad mínima."""
+        cubetas = self._cubetas
+
+        if not cubetas[0]:
+            i = 1
+            while not cubetas[i]:
+                i += 1
+
+            cubeta, cubetas[i] = cubetas[i], []
+            ultima = min(cubeta)[0]
+            self._ultima = ultima
+            for par in cubeta:
+                cubetas[(par[0] ^ ultima).bit_length()].append(par)
+
+        self._tamano -= 1
+        return cubetas[0].pop()
+
+    def __len__(self) -> int:
+        return self._tamano
+
+
+def elegir_frontera(grafo: GrafoCompilado) -> str:
+    """
+    Elige la frontera de UCS a partir del perfil de costos del grafo.
+
+    - Costos enteros no negativos con C <= número de nodos: ``"dial"`` (el recorrido
+      circular de las C + 1 cubetas no domina el tiempo de la búsqueda).
+    - Cualquier otro caso: ``"binario"``. Con costos enteros grandes el montículo radix
+      hace menos trabajo asintóticamente, pero ``heapq`` está implementado en C y en la
+      práctica resulta más rápido (ver benchmarks/bench_colas_prioridad.py).
+
+    Args:
+        grafo: El grafo compilado
+
+    Returns:
+        str: "binario" o "dial"
+    """
+    minimo, maximo, enteros = grafo.perfil_costos()
+
+    if enteros and minimo >= 0 and maximo <= grafo.num_nodos:
+        return "dial"
+
+    return "binario"
+
+
+def crear_frontera(tipo: str, grafo: GrafoCompilado):
+    """
+    Crea una frontera vacía para una búsqueda sobre ``grafo``.
+
+    Args:
+        tipo: "auto", "binario", "indexado", "dial" o "radix"
+        grafo: El grafo compilado
+
+    Returns:
+        La cola de prioridad
+
+    Raises:
+        ValueError: Si el tipo es desconocido, o si "dial" o "radix" se piden para un
+            grafo con costos no enteros o negativos
+    """
+    if tipo not in TIPOS_FRONTERA:
+        raise ValueError(f"Tipo de frontera desconocido: {tipo}")
+
+    if tipo == "auto":
+        tipo = elegir_frontera(grafo)
+
+    if tipo == "binario":
+        return MonticuloBinario()
+    if tipo == "indexado":
+        return MonticuloIndexado(grafo.num_nodos)
+
+    minimo, maximo, enteros = grafo.perfil_costos()
+    if not enteros or minimo < 0:
+        raise ValueError(f"La frontera '{tipo}' requiere costos enteros no negativos")
+
+    return ColaDial(int(maximo)) if tipo == "dial" else MonticuloRadix()
@@ -0,0 +1,281 @@
+"""
+Módulo: Consultas en Lote
+Descripción: Rutas de un origen a muchos destinos (o matrices origen-destino) con un solo
+recorrido de Dijkstra por origen.
+
+En lugar de resolver un ProblemaDeRuta por cada par, se ejecuta una única búsqueda de
+costo uniforme desde cada origen distinto, que se detiene en cuanto todos los destinos
+pedidos están asentados, y se reutiliza su árbol de caminos mínimos para todos ellos.
+
+Con un grafo en formato diccionario se usa la forma compilada que comparten los
+ProblemaDeRuta sobre ese grafo (ver ``ProblemaDeRuta.grafo_compilado``): mientras alguno
+siga vivo, las llamadas sucesivas no vuelven a compilarlo. Sin ninguno, cada llamada lo
+compila de nuevo; para evitarlo puede pasarse directamente un GrafoCompilado.
+"""
+
+import heapq
+import math
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from algoritmos_busqueda import ProblemaDeRuta, ResultadoBusqueda
+from grafo_compilado import GrafoCompilado
+
+Grafo = Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado]
+
+
+class ArbolCaminosMinimos:
+    """
+    Árbol de caminos mínimos parcial desde un origen.
+
+    Para cada destino asentado guarda su distancia, su padre en el árbol y el número de
+    nodos expandidos (y el tamaño de la frontera) en el momento en que se asentó.
+    """
+
+    def __init__(self, grafo: GrafoCompilado, origen: int, objetivos: Iterable[int]):
+        """
+        Ejecuta Dijkstra desde ``origen`` hasta asentar todos los ``objetivos`` alcanzables.
+
+        Args:
+            grafo: El grafo compilado
+            origen: Id del nodo de partida
+            objetivos: Ids de los nodos que deben asentarse
+        """
+        n = grafo.num_nodos
+        desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+        pendientes = set(objetivos)
+
+        self.grafo = grafo
+        self.origen = origen
+        self.distancias = array('d', [math.inf]) * n
+        self.padres = array('i', [-1]) * n
+        self.asentamiento: Dict[int, Tuple[int, int]] = {}
+        self.nodos_expandidos = 0
+
+        explorados = bytearray(n)
+        self.distancias[origen] = 0.0
+        frontera = [(0.0, origen)]
+
+        while frontera and pendientes:
+            distancia, actual = heapq.heappop(frontera)
+
+            if explorados[actual]:
+                continue
+
+            explorados[actual] = 1
+            self.nodos_expandidos += 1
+
+            if actual in pendientes:
+                pendientes.discard(actual)
+                self.asentamiento[actual] = (self.nodos_expandidos, len(frontera))
+
+            for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+                sucesor = destinos[k]
+                nueva = distancia + costos[k]
+                if nueva < self.distancias[sucesor]:
+                    self.distancias[sucesor] = nueva
+                    self.padres[sucesor] = actual
+                    heapq.heappush(frontera, (nueva, sucesor))
+
+    def resultado(self, objetivo: int) -> ResultadoBusqueda:
+        """
+        Construye el ResultadoBusqueda del camino desde el origen hasta ``objetivo``.
+
+        Args:
+            objetivo: Id del nodo destino (debe haberse pedido al construir el árbol)
+
+        Returns:
+            ResultadoBusqueda: Los resultados para ese destino
+        """
+        if objetivo not in self.asentamiento:
+            return ResultadoBusqueda(encontrado=False, nodos_expandidos=self.nodos_expandidos)
+
+        ids = []
+        nodo = objetivo
+        while nodo >= 0:
+            ids.append(nodo)
+            nodo = self.padres[nodo]
+        ids.reverse()
+
+        nodos_expandidos, nodos_frontera = self.asentamiento[objetivo]
+        return ResultadoBusqueda(
+            encontrado=True,
+            camino=self.grafo.reconstruir_camino(ids),
+            costo_total=self.distancias[objetivo],
+            nodos_expandidos=nodos_expandidos,
+            nodos_frontera=nodos_frontera
+        )
+
+
+def _compilar(grafo: Grafo) -> GrafoCompilado:
+    """Devuelve la forma compilada del grafo, la misma que usan los ProblemaDeRuta sobre él."""
+    if isinstance(grafo, GrafoCompilado):
+        return grafo
+    return ProblemaDeRuta(grafo, None, None).grafo_compilado
+
+
+def busqueda_costo_uniforme_lote(
+    grafo: Grafo,
+    origen: str,
+    objetivos: Sequence[str]
+) -> Dict[str, ResultadoBusqueda]:
+    """
+    Caminos de menor costo desde un origen hasta varios destinos con una sola búsqueda.
+
+    Args:
+        grafo: Diccionario {nodo: [(vecino, costo), ...]} o un GrafoCompilado
+        origen: El estado inicial
+        objetivos: Los estados destino
+
+    Returns:
+        Dict[str, ResultadoBusqueda]: Resultado para cada destino
+    """
+    return {
+        objetivo: resultado
+        for (_, objetivo), resultado in consultas_origen_destino(
+            grafo, [(origen, objetivo) for objetivo in objetivos]
+        ).items()
+    }
+
+
+def consultas_origen_destino(
+    grafo: Grafo,
+    pares: Iterable[Tuple[str, str]]
+) -> Dict[Tuple[str, str], ResultadoBusqueda]:
+    """
+    Resuelve muchos pares (origen, destino) con un recorrido de Dijkstra por origen distinto.
+
+    Args:
+        grafo: Diccionario {nodo: [(vecino, costo), ...]} o un GrafoCompilado
+        pares: Pares (origen, destino) a resolver
+
+    Returns:
+        Dict[Tuple[str, str], ResultadoBusqueda]: Resultado para cada par
+    """
+    compilado = _compilar(grafo)
+    destinos_por_origen: Dict[str, List[str]] = {}
+
+    for origen, destino in pares:
+        destinos_por_origen.setdefault(origen, []).append(destino)
+
+    resultados = {}
+
+    for origen, destinos in destinos_por_origen.items():
+        inicial = compilado.indice(origen)
+        objetivos = [compilado.indice(destino) for destino in destinos]
+        arbol = None
+
+        if inicial >= 0:
+            arbol = ArbolCaminosMinimos(
+                compilado, inicial, [o for o, d in zip(objetivos, destinos) if o >= 0 and d != origen]
+            )
+
+        for destino, objetivo in zip(destinos, objetivos):
+            if destino == origen:
+                resultados[(origen, destino)] = ResultadoBusqueda(
+                    encontrado=True,
+                    camino=[(origen, "Inicio")],
+                    costo_total=0,
+                    nodos_expandidos=1
+                )
+            elif arbol is None:
+                resultados[(origen, destino)] = ResultadoBusqueda(encontrado=False, nodos_expandidos=1)
+            elif objetivo < 0:
+                resultados[(origen, destino)] = ResultadoBusqueda(
+                    encontrado=False, nodos_expandidos=arbol.nodos_expandidos
+                )
+            else:
+                resultados[(origen, destino)] = arbol.resultado(objetivo)
+
+    return resultados
+
+
+def matriz_distancias(
+    grafo: Grafo,
+    origenes: Sequence[str],
+    destinos: Sequence[str],
+    formato: str = "numpy"
+):
+    """
+    Matriz de costos mínimos entre cada origen y cada destino.
+
+    Las celdas sin camino valen ``inf``. Se ejecuta un solo Dijkstra por origen distinto,
+    aunque un origen se repita en varias filas.
+
+    Args:
+        grafo: Diccionario {nodo: [(vecino, costo), ...]} o un GrafoCompilado
+        origenes: Estados de partida (filas)
+        destinos: Estados de llegada (columnas)
+        formato: "numpy" para un ndarray float64 o "pandas" para un DataFrame etiquetado
+
+    Returns:
+        numpy.ndarray o pandas.DataFrame: La matriz de distancias
+    """
+    if formato not in ("numpy", "pandas"):
+        raise ValueError(f"Formato de matriz desconocido: {formato}")
+
+    compilado = _compilar(grafo)
+    objetivos = [compilado.indice(destino) for destino in destinos]
+    columnas_validas = [j for j, objetivo in enumerate(objetivos) if objetivo >= 0]
+    matriz = np.full((len(origenes), len(destinos)), np.inf)
+    filas_por_origen: Dict[str, List[int]] = {}
+
+    for i, origen in enumerate(origenes):
+        filas_por_origen.setdefault(origen, []).append(i)
+
+    for origen, filas in filas_por_origen.items():
+        inicial = compilado.indice(origen)
+        if inicial < 0:
+            continue
+
+        arbol = ArbolCaminosMinimos(compilado, inicial, [objetivos[j] for j in columnas_validas])
+        for j in columnas_validas:
+            matriz[filas[0], j] = arbol.distancias[objetivos[j]]
+        matriz[filas[1:]] = matriz[filas[0]]
+
+    if formato == "pandas":
+        # pandas solo se importa si se pide este formato
+        import pandas as pd
+        return pd.DataFrame(matriz, index=list(origenes), columns=list(destinos))
+
+    return matriz
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    grafo_rumania = {
+        'Oradea': [('Zerind', 71), ('Sibiu', 151)],
+        'Zerind': [('Oradea', 71), ('Sibiu', 99), ('Arad', 75)],
+        'Arad': [('Zerind', 75), ('Sibiu', 140), ('Timisoara', 118)],
+        'Timisoara': [('Arad', 118), ('Lugoj', 111)],
+        'Lugoj': [('Timisoara', 111), ('Mehadia', 70)],
+        'Mehadia': [('Lugoj', 70), ('Drobeta', 75)],
+        'Drobeta': [('Mehadia', 75)],
+        'Sibiu': [('Oradea', 151), ('Zerind', 99), ('Arad', 140), ('Fagaras', 99), ('Rimnicu Vilcea', 80)],
+        'Rimnicu Vilcea': [('Sibiu', 80), ('Craiova', 146), ('Pitesti', 97)],
+        'Craiova': [('Rimnicu Vilcea', 146), ('Pitesti', 138), ('Drobeta', 120)],
+        'Fagaras': [('Sibiu', 99), ('Bucharest', 211)],
+        'Pitesti': [('Rimnicu Vilcea', 97), ('Craiova', 138), ('Bucharest', 101)],
+        'Bucharest': [('Fagaras', 211), ('Pitesti', 101), ('Giurgiu', 90), ('Urziceni', 85)],
+        'Giurgiu': [('Bucharest', 90)],
+        'Urziceni': [('Bucharest', 85), ('Hirsova', 98), ('Vaslui', 142)],
+        'Hirsova': [('Urziceni', 98), ('Eforie', 86)],
+        'Eforie': [('Hirsova', 86)],
+        'Vaslui': [('Urziceni', 142), ('Iasi', 92)],
+        'Iasi': [('Vaslui', 92), ('Neamt', 87)],
+        'Neamt': [('Iasi', 87)]
+    }
+
+    print("=== Rutas desde Arad ===\n")
+    for destino, resultado in busqueda_costo_uniforme_lote(
+        grafo_rumania, 'Arad', ['Bucharest', 'Craiova', 'Iasi']
+    ).items():
+        print(f"{destino}: {' → '.join(estado for estado, _ in resultado.camino)} "
+              f"({resultado.costo_total:.0f} km, {resultado.nodos_expandidos} nodos expandidos)")
+
+    print("\n=== Matriz origen-destino (km) ===\n")
+    print(matriz_distancias(
+        grafo_rumania, ['Arad', 'Sibiu', 'Iasi'], ['Bucharest', 'Craiova', 'Timisoara'], formato="pandas"
+    ))
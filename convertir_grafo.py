@@ -0,0 +1,108 @@
+"""
+Módulo: Conversión de Grafos
+Descripción: Convierte grafos en formato diccionario {nodo: [(vecino, costo), ...]} al
+formato binario de GrafoCompilado, que ``GrafoCompilado.cargar`` abre al instante
+proyectando el archivo en memoria.
+
+Uso:
+    python convertir_grafo.py entrada.json salida.grf
+
+El JSON de entrada es un objeto {"nodo": [["vecino", costo], ...], ...}.
+"""
+
+import json
+import sys
+from typing import Dict, List, Tuple, Union
+
+from grafo_compilado import GrafoCompilado
+
+Grafo = Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado]
+
+
+def convertir_diccionario(grafo: Grafo, ruta: str) -> GrafoCompilado:
+    """
+    Compila un grafo y lo guarda en formato binario.
+
+    Args:
+        grafo: Diccionario {nodo: [(vecino, costo), ...]} o un GrafoCompilado
+        ruta: Ruta del archivo de salida
+
+    Returns:
+        GrafoCompilado: El grafo compilado que se guardó
+    """
+    compilado = grafo if isinstance(grafo, GrafoCompilado) else GrafoCompilado.desde_diccionario(grafo)
+    compilado.guardar(ruta)
+    return compilado
+
+
+def convertir_json(ruta_json: str, ruta: str) -> GrafoCompilado:
+    """
+    Convierte un grafo guardado como JSON {"nodo": [["vecino", costo], ...]} al formato binario.
+
+    Args:
+        ruta_json: Ruta del archivo JSON
+        ruta: Ruta del archivo de salida
+
+    Returns:
+        GrafoCompilado: El grafo compilado que se guardó
+
+    Raises:
+        ValueError: Si el JSON no tiene la forma de un grafo
+    """
+    with open(ruta_json, encoding='utf-8') as archivo:
+        datos = json.load(archivo)
+
+    if not isinstance(datos, dict):
+        raise ValueError(f"{ruta_json} no contiene un objeto {{nodo: [[vecino, costo], ...]}}")
+
+    grafo = {
+        str(nodo): [(str(vecino), float(costo)) for vecino, costo in vecinos]
+        for nodo, vecinos in datos.items()
+    }
+    return convertir_diccionario(grafo, ruta)
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        compilado = convertir_json(sys.argv[1], sys.argv[2])
+        print(f"{sys.argv[2]}: {compilado.num_nodos} nodos, {compilado.num_aristas} aristas, "
+              f"{compilado.tamano_binario()} bytes")
+        sys.exit(0)
+
+    import os
+    import tempfile
+
+    from algoritmos_busqueda import ProblemaDeRuta, busqueda_costo_uniforme
+
+    grafo_rumania = {
+        'Oradea': [('Zerind', 71), ('Sibiu', 151)],
+        'Zerind': [('Oradea', 71), ('Sibiu', 99), ('Arad', 75)],
+        'Arad': [('Zerind', 75), ('Sibiu', 140), ('Timisoara', 118)],
+        'Timisoara': [('Arad', 118), ('Lugoj', 111)],
+        'Lugoj': [('Timisoara', 111), ('Mehadia', 70)],
+        'Mehadia': [('Lugoj', 70), ('Drobeta', 75)],
+        'Drobeta': [('Mehadia', 75)],
+        'Sibiu': [('Oradea', 151), ('Zerind', 99), ('Arad', 140), ('Fagaras', 99), ('Rimnicu Vilcea', 80)],
+        'Rimnicu Vilcea': [('Sibiu', 80), ('Craiova', 146), ('Pitesti', 97)],
+        'Craiova': [('Rimnicu Vilcea', 146), ('Pitesti', 138), ('Drobeta', 120)],
+        'Fagaras': [('Sibiu', 99), ('Bucharest', 211)],
+        'Pitesti': [('Rimnicu Vilcea', 97), ('Craiova', 138), ('Bucharest', 101)],
+        'Bucharest': [('Fagaras', 211), ('Pitesti', 101), ('Giurgiu', 90), ('Urziceni', 85)],
+        'Giurgiu': [('Bucharest', 90)],
+        'Urziceni': [('Bucharest', 85), ('Hirsova', 98), ('Vaslui', 142)],
+        'Hirsova': [('Urziceni', 98), ('Eforie', 86)],
+        'Eforie': [('Hirsova', 86)],
+        'Vaslui': [('Urziceni', 142), ('Iasi', 92)],
+        'Iasi': [('Vaslui', 92), ('Neamt', 87)],
+        'Neamt': [('Iasi', 87)]
+    }
+
+    ruta = os.path.join(tempfile.mkdtemp(), "rumania.grf")
+    convertir_diccionario(grafo_rumania, ruta)
+    grafo = GrafoCompilado.cargar(ruta)
+
+    print(f"=== {ruta} ({os.path.getsize(ruta)} bytes) ===\n")
+    print("Vecinos de Arad:", grafo['Arad'])
+    print()
+    print(busqueda_costo_uniforme(ProblemaDeRuta(grafo, 'Arad', 'Bucharest')))
@@ -0,0 +1,218 @@
+"""
+Módulo: Espacios de Estados Implícitos
+Descripción: Interfaz para problemas cuyo espacio de estados no se enumera de antemano
+(puzzles, configuraciones), definidos por un estado inicial, una función de sucesores y
+una prueba de objetivo.
+
+BFS, DFS, UCS e IDDFS de algoritmos_busqueda.py aceptan, en lugar de un ProblemaDeRuta,
+cualquier problema con la forma de ``EspacioEstados`` (un ``estado_inicial``, ``sucesores``
+y ``es_objetivo``), herede o no de ``ProblemaImplicito``. No crean un objeto por nodo: guardan los estados tal cual como
+claves de diccionarios (padre, costo, profundidad), así que conviene codificarlos como
+enteros empaquetados (ver ``empaquetar``) o bytes.
+
+Un entero empaquetado es además su propio hash: en CPython, el hash de un entero menor que
+2^61 - 1 es el mismo entero, de modo que la detección de duplicados no tiene colisiones ni
+recorre el estado, y un sucesor se obtiene del estado anterior con unas pocas operaciones
+de bits (una actualización incremental, como en el hashing de Zobrist).
+"""
+
+from typing import Any, Dict, Hashable, Iterable, List, Protocol, Sequence, Tuple, runtime_checkable
+
+
+@runtime_checkable
+class EspacioEstados(Protocol):
+    """
+    Lo que las búsquedas necesitan de un problema implícito.
+
+    Las búsquedas reconocen un problema implícito por estos miembros y no por su clase,
+    así que sirve cualquier objeto que los tenga (ver ``como_problema_implicito``).
+    """
+
+    estado_inicial: Any
+
+    def sucesores(self, estado: Any) -> Iterable[Tuple[Any, float]]:
+        ...
+
+    def es_objetivo(self, estado: Any) -> bool:
+        ...
+
+
+class ProblemaImplicito:
+    """
+    Problema de búsqueda definido por sus sucesores.
+
+    Las subclases implementan ``sucesores`` y ``es_objetivo``. Los estados deben ser
+    hashables, inmutables y comparables entre sí (UCS desempata por estado), como enteros,
+    bytes o tuplas.
+    """
+
+    def __init__(self, estado_inicial: Hashable):
+        """
+        Inicializa el problema.
+
+        Args:
+            estado_inicial: El estado inicial
+        """
+        self.estado_inicial = estado_inicial
+
+    def sucesores(self, estado: Any) -> Iterable[Tuple[Any, float]]:
+        """Devuelve los pares (sucesor, costo del paso) de ``estado``."""
+        raise NotImplementedError
+
+    def es_objetivo(self, estado: Any) -> bool:
+        """Indica si ``estado`` es un estado objetivo."""
+        raise NotImplementedError
+
+    def describir(self, estado: Any) -> str:
+        """Representación legible de un estado, usada en el camino de la solución."""
+        return str(estado)
+
+    def costo_paso(self, origen: Any, destino: Any) -> float:
+        """
+        Costo del paso más barato de ``origen`` a ``destino``.
+
+        Raises:
+            ValueError: Si ``destino`` no es sucesor de ``origen``
+        """
+        return min(costo for sucesor, costo in self.sucesores(origen) if sucesor == destino)
+
+    def costo_camino(self, estados: Sequence[Any]) -> float:
+        """Costo de recorrer ``estados`` en orden."""
+        return sum(self.costo_paso(origen, destino) for origen, destino in zip(estados, estados[1:]))
+
+    def reconstruir_camino(self, estados: Sequence[Any]) -> List[Tuple[str, str]]:
+        """
+        Traduce una secuencia de estados al formato de camino de ResultadoBusqueda.
+
+        Args:
+            estados: Estados del camino, del inicial al final
+
+        Returns:
+            List[Tuple[str, str]]: Lista de (estado, acción) con los estados descritos
+        """
+        nombres = [self.describir(estado) for estado in estados]
+        camino = [(nombres[0], "Inicio")]
+        for anterior, actual in zip(nombres, nombres[1:]):
+            camino.append((actual, f"{anterior} → {actual}"))
+        return camino
+
+
+class _ProblemaAdaptado(ProblemaImplicito):
+    """ProblemaImplicito que delega en otro objeto con la forma de EspacioEstados."""
+
+    def __init__(self, problema: EspacioEstados):
+        super().__init__(problema.estado_inicial)
+        self.sucesores = problema.sucesores
+        self.es_objetivo = problema.es_objetivo
+        self.describir = getattr(problema, 'describir', self.describir)
+        self.costo_paso = getattr(problema, 'costo_paso', self.costo_paso)
+
+
+def como_problema_implicito(problema: EspacioEstados) -> ProblemaImplicito:
+    """
+    Completa un problema con los métodos por defecto de ProblemaImplicito.
+
+    Args:
+        problema: Un objeto con la forma de EspacioEstados
+
+    Returns:
+        ProblemaImplicito: El propio ``problema`` si ya tiene ``describir``,
+        ``costo_camino`` y ``reconstruir_camino``; si no, uno que delega en él
+    """
+    if all(hasattr(problema, metodo) for metodo in ('describir', 'costo_camino', 'reconstruir_camino')):
+        return problema
+    return _ProblemaAdaptado(problema)
+
+
+def estados_camino(padres: Dict[Any, Any], estado: Any) -> List[Any]:
+    """
+    Sigue los padres desde ``estado`` hasta la raíz (cuyo padre es None).
+
+    Args:
+        padres: Diccionario {estado: estado padre}
+        estado: El último estado del camino
+
+    Returns:
+        List: Estados del camino, de la raíz a ``estado``
+    """
+    estados = []
+    while estado is not None:
+        estados.append(estado)
+        estado = padres[estado]
+    estados.reverse()
+    return estados
+
+
+def empaquetar(valores: Iterable[int], bits: int = 4) -> int:
+    """
+    Empaqueta valores pequeños en un entero, ``bits`` bits por valor (el primero en los
+    bits más bajos).
+
+    Args:
+        valores: Valores entre 0 y 2^bits - 1
+        bits: Bits por valor
+
+    Returns:
+        int: El entero empaquetado
+
+    Raises:
+        ValueError: Si algún valor no cabe en ``bits`` bits
+    """
+    estado = 0
+    for posicion, valor in enumerate(valores):
+        if not 0 <= valor < 1 << bits:
+            raise ValueError(f"El valor {valor} no cabe en {bits} bits")
+        estado |= valor << (bits * posicion)
+    return estado
+
+
+def desempaquetar(estado: int, cantidad: int, bits: int = 4) -> List[int]:
+    """
+    Inversa de ``empaquetar``.
+
+    Args:
+        estado: El entero empaquetado
+        cantidad: Número de valores
+        bits: Bits por valor
+
+    Returns:
+        List[int]: Los valores, el primero de los bits más bajos
+    """
+    mascara = (1 << bits) - 1
+    return [(estado >> (bits * posicion)) & mascara for posicion in range(cantidad)]
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from algoritmos_busqueda import busqueda_amplitud, busqueda_costo_uniforme
+
+    class Jarras(ProblemaImplicito):
+        """Medir 4 litros con jarras de 3 y 5 litros; el estado empaqueta ambos niveles."""
+
+        CAPACIDADES = (3, 5)
+
+        def __init__(self):
+            super().__init__(empaquetar((0, 0)))
+
+        def sucesores(self, estado: int) -> Iterable[Tuple[int, float]]:
+            a, b = desempaquetar(estado, 2)
+            ca, cb = self.CAPACIDADES
+            trasvase_ab = min(a, cb - b)
+            trasvase_ba = min(b, ca - a)
+            for nuevo in ((ca, b), (a, cb), (0, b), (a, 0),
+                          (a - trasvase_ab, b + trasvase_ab), (a + trasvase_ba, b - trasvase_ba)):
+                # Llenar o vaciar cuesta los litros movidos desde o hacia el grifo
+                yield empaquetar(nuevo), 1 + abs(sum(nuevo) - a - b)
+
+        def es_objetivo(self, estado: int) -> bool:
+            return 4 in desempaquetar(estado, 2)
+
+        def describir(self, estado: int) -> str:
+            return "({}, {})".format(*desempaquetar(estado, 2))
+
+    print("=== Jarras de 3 y 5 litros: menos pasos (BFS) ===")
+    print(busqueda_amplitud(Jarras()))
+    print()
+
+    print("=== Jarras de 3 y 5 litros: menos agua movida (UCS) ===")
+    print(busqueda_costo_uniforme(Jarras()))
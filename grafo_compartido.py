@@ -0,0 +1,267 @@
+"""
+Módulo: Grafo Compartido
+Descripción: Almacén de un grafo compilado en memoria compartida con nombre, para que
+varios procesos ejecuten búsquedas sobre él sin copiarlo ni serializarlo.
+
+El proceso creador escribe una sola vez el grafo con el formato binario de
+``GrafoCompilado.escribir_binario``. Los demás procesos lo abren por nombre en modo de
+solo lectura y obtienen un ``GrafoCompilado`` cuyos arreglos son vistas sobre esa
+memoria, utilizable directamente con ``ProblemaDeRuta`` y cualquier ``busqueda_*``.
+
+Ciclo de vida:
+
+- El creador es el único que elimina el segmento: al llamar a ``cerrar``, al salir
+  del bloque ``with``, cuando el objeto se recolecta o al terminar el intérprete.
+  Si el creador muere sin hacerlo, el resource tracker de multiprocessing lo elimina
+  cuando terminan todos los procesos que lo comparten.
+- Los procesos que se adjuntan mapean el segmento en solo lectura y no se registran
+  en el resource tracker, así que si fallan o terminan no pueden borrarlo ni
+  modificarlo; el sistema libera su mapeo al terminar.
+
+Cómo se adjunta cada proceso, según la plataforma (ver ``abrir_segmento``, que también
+usa amplitud_paralela.py para sus trabajadores):
+
+- Python 3.13 o posterior: ``SharedMemory(name=..., track=False)``, la API pública que
+  no registra el segmento; el grafo se lee a través de una vista de solo lectura.
+- POSIX con Python anterior: ``shm_open`` del módulo privado ``_posixshmem`` de
+  CPython (el mismo que usa ``shared_memory``) y ``mmap``, en solo lectura salvo que se
+  pida escritura, porque la API pública siempre registra el segmento. Si ese módulo no
+  existe, se abre con ``SharedMemory`` y se quita del resource tracker con
+  ``resource_tracker.unregister``; en ese caso, si el proceso comparte el tracker del
+  creador (el propio creador o los procesos que arranca), el tracker olvida también el
+  registro del creador y deja de eliminar el segmento si este muere.
+- Windows: el sistema cuenta las referencias al segmento y no hay resource tracker.
+"""
+
+import mmap
+import multiprocessing
+import os
+import sys
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from algoritmos_busqueda import ProblemaDeRuta, ResultadoBusqueda
+from grafo_compilado import GrafoCompilado
+
+_posixshmem = None
+if os.name == "posix" and sys.version_info < (3, 13):
+    try:
+        import _posixshmem
+    except ImportError:
+        pass
+
+Grafo = Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado]
+
+
+def abrir_segmento(nombre: str, escritura: bool = False) -> Tuple[Any, Any]:
+    """
+    Abre un segmento de memoria compartida existente sin registrarlo en el resource
+    tracker (ver la descripción del módulo), para que ningún proceso adjunto pueda
+    eliminarlo al terminar.
+
+    Args:
+        nombre: Nombre del segmento
+        escritura: Si es False, el segmento solo se puede leer
+
+    Returns:
+        Tuple[Any, Any]: (recurso, buffer); ``recurso.close()`` deshace el mapeo
+
+    Raises:
+        FileNotFoundError: Si no existe un segmento con ese nombre
+    """
+    if sys.version_info >= (3, 13):
+        recurso = shared_memory.SharedMemory(name=nombre, track=False)
+        return recurso, recurso.buf if escritura else recurso.buf.toreadonly()
+
+    if _posixshmem is not None:
+        modo, acceso = (os.O_RDWR, mmap.ACCESS_WRITE) if escritura else (os.O_RDONLY, mmap.ACCESS_READ)
+        descriptor = _posixshmem.shm_open(nombre if nombre.startswith("/") else "/" + nombre, modo)
+        try:
+            recurso = mmap.mmap(descriptor, os.fstat(descriptor).st_size, access=acceso)
+        finally:
+            os.close(descriptor)
+        return recurso, recurso
+
+    recurso = shared_memory.SharedMemory(name=nombre)
+    if os.name == "posix":
+        resource_tracker.unregister("/" + recurso.name, "shared_memory")
+    return recurso, recurso.buf if escritura else recurso.buf.toreadonly()
+
+
+class GrafoCompartido:
+    """
+    Grafo compilado en un segmento de memoria compartida.
+
+    Se obtiene con ``GrafoCompartido.crear`` (proceso dueño) o ``GrafoCompartido.adjuntar``
+    (cualquier otro proceso); ``grafo`` es el ``GrafoCompilado`` sobre el que buscar.
+    """
+
+    def __init__(self, nombre: str, grafo: GrafoCompilado, propietario: bool, liberar: Callable, recurso):
+        """Use ``crear`` o ``adjuntar``."""
+        self.nombre = nombre
+        self.grafo: Optional[GrafoCompilado] = grafo
+        self.propietario = propietario
+        self._finalizador = weakref.finalize(self, liberar, recurso)
+
+    @classmethod
+    def crear(cls, grafo: Grafo, nombre: Optional[str] = None) -> 'GrafoCompartido':
+        """
+        Copia el grafo a un segmento nuevo de memoria compartida.
+
+        Args:
+            grafo: Diccionario {nodo: [(vecino, costo), ...]} o un GrafoCompilado
+            nombre: Nombre del segmento (por defecto, uno aleatorio)
+
+        Returns:
+            GrafoCompartido: El almacén, dueño del segmento
+        """
+        compilado = grafo if isinstance(grafo, GrafoCompilado) else GrafoCompilado.desde_diccionario(grafo)
+        memoria = shared_memory.SharedMemory(name=nombre, create=True, size=compilado.tamano_binario())
+
+        try:
+            compilado.escribir_binario(memoria.buf)
+        except BaseException:
+            _eliminar(memoria)
+            raise
+
+        # El dueño busca sobre su propio grafo compilado; la copia compartida es para los demás
+        return cls(memoria.name, compilado, True, _eliminar, memoria)
+
+    @classmethod
+    def adjuntar(cls, nombre: str) -> 'GrafoCompartido':
+        """
+        Abre en solo lectura y sin copias un grafo creado con ``crear``.
+
+        Args:
+            nombre: Nombre del segmento (``GrafoCompartido.nombre`` del creador)
+
+        Returns:
+            GrafoCompartido: El almacén; ``cerrar`` solo deshace el mapeo
+
+        Raises:
+            FileNotFoundError: Si no existe un segmento con ese nombre
+            ValueError: Si el segmento no contiene un grafo compilado
+        """
+        recurso, buffer = abrir_segmento(nombre)
+        return cls(nombre, GrafoCompilado.desde_binario(buffer), False, _desadjuntar, recurso)
+
+    def problema(self, estado_inicial: str, estado_objetivo: str) -> ProblemaDeRuta:
+        """Crea un ProblemaDeRuta sobre el grafo compartido."""
+        return ProblemaDeRuta(self.grafo, estado_inicial, estado_objetivo)
+
+    def cerrar(self) -> None:
+        """Libera el almacén; si es el dueño, además elimina el segmento."""
+        self.grafo = None
+        self._finalizador()
+
+    def __enter__(self) -> 'GrafoCompartido':
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+
+def _eliminar(memoria: shared_memory.SharedMemory) -> None:
+    """Cierra y elimina el segmento del dueño (tolera que ya no exista)."""
+    memoria.close()
+    try:
+        memoria.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _desadjuntar(recurso) -> None:
+    """Deshace el mapeo de un proceso adjunto."""
+    try:
+        recurso.close()
+    except BufferError:
+        # Aún hay vistas del grafo en uso: el mapeo se libera cuando desaparezcan
+        pass
+
+
+# Almacén adjuntado por cada proceso trabajador de ``buscar_en_procesos``
+_almacen_trabajador: Optional[GrafoCompartido] = None
+
+
+def _inicializar_trabajador(nombre: str) -> None:
+    global _almacen_trabajador
+    _almacen_trabajador = GrafoCompartido.adjuntar(nombre)
+
+
+def _buscar_en_trabajador(
+    algoritmo: Callable[..., ResultadoBusqueda],
+    estado_inicial: str,
+    estado_objetivo: str,
+    parametros: dict
+) -> ResultadoBusqueda:
+    return algoritmo(_almacen_trabajador.problema(estado_inicial, estado_objetivo), **parametros)
+
+
+def buscar_en_procesos(
+    almacen: GrafoCompartido,
+    algoritmo: Callable[..., ResultadoBusqueda],
+    pares: Iterable[Tuple[str, str]],
+    num_procesos: Optional[int] = None,
+    **parametros
+) -> List[ResultadoBusqueda]:
+    """
+    Resuelve muchos pares (inicial, objetivo) repartiéndolos entre varios procesos.
+
+    Cada trabajador se adjunta una vez al almacén; por tarea solo viajan el algoritmo
+    (por referencia), los dos estados y los parámetros.
+
+    Args:
+        almacen: El grafo compartido
+        algoritmo: Función de búsqueda importable (busqueda_amplitud, busqueda_a_estrella, ...)
+        pares: Pares (estado inicial, estado objetivo)
+        num_procesos: Número de trabajadores (por defecto, el número de CPUs)
+        **parametros: Parámetros adicionales del algoritmo
+
+    Returns:
+        List[ResultadoBusqueda]: Un resultado por par, en el mismo orden
+    """
+    tareas = [(algoritmo, inicial, objetivo, parametros) for inicial, objetivo in pares]
+
+    with multiprocessing.Pool(num_procesos, initializer=_inicializar_trabajador, initargs=(almacen.nombre,)) as grupo:
+        return grupo.starmap(_buscar_en_trabajador, tareas)
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from algoritmos_busqueda import busqueda_amplitud, busqueda_costo_uniforme
+
+    grafo_rumania = {
+        'Oradea': [('Zerind', 71), ('Sibiu', 151)],
+        'Zerind': [('Oradea', 71), ('Sibiu', 99), ('Arad', 75)],
+        'Arad': [('Zerind', 75), ('Sibiu', 140), ('Timisoara', 118)],
+        'Timisoara': [('Arad', 118), ('Lugoj', 111)],
+        'Lugoj': [('Timisoara', 111), ('Mehadia', 70)],
+        'Mehadia': [('Lugoj', 70), ('Drobeta', 75)],
+        'Drobeta': [('Mehadia', 75)],
+        'Sibiu': [('Oradea', 151), ('Zerind', 99), ('Arad', 140), ('Fagaras', 99), ('Rimnicu Vilcea', 80)],
+        'Rimnicu Vilcea': [('Sibiu', 80), ('Craiova', 146), ('Pitesti', 97)],
+        'Craiova': [('Rimnicu Vilcea', 146), ('Pitesti', 138), ('Drobeta', 120)],
+        'Fagaras': [('Sibiu', 99), ('Bucharest', 211)],
+        'Pitesti': [('Rimnicu Vilcea', 97), ('Craiova', 138), ('Bucharest', 101)],
+        'Bucharest': [('Fagaras', 211), ('Pitesti', 101), ('Giurgiu', 90), ('Urziceni', 85)],
+        'Giurgiu': [('Bucharest', 90)],
+        'Urziceni': [('Bucharest', 85), ('Hirsova', 98), ('Vaslui', 142)],
+        'Hirsova': [('Urziceni', 98), ('Eforie', 86)],
+        'Eforie': [('Hirsova', 86)],
+        'Vaslui': [('Urziceni', 142), ('Iasi', 92)],
+        'Iasi': [('Vaslui', 92), ('Neamt', 87)],
+        'Neamt': [('Iasi', 87)]
+    }
+
+    pares = [('Arad', 'Bucharest'), ('Oradea', 'Eforie'), ('Timisoara', 'Neamt')]
+
+    with GrafoCompartido.crear(grafo_rumania) as almacen:
+        print(f"Segmento '{almacen.nombre}' ({almacen.grafo.tamano_binario()} bytes)\n")
+
+        for algoritmo in (busqueda_amplitud, busqueda_costo_uniforme):
+            print(f"=== {algoritmo.__name__} en 2 procesos ===")
+            for (inicial, objetivo), resultado in zip(pares, buscar_en_procesos(almacen, algoritmo, pares, 2)):
+                print(f"{inicial} → {objetivo}: {resultado.costo_total:.0f} km, "
+                      f"{len(resultado.camino) - 1} pasos")
+            print()
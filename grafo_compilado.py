@@ -0,0 +1,526 @@
+"""
+Módulo: Grafo Compilado
+Descripción: Representación compacta (CSR) de un grafo con los nodos internados a índices enteros.
+"""
+
+import hashlib
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from collections.abc import Sequence as SecuenciaAbstracta
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Formato binario (ver ``GrafoCompilado.escribir_binario``). Cabecera: firma, versión,
+# orden de bytes (0 little, 1 big), n, m y bytes de la tabla de nombres. Después, cada
+# sección alineada a 8 bytes: desplazamientos (int64, n + 1), destinos (int32, m),
+# costos (float64, m), inicio de cada nombre (int64, n + 1), ids de los nodos ordenados
+# por nombre (int32, n) y nombres en UTF-8.
+_FORMATO_CABECERA = '<4sHBxqqq'
+_FIRMA = b'GRF1'
+_VERSION = 2
+
+
+class GrafoCompilado(Mapping):
+    """
+    Grafo en formato CSR (compressed sparse row).
+
+    Cada nombre de nodo se interna a un índice entero ``0..n-1``. Los vecinos del
+    nodo ``i`` ocupan las posiciones ``desplazamientos[i]:desplazamientos[i + 1]``
+    de los arreglos ``destinos`` y ``costos``.
+
+    Además se comporta como un diccionario de solo lectura
+    ``{nodo: [(vecino, costo), ...]}``, por lo que puede pasarse directamente
+    a ``ProblemaDeRuta`` en lugar del diccionario original.
+    """
+
+    def __init__(
+        self,
+        nombres: Sequence[str],
+        desplazamientos: Sequence[int],
+        destinos: Sequence[int],
+        costos: Sequence[float],
+        indices: Optional[Dict[str, int]] = None
+    ):
+        """
+        Inicializa el grafo a partir de sus arreglos.
+
+        Args:
+            nombres: Nombre de cada nodo, indexado por su id
+            desplazamientos: Inicio de la lista de vecinos de cada nodo (longitud n + 1)
+            destinos: Id del nodo destino de cada arista
+            costos: Costo de cada arista
+            indices: Diccionario {nombre: id} ya construido (se calcula si es None)
+        """
+        self.nombres = nombres
+        self.desplazamientos = desplazamientos
+        self.destinos = destinos
+        self.costos = costos
+        self._indices = indices
+        self._invertido: Optional['GrafoCompilado'] = None
+        self._huella: Optional[str] = None
+        self._perfil_costos: Optional[Tuple[float, float, bool]] = None
+
+    @classmethod
+    def desde_diccionario(cls, grafo: Dict[str, List[Tuple[str, float]]]) -> 'GrafoCompilado':
+        """
+        Compila un grafo en formato diccionario.
+
+        Los ids se asignan en el orden de las claves del diccionario; los nodos que
+        solo aparecen como vecinos reciben ids a continuación. El orden de los vecinos
+        de cada nodo se conserva.
+
+        Args:
+            grafo: Diccionario {nodo: [(vecino, costo), ...]}
+
+        Returns:
+            GrafoCompilado: El grafo compilado
+        """
+        nombres: List[str] = list(grafo)
+        indices = {nombre: i for i, nombre in enumerate(nombres)}
+
+        for vecinos in grafo.values():
+            for vecino, _ in vecinos:
+                if vecino not in indices:
+                    indices[vecino] = len(nombres)
+                    nombres.append(vecino)
+
+        desplazamientos = array('q', [0])
+        destinos = array('i')
+        costos = array('d')
+
+        for nombre in nombres:
+            for vecino, costo in grafo.get(nombre, ()):
+                destinos.append(indices[vecino])
+                costos.append(costo)
+            desplazamientos.append(len(destinos))
+
+        return cls(nombres, desplazamientos, destinos, costos, indices)
+
+    @classmethod
+    def desde_aristas(
+        cls,
+        nombres: Sequence[str],
+        origenes: Sequence[int],
+        destinos: Sequence[int],
+        costos: Sequence[float],
+        deduplicar: bool = True,
+        simetrizar: bool = False,
+        indices: Optional[Dict[str, int]] = None
+    ) -> 'GrafoCompilado':
+        """
+        Compila un grafo a partir de una lista de aristas con los nodos ya internados a ids.
+
+        Los vecinos de cada nodo conservan el orden en que aparecen sus aristas en la lista
+        (al deduplicar, el de la arista que se conserva).
+
+        Args:
+            nombres: Nombre de cada nodo, indexado por su id
+            origenes: Id del nodo de partida de cada arista
+            destinos: Id del nodo de llegada de cada arista
+            costos: Costo de cada arista
+            deduplicar: Conservar solo la arista más barata entre cada par (origen, destino)
+                (a igual costo, la primera)
+            simetrizar: Agregar la arista inversa de cada arista (antes de deduplicar)
+            indices: Diccionario {nombre: id} ya construido (se calcula si es None)
+
+        Returns:
+            GrafoCompilado: El grafo compilado
+        """
+        n = len(nombres)
+        origenes = np.asarray(origenes, dtype=np.int32)
+        destinos = np.asarray(destinos, dtype=np.int32)
+        costos = np.asarray(costos, dtype=np.float64)
+
+        if simetrizar:
+            origenes, destinos = np.concatenate((origenes, destinos)), np.concatenate((destinos, origenes))
+            costos = np.concatenate((costos, costos))
+
+        if deduplicar and len(origenes):
+            # Ordenar por par y, dentro de cada par, por costo (estable: a igual costo, la
+            # primera); la primera arista de cada par es la elegida
+            pares = origenes.astype(np.int64) * n + destinos
+            orden = np.lexsort((costos, pares))
+            pares = pares[orden]
+            primeras = np.ones(len(orden), dtype=bool)
+            np.not_equal(pares[1:], pares[:-1], out=primeras[1:])
+            del pares
+            elegidas = orden[primeras]
+            del orden, primeras
+            elegidas.sort()
+            origenes, destinos, costos = origenes[elegidas], destinos[elegidas], costos[elegidas]
+
+        orden = np.argsort(origenes, kind='stable')
+        desplazamientos = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origenes, minlength=n), out=desplazamientos[1:])
+
+        return cls(
+            nombres,
+            _arreglo('q', desplazamientos),
+            _arreglo('i', destinos[orden]),
+            _arreglo('d', costos[orden]),
+            indices
+        )
+
+    @classmethod
+    def desde_binario(cls, buffer) -> 'GrafoCompilado':
+        """
+        Abre un grafo escrito con ``escribir_binario`` sin copiar sus arreglos.
+
+        Los arreglos son vistas ``memoryview`` sobre ``buffer`` y los nombres se decodifican
+        a medida que se consultan, así que ``buffer`` debe seguir abierto mientras se use
+        el grafo.
+
+        Args:
+            buffer: Objeto con protocolo de buffer (bytes, mmap, memoria compartida, ...)
+
+        Returns:
+            GrafoCompilado: El grafo
+
+        Raises:
+            ValueError: Si el buffer no contiene un grafo válido con el orden de bytes de
+                esta máquina
+        """
+        vista = memoryview(buffer).cast('B')
+        tamano_cabecera = struct.calcsize(_FORMATO_CABECERA)
+
+        if len(vista) < tamano_cabecera:
+            raise ValueError("El buffer no contiene un grafo compilado")
+
+        firma, version, orden, n, m, tamano_nombres = struct.unpack_from(_FORMATO_CABECERA, vista)
+
+        if firma != _FIRMA or version != _VERSION:
+            raise ValueError("El buffer no contiene un grafo compilado")
+        if orden != (0 if sys.byteorder == 'little' else 1):
+            raise ValueError("El grafo se escribió con otro orden de bytes")
+
+        secciones = []
+        for inicio, fin, formato in _secciones(n, m, tamano_nombres):
+            seccion = vista[inicio:fin]
+            secciones.append(seccion.cast(formato) if formato != 'B' else seccion)
+
+        desplazamientos, destinos, costos, inicios_nombres, orden_nombres, nombres = secciones
+        return cls(TablaNombres(inicios_nombres, nombres, orden_nombres), desplazamientos, destinos, costos)
+
+    @classmethod
+    def cargar(cls, ruta: str) -> 'GrafoCompilado':
+        """
+        Abre un grafo guardado con ``guardar`` proyectando el archivo en memoria.
+
+        No se lee nada por adelantado: el sistema carga las páginas del archivo a medida
+        que las búsquedas las tocan, y los nombres se localizan por búsqueda binaria sin
+        construir el diccionario {nombre: id}.
+
+        Args:
+            ruta: Ruta del archivo
+
+        Returns:
+            GrafoCompilado: El grafo (de solo lectura, respaldado por el archivo)
+
+        Raises:
+            ValueError: Si el archivo no contiene un grafo válido con el orden de bytes
+                de esta máquina
+        """
+        with open(ruta, 'rb') as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Las vistas del grafo mantienen vivo el mapa después de cerrar el archivo
+        return cls.desde_binario(mapa)
+
+    @property
+    def num_nodos(self) -> int:
+        """Número de nodos del grafo."""
+        return len(self.nombres)
+
+    @property
+    def num_aristas(self) -> int:
+        """Número de aristas dirigidas del grafo."""
+        return len(self.destinos)
+
+    @property
+    def indices(self) -> Dict[str, int]:
+        """Diccionario {nombre: id}; se construye la primera vez que se necesita."""
+        if self._indices is None:
+            self._indices = {nombre: i for i, nombre in enumerate(self.nombres)}
+        return self._indices
+
+    def indice(self, nombre: str) -> int:
+        """Devuelve el id de un nodo, o -1 si no pertenece al grafo."""
+        if self._indices is None and isinstance(self.nombres, TablaNombres) and isinstance(nombre, str):
+            return self.nombres.buscar(nombre)
+        return self.indices.get(nombre, -1)
+
+    def invertido(self) -> 'GrafoCompilado':
+        """
+        Obtiene el grafo con todas las aristas invertidas, con los mismos ids de nodo.
+
+        Se construye una sola vez (ordenamiento por conteo de los destinos) y se
+        conserva para las siguientes llamadas.
+
+        Returns:
+            GrafoCompilado: El grafo inverso
+        """
+        if self._invertido is None:
+            n, m = self.num_nodos, self.num_aristas
+            desplazamientos, destinos, costos = self.desplazamientos, self.destinos, self.costos
+
+            # Grado de entrada de cada nodo, acumulado en forma de desplazamientos
+            inicio = array('q', bytes(8 * (n + 1)))
+            for destino in destinos:
+                inicio[destino + 1] += 1
+            for i in range(n):
+                inicio[i + 1] += inicio[i]
+
+            posicion = array('q', inicio)
+            origenes = array('i', bytes(4 * m))
+            costos_inversos = array('d', bytes(8 * m))
+
+            for origen in range(n):
+                for k in range(desplazamientos[origen], desplazamientos[origen + 1]):
+                    p = posicion[destinos[k]]
+                    origenes[p] = origen
+                    costos_inversos[p] = costos[k]
+                    posicion[destinos[k]] = p + 1
+
+            invertido = GrafoCompilado(self.nombres, inicio, origenes, costos_inversos, self._indices)
+            invertido._invertido = self
+            self._invertido = invertido
+
+        return self._invertido
+
+    def huella(self) -> str:
+        """
+        Huella del contenido del grafo (nombres, desplazamientos, destinos y costos).
+
+        El grafo compilado no se modifica, así que la huella se calcula una sola vez.
+        """
+        if self._huella is None:
+            inicios_nombres, _, nombres = self._nombres_codificados()
+            resumen = hashlib.blake2b(digest_size=16)
+            for arreglo in (inicios_nombres, nombres, self.desplazamientos, self.destinos, self.costos):
+                resumen.update(arreglo)
+            self._huella = resumen.hexdigest()
+        return self._huella
+
+    def perfil_costos(self) -> Tuple[float, float, bool]:
+        """
+        Perfil de los costos de las aristas: (mínimo, máximo, todos enteros).
+
+        Se calcula una sola vez; un grafo sin aristas tiene el perfil (0, 0, True).
+        """
+        if self._perfil_costos is None:
+            costos = self.costos
+            if len(costos) == 0:
+                self._perfil_costos = (0.0, 0.0, True)
+            else:
+                self._perfil_costos = (
+                    min(costos), max(costos), all(costo % 1 == 0 for costo in costos)
+                )
+        return self._perfil_costos
+
+    def tamano_binario(self) -> int:
+        """Número de bytes que ocupa el grafo en el formato de ``escribir_binario``."""
+        return _secciones(self.num_nodos, self.num_aristas, len(self._nombres_codificados()[2]))[-1][1]
+
+    def escribir_binario(self, destino) -> int:
+        """
+        Escribe el grafo en un buffer escribible con un formato que ``desde_binario`` abre sin copias.
+
+        Args:
+            destino: Buffer escribible de al menos ``tamano_binario()`` bytes
+
+        Returns:
+            int: Número de bytes escritos
+        """
+        n, m = self.num_nodos, self.num_aristas
+        inicios_nombres, orden_nombres, nombres = self._nombres_codificados(ordenados=True)
+        vista = memoryview(destino).cast('B')
+        secciones = _secciones(n, m, len(nombres))
+
+        struct.pack_into(
+            _FORMATO_CABECERA, vista, 0, _FIRMA, _VERSION,
+            0 if sys.byteorder == 'little' else 1, n, m, len(nombres)
+        )
+
+        for (inicio, fin, formato), contenido in zip(
+            secciones,
+            (self.desplazamientos, self.destinos, self.costos, inicios_nombres, orden_nombres, nombres)
+        ):
+            if formato != 'B' and not (isinstance(contenido, array) and contenido.typecode == formato):
+                contenido = array(formato, contenido)
+            vista[inicio:fin] = memoryview(contenido).cast('B')
+
+        return secciones[-1][1]
+
+    def guardar(self, ruta: str) -> None:
+        """
+        Guarda el grafo en un archivo con el formato de ``escribir_binario``, para abrirlo con ``cargar``.
+
+        Args:
+            ruta: Ruta del archivo
+        """
+        tamano = self.tamano_binario()
+
+        with open(ruta, 'w+b') as archivo:
+            archivo.truncate(tamano)
+            with mmap.mmap(archivo.fileno(), tamano) as mapa:
+                self.escribir_binario(mapa)
+
+    def _nombres_codificados(self, ordenados: bool = False) -> Tuple[Sequence[int], Optional[Sequence[int]], bytes]:
+        """
+        Tabla de nombres en UTF-8: (inicio de cada nombre, ids ordenados por nombre, bytes concatenados).
+
+        Los ids ordenados solo se calculan si ``ordenados`` es True (o si ya están en la tabla).
+        """
+        if isinstance(self.nombres, TablaNombres) and (self.nombres.orden is not None or not ordenados):
+            return self.nombres.inicios, self.nombres.orden, self.nombres.datos
+
+        codificados = [nombre.encode('utf-8') for nombre in self.nombres]
+        inicios = array('q', [0])
+        for codificado in codificados:
+            inicios.append(inicios[-1] + len(codificado))
+        orden = array('i', sorted(range(len(codificados)), key=codificados.__getitem__)) if ordenados else None
+        return inicios, orden, b''.join(codificados)
+
+    def reconstruir_camino(self, ids: Sequence[int]) -> List[Tuple[str, str]]:
+        """
+        Traduce una secuencia de ids al formato de camino de ``Nodo.obtener_camino``.
+
+        Args:
+            ids: Ids de los nodos del camino, desde el inicial hasta el final
+
+        Returns:
+            List[Tuple[str, str]]: Lista de (estado, acción) que forma el camino
+        """
+        nombres = self.nombres
+        camino = [(nombres[ids[0]], "Inicio")]
+
+        for anterior, actual in zip(ids, ids[1:]):
+            camino.append((nombres[actual], f"{nombres[anterior]} → {nombres[actual]}"))
+
+        return camino
+
+    # Vista de solo lectura compatible con el formato diccionario
+
+    def __getitem__(self, nombre: str) -> List[Tuple[str, float]]:
+        i = self.indices[nombre]
+        inicio, fin = self.desplazamientos[i], self.desplazamientos[i + 1]
+        return [
+            (self.nombres[self.destinos[k]], self.costos[k])
+            for k in range(inicio, fin)
+        ]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.nombres)
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+    def __contains__(self, nombre: object) -> bool:
+        return self.indice(nombre) >= 0
+
+
+class TablaNombres(SecuenciaAbstracta):
+    """
+    Secuencia de nombres de nodo almacenada en UTF-8 dentro de un buffer.
+
+    Cada nombre se decodifica al consultarlo, así que abrir un grafo binario no
+    requiere crear un objeto ``str`` por nodo.
+    """
+
+    def __init__(self, inicios: Sequence[int], datos, orden: Optional[Sequence[int]] = None):
+        """
+        Args:
+            inicios: Posición de inicio de cada nombre en ``datos`` (longitud n + 1)
+            datos: Nombres concatenados en UTF-8 (objeto con protocolo de buffer)
+            orden: Ids de los nombres ordenados por sus bytes UTF-8 (para ``buscar``)
+        """
+        self.inicios = inicios
+        self.datos = datos
+        self.orden = orden
+
+    def buscar(self, nombre: str) -> int:
+        """
+        Devuelve el id de un nombre por búsqueda binaria sobre ``orden``, o -1 si no está.
+
+        Raises:
+            ValueError: Si la tabla no tiene el orden de los nombres
+        """
+        if self.orden is None:
+            raise ValueError("La tabla de nombres no está ordenada")
+
+        inicios, datos, orden = self.inicios, self.datos, self.orden
+        buscado = nombre.encode('utf-8')
+        bajo, alto = 0, len(orden)
+
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            i = orden[medio]
+            if bytes(datos[inicios[i]:inicios[i + 1]]) < buscado:
+                bajo = medio + 1
+            else:
+                alto = medio
+
+        if bajo < len(orden):
+            i = orden[bajo]
+            if bytes(datos[inicios[i]:inicios[i + 1]]) == buscado:
+                return i
+        return -1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        return bytes(self.datos[self.inicios[i]:self.inicios[i + 1]]).decode('utf-8')
+
+    def __len__(self) -> int:
+        return len(self.inicios) - 1
+
+
+def _arreglo(formato: str, datos: np.ndarray) -> array:
+    """Copia un arreglo NumPy contiguo a un ``array.array`` sin pasar por un bytes intermedio."""
+    arreglo = array(formato)
+    arreglo.frombytes(memoryview(datos).cast('B'))
+    return arreglo
+
+
+def _secciones(n: int, m: int, tamano_nombres: int) -> List[Tuple[int, int, str]]:
+    """(inicio, fin, formato) de cada sección del formato binario, alineadas a 8 bytes."""
+    secciones = []
+    posicion = struct.calcsize(_FORMATO_CABECERA)
+
+    for longitud, formato in ((n + 1, 'q'), (m, 'i'), (m, 'd'), (n + 1, 'q'), (n, 'i'), (tamano_nombres, 'B')):
+        posicion = (posicion + 7) & ~7
+        fin = posicion + longitud * struct.calcsize(formato)
+        secciones.append((posicion, fin, formato))
+        posicion = fin
+
+    return secciones
+
+
+def huella_grafo(grafo: Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado]) -> str:
+    """
+    Calcula una huella del contenido de un grafo.
+
+    Dos grafos con la misma huella tienen los mismos nodos, aristas, costos y orden
+    de vecinos (el orden influye en el resultado de BFS y DFS).
+
+    Args:
+        grafo: Diccionario {nodo: [(vecino, costo), ...]} o un GrafoCompilado
+
+    Returns:
+        str: Huella hexadecimal de 128 bits
+    """
+    if isinstance(grafo, GrafoCompilado):
+        return grafo.huella()
+
+    resumen = hashlib.blake2b(digest_size=16)
+    for nodo, vecinos in grafo.items():
+        # repr escapa los saltos de línea, así que el separador no es ambiguo
+        resumen.update(repr((nodo, vecinos)).encode('utf-8'))
+        resumen.update(b'\n')
+    return resumen.hexdigest()
@@ -0,0 +1,409 @@
+"""
+Módulo: Jerarquías de Contracción (Contraction Hierarchies)
+Descripción: Índice precalculado para consultas de camino mínimo muy rápidas sobre un grafo fijo.
+
+La construcción contrae los nodos uno a uno, en orden de importancia creciente, y añade
+atajos (shortcuts) que preservan las distancias entre los nodos que quedan. Una consulta
+es una búsqueda bidireccional que solo sube en la jerarquía, por lo que visita muy pocos
+nodos. Cada atajo recuerda el nodo contraído que reemplaza, lo que permite desempaquetar
+el camino al mismo formato (estado, acción) que produce ``Nodo.obtener_camino``.
+"""
+
+import heapq
+import math
+from array import array
+from typing import Dict, List, Tuple, Union
+
+from algoritmos_busqueda import ProblemaDeRuta, ResultadoBusqueda
+from grafo_compilado import GrafoCompilado
+
+# Aristas de trabajo durante la construcción: {vecino: (costo, nodo intermedio o -1)}
+_Adyacencia = Dict[int, Tuple[float, int]]
+
+
+class JerarquiaContraccion:
+    """
+    Jerarquía de contracción de un grafo dirigido.
+
+    Tras la construcción, cada arista (original o atajo) une dos nodos de distinto
+    rango y se guarda en uno de dos grafos CSR:
+
+    - ``subida``: aristas u → w con rango(u) < rango(w), indexadas por u
+    - ``bajada``: aristas u → w con rango(u) > rango(w), indexadas por w
+      (es decir, invertidas, para la búsqueda hacia atrás desde el destino)
+
+    En ambos, ``medios[k]`` es el nodo que reemplaza el atajo k, o -1 si la arista es original.
+    """
+
+    def __init__(self, grafo: GrafoCompilado, rangos: array, subida: tuple, bajada: tuple):
+        """
+        Inicializa la jerarquía a partir de sus arreglos (ver ``construir``).
+
+        Args:
+            grafo: El grafo compilado original
+            rangos: Posición de cada nodo en el orden de contracción
+            subida: (desplazamientos, destinos, costos, medios) de las aristas ascendentes
+            bajada: (desplazamientos, origenes, costos, medios) de las aristas descendentes
+        """
+        self.grafo = grafo
+        self.rangos = rangos
+        self.subida = subida
+        self.bajada = bajada
+
+    @classmethod
+    def construir(
+        cls,
+        grafo: Union[Dict[str, List[Tuple[str, float]]], GrafoCompilado],
+        limite_testigos: int = 500
+    ) -> 'JerarquiaContraccion':
+        """
+        Ordena y contrae los nodos del grafo.
+
+        El orden se decide con el doble de la diferencia de aristas (atajos añadidos menos
+        aristas eliminadas) más el número de vecinos ya contraídos, actualizado de forma perezosa.
+
+        Args:
+            grafo: Diccionario {nodo: [(vecino, costo), ...]} o un GrafoCompilado
+            limite_testigos: Máximo de nodos que asienta cada búsqueda de caminos testigo
+
+        Returns:
+            JerarquiaContraccion: La jerarquía construida
+        """
+        compilado = grafo if isinstance(grafo, GrafoCompilado) else GrafoCompilado.desde_diccionario(grafo)
+        n = compilado.num_nodos
+        desplazamientos, destinos, costos = compilado.desplazamientos, compilado.destinos, compilado.costos
+
+        salientes: List[_Adyacencia] = [{} for _ in range(n)]
+        entrantes: List[_Adyacencia] = [{} for _ in range(n)]
+
+        for u in range(n):
+            for k in range(desplazamientos[u], desplazamientos[u + 1]):
+                w, costo = destinos[k], costos[k]
+                # Los lazos no forman parte de ningún camino mínimo; de las aristas paralelas basta la más barata
+                if w != u and costo < salientes[u].get(w, (math.inf,))[0]:
+                    salientes[u][w] = (costo, -1)
+                    entrantes[w][u] = (costo, -1)
+
+        vecinos_contraidos = [0] * n
+
+        def atajos_necesarios(v: int) -> List[Tuple[int, int, float]]:
+            """Atajos (u, w, costo) que hacen falta para contraer v sin alterar las distancias."""
+            atajos = []
+            salida = salientes[v]
+
+            if not salida:
+                return atajos
+
+            costo_maximo_salida = max(c for c, _ in salida.values())
+            for u, (costo_uv, _) in entrantes[v].items():
+                distancias = _busqueda_testigos(
+                    salientes, u, v, salida, costo_uv + costo_maximo_salida, limite_testigos
+                )
+                for w, (costo_vw, _) in salida.items():
+                    costo = costo_uv + costo_vw
+                    if w != u and distancias.get(w, math.inf) > costo:
+                        atajos.append((u, w, costo))
+
+            return atajos
+
+        def prioridad(atajos: List[Tuple[int, int, float]], v: int) -> int:
+            eliminadas = len(entrantes[v]) + len(salientes[v])
+            return 2 * (len(atajos) - eliminadas) + vecinos_contraidos[v]
+
+        cola = [(prioridad(atajos_necesarios(v), v), v) for v in range(n)]
+        heapq.heapify(cola)
+        rangos = array('i', bytes(4 * n))
+        siguiente_rango = 0
+
+        while cola:
+            _, v = heapq.heappop(cola)
+
+            # Actualización perezosa: si la prioridad empeoró, el nodo vuelve a la cola
+            atajos = atajos_necesarios(v)
+            actual = prioridad(atajos, v)
+            if cola and actual > cola[0][0]:
+                heapq.heappush(cola, (actual, v))
+                continue
+
+            for u, w, costo in atajos:
+                if costo < salientes[u].get(w, (math.inf,))[0]:
+                    salientes[u][w] = (costo, v)
+                    entrantes[w][u] = (costo, v)
+
+            rangos[v] = siguiente_rango
+            siguiente_rango += 1
+
+            # v sale del grafo restante; sus propias listas conservan las aristas hacia nodos de mayor rango
+            for u in entrantes[v]:
+                del salientes[u][v]
+                vecinos_contraidos[u] += 1
+            for w in salientes[v]:
+                del entrantes[w][v]
+                vecinos_contraidos[w] += 1
+
+        return cls(compilado, rangos, _a_csr(salientes), _a_csr(entrantes))
+
+    @property
+    def num_atajos(self) -> int:
+        """Número de atajos añadidos durante la construcción."""
+        return sum(1 for medios in (self.subida[3], self.bajada[3]) for medio in medios if medio >= 0)
+
+    def consultar_ids(self, origen: int, destino: int) -> Tuple[float, List[int], int, int]:
+        """
+        Camino mínimo entre dos nodos identificados por id.
+
+        Args:
+            origen: Id del nodo de partida
+            destino: Id del nodo de llegada
+
+        Returns:
+            Tuple: (costo, ids del camino desempaquetado, nodos asentados, tamaño final de las colas);
+            el costo es ``math.inf`` y el camino vacío si el destino es inalcanzable
+        """
+        distancias = ({origen: 0.0}, {destino: 0.0})
+        padres = ({origen: -1}, {destino: -1})
+        colas = ([(0.0, origen)], [(0.0, destino)])
+        grafos = (self.subida, self.bajada)
+        mejor, encuentro = math.inf, -1
+        asentados = 0
+
+        while colas[0] or colas[1]:
+            # Se avanza por el sentido cuya cola tiene la clave mínima más baja
+            sentido = 0 if colas[0] and (not colas[1] or colas[0][0][0] <= colas[1][0][0]) else 1
+            distancia, actual = heapq.heappop(colas[sentido])
+
+            if distancia > distancias[sentido][actual]:
+                continue
+
+            # Ningún camino que pase por el resto de esta cola puede mejorar al mejor encontrado
+            if distancia >= mejor:
+                colas[sentido].clear()
+                continue
+
+            asentados += 1
+            otra = distancias[1 - sentido].get(actual)
+            if otra is not None and distancia + otra < mejor:
+                mejor, encuentro = distancia + otra, actual
+
+            propias, propios_padres = distancias[sentido], padres[sentido]
+
+            # Poda "stall-on-demand": si un nodo de mayor rango ya alcanzado llega a este
+            # con menor costo, la distancia actual no es la mínima y no vale la pena propagarla
+            desplazamientos, vecinos, costos, _ = grafos[1 - sentido]
+            if any(
+                propias.get(vecinos[k], math.inf) + costos[k] < distancia
+                for k in range(desplazamientos[actual], desplazamientos[actual + 1])
+            ):
+                continue
+
+            desplazamientos, vecinos, costos, _ = grafos[sentido]
+            for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+                vecino = vecinos[k]
+                nueva = distancia + costos[k]
+                if nueva < propias.get(vecino, math.inf):
+                    propias[vecino] = nueva
+                    propios_padres[vecino] = actual
+                    heapq.heappush(colas[sentido], (nueva, vecino))
+
+        if encuentro < 0:
+            return math.inf, [], asentados, 0
+
+        # Camino en la jerarquía: origen ... encuentro ... destino
+        camino = []
+        nodo = encuentro
+        while nodo >= 0:
+            camino.append(nodo)
+            nodo = padres[0][nodo]
+        camino.reverse()
+        nodo = padres[1][encuentro]
+        while nodo >= 0:
+            camino.append(nodo)
+            nodo = padres[1][nodo]
+
+        return mejor, self.desempaquetar(camino), asentados, len(colas[0]) + len(colas[1])
+
+    def consultar(self, origen: str, destino: str) -> ResultadoBusqueda:
+        """
+        Camino mínimo entre dos estados.
+
+        Args:
+            origen: El estado inicial
+            destino: El estado objetivo
+
+        Returns:
+            ResultadoBusqueda: Los resultados de la consulta
+        """
+        if origen == destino:
+            return ResultadoBusqueda(
+                encontrado=True,
+                camino=[(origen, "Inicio")],
+                costo_total=0,
+                nodos_expandidos=1
+            )
+
+        inicial, objetivo = self.grafo.indice(origen), self.grafo.indice(destino)
+        if inicial < 0 or objetivo < 0:
+            return ResultadoBusqueda(encontrado=False, nodos_expandidos=int(inicial >= 0))
+
+        costo, ids, asentados, en_cola = self.consultar_ids(inicial, objetivo)
+        if not ids:
+            return ResultadoBusqueda(encontrado=False, nodos_expandidos=asentados)
+
+        return ResultadoBusqueda(
+            encontrado=True,
+            camino=self.grafo.reconstruir_camino(ids),
+            costo_total=costo,
+            nodos_expandidos=asentados,
+            nodos_frontera=en_cola
+        )
+
+    def desempaquetar(self, camino: List[int]) -> List[int]:
+        """
+        Reemplaza recursivamente cada atajo de un camino por las aristas originales.
+
+        Args:
+            camino: Ids de un camino en la jerarquía
+
+        Returns:
+            List[int]: Ids del camino equivalente en el grafo original
+        """
+        if not camino:
+            return []
+
+        resultado = [camino[0]]
+        pendientes = [(u, w) for u, w in zip(camino, camino[1:])]
+        pendientes.reverse()
+
+        while pendientes:
+            u, w = pendientes.pop()
+            medio = self._medio(u, w)
+            if medio < 0:
+                resultado.append(w)
+            else:
+                pendientes.append((medio, w))
+                pendientes.append((u, medio))
+
+        return resultado
+
+    def _medio(self, u: int, w: int) -> int:
+        """Nodo intermedio de la arista u → w de la jerarquía (-1 si es una arista original)."""
+        if self.rangos[u] < self.rangos[w]:
+            desplazamientos, vecinos, _, medios = self.subida
+            nodo, buscado = u, w
+        else:
+            desplazamientos, vecinos, _, medios = self.bajada
+            nodo, buscado = w, u
+
+        for k in range(desplazamientos[nodo], desplazamientos[nodo + 1]):
+            if vecinos[k] == buscado:
+                return medios[k]
+
+        raise KeyError(f"La arista {u} → {w} no pertenece a la jerarquía")
+
+
+def _busqueda_testigos(
+    salientes: List[_Adyacencia],
+    origen: int,
+    excluido: int,
+    objetivos: _Adyacencia,
+    limite_costo: float,
+    limite_asentados: int
+) -> Dict[int, float]:
+    """
+    Dijkstra local desde ``origen`` que evita ``excluido``.
+
+    Se detiene cuando todos los ``objetivos`` están asentados o al superar
+    ``limite_costo`` o ``limite_asentados``; las distancias devueltas son
+    longitudes de caminos reales, aunque no necesariamente mínimas.
+    """
+    distancias = {origen: 0.0}
+    frontera = [(0.0, origen)]
+    asentados = 0
+    pendientes = len(objetivos) - (origen in objetivos)
+
+    while frontera and pendientes > 0:
+        distancia, actual = heapq.heappop(frontera)
+
+        if distancia > distancias[actual]:
+            continue
+        if distancia > limite_costo or asentados >= limite_asentados:
+            break
+
+        asentados += 1
+        if actual in objetivos and actual != origen:
+            pendientes -= 1
+        for vecino, (costo, _) in salientes[actual].items():
+            if vecino == excluido:
+                continue
+            nueva = distancia + costo
+            if nueva < distancias.get(vecino, math.inf):
+                distancias[vecino] = nueva
+                heapq.heappush(frontera, (nueva, vecino))
+
+    return distancias
+
+
+def _a_csr(adyacencias: List[_Adyacencia]) -> Tuple[array, array, array, array]:
+    """Convierte las listas de adyacencia de trabajo en arreglos CSR (desplazamientos, vecinos, costos, medios)."""
+    desplazamientos = array('q', [0])
+    vecinos = array('i')
+    costos = array('d')
+    medios = array('i')
+
+    for adyacencia in adyacencias:
+        for vecino, (costo, medio) in adyacencia.items():
+            vecinos.append(vecino)
+            costos.append(costo)
+            medios.append(medio)
+        desplazamientos.append(len(vecinos))
+
+    return desplazamientos, vecinos, costos, medios
+
+
+def busqueda_jerarquia_contraccion(
+    problema: ProblemaDeRuta,
+    jerarquia: JerarquiaContraccion
+) -> ResultadoBusqueda:
+    """
+    Resuelve un problema de ruta con una jerarquía de contracción ya construida.
+
+    La jerarquía debe haberse construido sobre el mismo grafo que usa el problema.
+
+    Args:
+        problema: El problema a resolver
+        jerarquia: La jerarquía de contracción del grafo
+
+    Returns:
+        ResultadoBusqueda: Los resultados de la búsqueda
+    """
+    return jerarquia.consultar(problema.estado_inicial, problema.estado_objetivo)
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    grafo_rumania = {
+        'Oradea': [('Zerind', 71), ('Sibiu', 151)],
+        'Zerind': [('Oradea', 71), ('Sibiu', 99), ('Arad', 75)],
+        'Arad': [('Zerind', 75), ('Sibiu', 140), ('Timisoara', 118)],
+        'Timisoara': [('Arad', 118), ('Lugoj', 111)],
+        'Lugoj': [('Timisoara', 111), ('Mehadia', 70)],
+        'Mehadia': [('Lugoj', 70), ('Drobeta', 75)],
+        'Drobeta': [('Mehadia', 75)],
+        'Sibiu': [('Oradea', 151), ('Zerind', 99), ('Arad', 140), ('Fagaras', 99), ('Rimnicu Vilcea', 80)],
+        'Rimnicu Vilcea': [('Sibiu', 80), ('Craiova', 146), ('Pitesti', 97)],
+        'Craiova': [('Rimnicu Vilcea', 146), ('Pitesti', 138), ('Drobeta', 120)],
+        'Fagaras': [('Sibiu', 99), ('Bucharest', 211)],
+        'Pitesti': [('Rimnicu Vilcea', 97), ('Craiova', 138), ('Bucharest', 101)],
+        'Bucharest': [('Fagaras', 211), ('Pitesti', 101), ('Giurgiu', 90), ('Urziceni', 85)],
+        'Giurgiu': [('Bucharest', 90)],
+        'Urziceni': [('Bucharest', 85), ('Hirsova', 98), ('Vaslui', 142)],
+        'Hirsova': [('Urziceni', 98), ('Eforie', 86)],
+        'Eforie': [('Hirsova', 86)],
+        'Vaslui': [('Urziceni', 142), ('Iasi', 92)],
+        'Iasi': [('Vaslui', 92), ('Neamt', 87)],
+        'Neamt': [('Iasi', 87)]
+    }
+
+    jerarquia = JerarquiaContraccion.construir(grafo_rumania)
+    print(f"=== Jerarquía de contracción: {jerarquia.num_atajos} atajos ===\n")
+    print(jerarquia.consultar('Arad', 'Bucharest'))
@@ -0,0 +1,369 @@
+"""
+Módulo: Preprocesamiento ALT (A*, Landmarks, desigualdad Triangular)
+Descripción: Selección de landmarks, distancias precalculadas y heurística admisible para A*.
+
+Para cada landmark L se guardan d(L, v) y d(v, L) para todo nodo v. Por la desigualdad
+triangular, max(d(L, t) - d(L, v), d(v, L) - d(t, L)) es una cota inferior de d(v, t),
+y el máximo sobre todos los landmarks es una heurística admisible y consistente.
+"""
+
+import heapq
+import json
+import math
+import random
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence
+
+from busqueda_informada import Heuristica
+from grafo_compilado import GrafoCompilado
+
+# Cabecera del archivo: firma, versión, orden de bytes (0 little, 1 big), n, k, bytes de
+# nombres y huella del grafo preprocesado (``GrafoCompilado.huella``, 16 bytes)
+_FORMATO_CABECERA = '<4sHBxIII16s'
+_FIRMA = b'ALT1'
+_VERSION = 2
+
+
+def distancias_desde(grafo: GrafoCompilado, origen: int) -> array:
+    """
+    Calcula con Dijkstra la distancia desde ``origen`` hasta todos los nodos.
+
+    Args:
+        grafo: El grafo compilado
+        origen: Id del nodo de partida
+
+    Returns:
+        array: Distancia a cada nodo (``math.inf`` si no es alcanzable)
+    """
+    desplazamientos, destinos, costos = grafo.desplazamientos, grafo.destinos, grafo.costos
+    distancias = array('d', [math.inf]) * grafo.num_nodos
+    distancias[origen] = 0.0
+    frontera = [(0.0, origen)]
+
+    while frontera:
+        distancia, actual = heapq.heappop(frontera)
+
+        if distancia > distancias[actual]:
+            continue
+
+        for k in range(desplazamientos[actual], desplazamientos[actual + 1]):
+            vecino = destinos[k]
+            nueva = distancia + costos[k]
+            if nueva < distancias[vecino]:
+                distancias[vecino] = nueva
+                heapq.heappush(frontera, (nueva, vecino))
+
+    return distancias
+
+
+class PreprocesamientoALT:
+    """
+    Resultado del preprocesamiento ALT de un grafo.
+
+    Las distancias se guardan en dos arreglos planos de k * n valores:
+    ``desde[i * n + v] = d(L_i, v)`` y ``hacia[i * n + v] = d(v, L_i)``.
+
+    Solo vale para el grafo cuya huella conserva: con cualquier otro (por ejemplo, el
+    mismo tras editar un costo) la heurística podría dejar de ser admisible.
+    """
+
+    def __init__(
+        self,
+        nombres: Sequence[str],
+        landmarks: Sequence[int],
+        desde: array,
+        hacia: array,
+        huella: str
+    ):
+        """
+        Inicializa el preprocesamiento.
+
+        Args:
+            nombres: Nombres de los nodos del grafo, indexados por id
+            landmarks: Ids de los landmarks
+            desde: Distancias desde cada landmark hasta cada nodo
+            hacia: Distancias desde cada nodo hasta cada landmark
+            huella: Huella del grafo preprocesado (``GrafoCompilado.huella``)
+        """
+        self.nombres = nombres
+        self.landmarks = array('i', landmarks)
+        self.desde = desde
+        self.hacia = hacia
+        self.huella = huella
+
+    @classmethod
+    def construir(
+        cls,
+        grafo: GrafoCompilado,
+        num_landmarks: int = 8,
+        estrategia: str = "lejanos",
+        semilla: int = 0
+    ) -> 'PreprocesamientoALT':
+        """
+        Elige los landmarks y calcula sus distancias a todos los nodos.
+
+        Estrategias de selección:
+            - "lejanos": cada nuevo landmark es el nodo más alejado de los ya elegidos
+            - "aleatorio": landmarks elegidos al azar
+
+        Args:
+            grafo: El grafo compilado
+            num_landmarks: Número de landmarks
+            estrategia: Estrategia de selección ("lejanos" o "aleatorio")
+            semilla: Semilla del generador aleatorio
+
+        Returns:
+            PreprocesamientoALT: El preprocesamiento
+        """
+        n = grafo.num_nodos
+        num_landmarks = min(num_landmarks, n)
+        generador = random.Random(semilla)
+        invertido = grafo.invertido()
+        landmarks: List[int] = []
+        desde = array('d')
+        hacia = array('d')
+
+        if estrategia == "aleatorio":
+            landmarks = generador.sample(range(n), num_landmarks)
+            for landmark in landmarks:
+                desde.extend(distancias_desde(grafo, landmark))
+                hacia.extend(distancias_desde(invertido, landmark))
+        elif estrategia == "lejanos":
+            # Distancia mínima (en ambos sentidos) de cada nodo a los landmarks elegidos
+            cercania = array('d', [math.inf]) * n
+            candidato = generador.randrange(n) if n else 0
+
+            while len(landmarks) < num_landmarks:
+                landmarks.append(candidato)
+                distancias_ida = distancias_desde(grafo, candidato)
+                distancias_vuelta = distancias_desde(invertido, candidato)
+                desde.extend(distancias_ida)
+                hacia.extend(distancias_vuelta)
+
+                mejor, candidato = -1.0, -1
+                for v in range(n):
+                    d = min(distancias_ida[v], distancias_vuelta[v])
+                    if d < cercania[v]:
+                        cercania[v] = d
+                    # Los nodos inalcanzables no aportan cotas útiles
+                    if cercania[v] != math.inf and cercania[v] > mejor:
+                        mejor, candidato = cercania[v], v
+
+                if mejor <= 0:
+                    break
+        else:
+            raise ValueError(f"Estrategia de selección desconocida: {estrategia}")
+
+        return cls(grafo.nombres, landmarks, desde, hacia, grafo.huella())
+
+    @property
+    def num_nodos(self) -> int:
+        """Número de nodos del grafo preprocesado."""
+        return len(self.nombres)
+
+    def comprobar_grafo(self, grafo: GrafoCompilado) -> None:
+        """
+        Comprueba que el preprocesamiento corresponda a ``grafo``.
+
+        Raises:
+            ValueError: Si la huella del grafo no coincide con la del preprocesamiento
+        """
+        if grafo.huella() != self.huella:
+            raise ValueError("El preprocesamiento ALT corresponde a otro grafo (o a otra versión de este)")
+
+    def cota_inferior(self, estado: int, objetivo: int) -> float:
+        """
+        Cota inferior de la distancia entre dos nodos.
+
+        Args:
+            estado: Id del nodo de partida
+            objetivo: Id del nodo de llegada
+
+        Returns:
+            float: Cota inferior de d(estado, objetivo); ``math.inf`` si el objetivo es inalcanzable
+        """
+        n = self.num_nodos
+        desde, hacia = self.desde, self.hacia
+        cota = 0.0
+
+        for i in range(len(self.landmarks)):
+            base = i * n
+            # d(L, t) - d(L, v) y d(v, L) - d(t, L); inf - inf (nan) no aporta información
+            for diferencia in (
+                desde[base + objetivo] - desde[base + estado],
+                hacia[base + estado] - hacia[base + objetivo]
+            ):
+                if diferencia > cota:
+                    cota = diferencia
+
+        return cota
+
+    def heuristica(self, max_objetivos: int = 8) -> 'HeuristicaALT':
+        """Crea la heurística de A* basada en este preprocesamiento."""
+        return HeuristicaALT(self, max_objetivos)
+
+    def guardar(self, ruta: str) -> None:
+        """
+        Guarda el preprocesamiento en un archivo binario.
+
+        Args:
+            ruta: Ruta del archivo
+        """
+        nombres = json.dumps(list(self.nombres), ensure_ascii=False).encode('utf-8')
+        orden = 0 if sys.byteorder == 'little' else 1
+
+        with open(ruta, 'wb') as archivo:
+            archivo.write(struct.pack(
+                _FORMATO_CABECERA, _FIRMA, _VERSION, orden,
+                self.num_nodos, len(self.landmarks), len(nombres), bytes.fromhex(self.huella)
+            ))
+            archivo.write(nombres)
+            self.landmarks.tofile(archivo)
+            self.desde.tofile(archivo)
+            self.hacia.tofile(archivo)
+
+    @classmethod
+    def cargar(cls, ruta: str, grafo: Optional[GrafoCompilado] = None) -> 'PreprocesamientoALT':
+        """
+        Carga un preprocesamiento guardado con ``guardar``.
+
+        Args:
+            ruta: Ruta del archivo
+            grafo: Si se indica, se comprueba que el archivo corresponda a este grafo
+
+        Returns:
+            PreprocesamientoALT: El preprocesamiento
+
+        Raises:
+            ValueError: Si el archivo no es válido o corresponde a otro grafo
+        """
+        with open(ruta, 'rb') as archivo:
+            cabecera = archivo.read(struct.calcsize(_FORMATO_CABECERA))
+            if len(cabecera) != struct.calcsize(_FORMATO_CABECERA):
+                raise ValueError(f"{ruta} no es un archivo de preprocesamiento ALT válido")
+            firma, version, orden, n, k, tamano_nombres, huella = struct.unpack(_FORMATO_CABECERA, cabecera)
+
+            if firma != _FIRMA or version != _VERSION:
+                raise ValueError(f"{ruta} no es un archivo de preprocesamiento ALT válido")
+
+            if grafo is not None and grafo.huella() != huella.hex():
+                raise ValueError(f"{ruta} corresponde a otro grafo (o a otra versión de este)")
+
+            nombres = json.loads(archivo.read(tamano_nombres).decode('utf-8'))
+            landmarks = array('i')
+            landmarks.fromfile(archivo, k)
+            desde = array('d')
+            desde.fromfile(archivo, k * n)
+            hacia = array('d')
+            hacia.fromfile(archivo, k * n)
+
+        if orden != (0 if sys.byteorder == 'little' else 1):
+            for arreglo in (landmarks, desde, hacia):
+                arreglo.byteswap()
+
+        return cls(nombres, landmarks, desde, hacia, huella.hex())
+
+
+class _ValoresALT:
+    """Valores de la heurística hacia un objetivo, calculados a medida que se consultan."""
+
+    def __init__(self, preprocesamiento: PreprocesamientoALT, objetivo: int):
+        self.preprocesamiento = preprocesamiento
+        self.objetivo = objetivo
+        self.valores = array('d', [math.nan]) * preprocesamiento.num_nodos
+
+    def __getitem__(self, estado: int) -> float:
+        valor = self.valores[estado]
+        if valor != valor:  # nan: todavía no calculado
+            valor = self.preprocesamiento.cota_inferior(estado, self.objetivo)
+            self.valores[estado] = valor
+        return valor
+
+    def __len__(self) -> int:
+        return len(self.valores)
+
+
+class HeuristicaALT(Heuristica):
+    """
+    Heurística de A* basada en las distancias a los landmarks.
+
+    Solo se evalúa en los nodos que la búsqueda llega a generar, de modo que una
+    consulta no paga el costo de recorrer todo el grafo.
+    """
+
+    def __init__(self, preprocesamiento: PreprocesamientoALT, max_objetivos: int = 8):
+        """
+        Inicializa la heurística.
+
+        Args:
+            preprocesamiento: El preprocesamiento ALT del grafo
+            max_objetivos: Número máximo de objetivos cuyos valores se conservan por grafo
+        """
+        super().__init__(max_objetivos)
+        self.preprocesamiento = preprocesamiento
+        self._indices: Optional[Dict[str, int]] = None
+
+    def estimar(self, estado: str, objetivo: str) -> float:
+        if self._indices is None:
+            self._indices = {nombre: i for i, nombre in enumerate(self.preprocesamiento.nombres)}
+        return self.preprocesamiento.cota_inferior(self._indices[estado], self._indices[objetivo])
+
+    def calcular_valores(self, grafo: GrafoCompilado, objetivo: str) -> Sequence[float]:
+        preprocesamiento = self.preprocesamiento
+        preprocesamiento.comprobar_grafo(grafo)
+
+        indice = grafo.indice(objetivo)
+        if indice < 0:
+            return defaultdict(float)
+
+        return _ValoresALT(preprocesamiento, indice)
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from algoritmos_busqueda import ProblemaDeRuta
+    from busqueda_informada import busqueda_a_estrella
+
+    grafo_rumania = {
+        'Oradea': [('Zerind', 71), ('Sibiu', 151)],
+        'Zerind': [('Oradea', 71), ('Sibiu', 99), ('Arad', 75)],
+        'Arad': [('Zerind', 75), ('Sibiu', 140), ('Timisoara', 118)],
+        'Timisoara': [('Arad', 118), ('Lugoj', 111)],
+        'Lugoj': [('Timisoara', 111), ('Mehadia', 70)],
+        'Mehadia': [('Lugoj', 70), ('Drobeta', 75)],
+        'Drobeta': [('Mehadia', 75)],
+        'Sibiu': [('Oradea', 151), ('Zerind', 99), ('Arad', 140), ('Fagaras', 99), ('Rimnicu Vilcea', 80)],
+        'Rimnicu Vilcea': [('Sibiu', 80), ('Craiova', 146), ('Pitesti', 97)],
+        'Craiova': [('Rimnicu Vilcea', 146), ('Pitesti', 138), ('Drobeta', 120)],
+        'Fagaras': [('Sibiu', 99), ('Bucharest', 211)],
+        'Pitesti': [('Rimnicu Vilcea', 97), ('Craiova', 138), ('Bucharest', 101)],
+        'Bucharest': [('Fagaras', 211), ('Pitesti', 101), ('Giurgiu', 90), ('Urziceni', 85)],
+        'Giurgiu': [('Bucharest', 90)],
+        'Urziceni': [('Bucharest', 85), ('Hirsova', 98), ('Vaslui', 142)],
+        'Hirsova': [('Urziceni', 98), ('Eforie', 86)],
+        'Eforie': [('Hirsova', 86)],
+        'Vaslui': [('Urziceni', 142), ('Iasi', 92)],
+        'Iasi': [('Vaslui', 92), ('Neamt', 87)],
+        'Neamt': [('Iasi', 87)]
+    }
+
+    grafo = GrafoCompilado.desde_diccionario(grafo_rumania)
+    preprocesamiento = PreprocesamientoALT.construir(grafo, num_landmarks=3)
+    print("Landmarks:", [grafo.nombres[i] for i in preprocesamiento.landmarks])
+
+    # Guardar y volver a cargar, como haría un proceso trabajador al arrancar
+    ruta = os.path.join(tempfile.gettempdir(), "rumania.alt")
+    preprocesamiento.guardar(ruta)
+    heuristica = PreprocesamientoALT.cargar(ruta, grafo).heuristica()
+
+    problema = ProblemaDeRuta(grafo, 'Arad', 'Bucharest')
+    print("\n=== A* sin heurística ===")
+    print(busqueda_a_estrella(problema))
+    print("\n=== A* con heurística ALT ===")
+    print(busqueda_a_estrella(problema, heuristica))
@@ -0,0 +1,261 @@
+"""
+Módulo: Métricas de Búsqueda
+Descripción: Ejecuta las funciones de búsqueda midiendo tiempo real, tiempo de CPU y,
+opcionalmente, el pico de memoria con tracemalloc, y entrega las métricas a exportadores
+intercambiables.
+
+Los contadores (nodos generados, duplicados podados, picos de frontera y de explorados)
+los completa cada ``busqueda_*`` cuando recibe un ``MetricasBusqueda``; sin él, la
+búsqueda solo paga una comparación por nodo expandido. Las funciones que no aceptan
+``metricas`` se miden igual, pero sus contadores quedan en None.
+
+Un exportador es cualquier función ``exportador(nombre_algoritmo, problema, resultado)``
+que se llama tras cada búsqueda medida; ``resultado.metricas`` tiene las métricas.
+"""
+
+import functools
+import inspect
+import json
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List
+
+from algoritmos_busqueda import MetricasBusqueda, ProblemaDeRuta, ResultadoBusqueda
+
+Exportador = Callable[[str, ProblemaDeRuta, ResultadoBusqueda], None]
+
+
+@functools.lru_cache(maxsize=None)
+def _acepta_metricas(algoritmo: Callable[..., ResultadoBusqueda]) -> bool:
+    """Indica si la función de búsqueda recibe el parámetro ``metricas``."""
+    try:
+        return 'metricas' in inspect.signature(algoritmo).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def medir_busqueda(
+    algoritmo: Callable[..., ResultadoBusqueda],
+    problema: ProblemaDeRuta,
+    *args: Any,
+    memoria: bool = False,
+    exportadores: Iterable[Exportador] = (),
+    **kwargs: Any
+) -> ResultadoBusqueda:
+    """
+    Ejecuta ``algoritmo(problema, *args, **kwargs)`` y adjunta sus métricas al resultado.
+
+    Args:
+        algoritmo: La función de búsqueda
+        problema: El problema a resolver
+        *args: Argumentos adicionales del algoritmo
+        memoria: Medir también el pico de memoria con tracemalloc (ralentiza la búsqueda)
+        exportadores: Funciones a las que entregar el resultado medido
+        **kwargs: Argumentos adicionales del algoritmo
+
+    Returns:
+        ResultadoBusqueda: El resultado, con ``metricas`` completado
+    """
+    metricas = MetricasBusqueda()
+    if _acepta_metricas(algoritmo):
+        kwargs['metricas'] = metricas
+
+    propio = memoria and not tracemalloc.is_tracing()
+    if propio:
+        tracemalloc.start()
+    elif memoria:
+        # Ya hay otra medición en curso: se mide el pico relativo sin detenerla
+        tracemalloc.reset_peak()
+    memoria_inicial = tracemalloc.get_traced_memory()[0] if memoria else 0
+
+    inicio, inicio_cpu = time.perf_counter(), time.process_time()
+    try:
+        resultado = algoritmo(problema, *args, **kwargs)
+    finally:
+        segundos, segundos_cpu = time.perf_counter() - inicio, time.process_time() - inicio_cpu
+        if memoria:
+            pico = tracemalloc.get_traced_memory()[1] - memoria_inicial
+        if propio:
+            tracemalloc.stop()
+
+    metricas.segundos, metricas.segundos_cpu = segundos, segundos_cpu
+    if memoria:
+        metricas.pico_memoria = pico
+    resultado.metricas = metricas
+
+    nombre = getattr(algoritmo, '__name__', type(algoritmo).__name__)
+    for exportador in exportadores:
+        exportador(nombre, problema, resultado)
+
+    return resultado
+
+
+def con_metricas(
+    algoritmo: Callable[..., ResultadoBusqueda],
+    memoria: bool = False,
+    exportadores: Iterable[Exportador] = ()
+) -> Callable[..., ResultadoBusqueda]:
+    """
+    Envuelve una función de búsqueda para que mida cada ejecución.
+
+    Args:
+        algoritmo: La función de búsqueda
+        memoria: Medir también el pico de memoria con tracemalloc
+        exportadores: Funciones a las que entregar cada resultado medido
+
+    Returns:
+        Callable: Función con la misma firma que ``algoritmo``
+    """
+    exportadores = tuple(exportadores)
+
+    @functools.wraps(algoritmo)
+    def envoltura(problema: ProblemaDeRuta, *args: Any, **kwargs: Any) -> ResultadoBusqueda:
+        return medir_busqueda(algoritmo, problema, *args, memoria=memoria, exportadores=exportadores, **kwargs)
+
+    return envoltura
+
+
+def registro_metricas(nombre_algoritmo: str, problema: ProblemaDeRuta, resultado: ResultadoBusqueda) -> Dict[str, Any]:
+    """
+    Convierte un resultado medido en un registro plano.
+
+    Args:
+        nombre_algoritmo: Nombre de la función de búsqueda
+        problema: El problema resuelto
+        resultado: El resultado, con ``metricas``
+
+    Returns:
+        Dict[str, Any]: Algoritmo, estados, resultado y métricas
+    """
+    registro = {
+        'algoritmo': nombre_algoritmo,
+        'inicial': problema.estado_inicial,
+        'objetivo': problema.estado_objetivo,
+        'encontrado': resultado.encontrado,
+        'costo_total': resultado.costo_total,
+        'nodos_expandidos': resultado.nodos_expandidos
+    }
+    registro.update(resultado.metricas.a_diccionario())
+    return registro
+
+
+class RegistroMetricas:
+    """
+    Exportador que guarda en memoria los registros de las búsquedas medidas.
+
+    Es seguro para usarse desde varios hilos.
+    """
+
+    def __init__(self):
+        """Inicializa un registro vacío."""
+        self.registros: List[Dict[str, Any]] = []
+        self._candado = threading.Lock()
+
+    def __call__(self, nombre_algoritmo: str, problema: ProblemaDeRuta, resultado: ResultadoBusqueda) -> None:
+        registro = registro_metricas(nombre_algoritmo, problema, resultado)
+        with self._candado:
+            self.registros.append(registro)
+
+    def resumen(self) -> Dict[str, Dict[str, float]]:
+        """
+        Agrega los registros por algoritmo.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Para cada algoritmo, el número de búsquedas, la
+            suma de cada contador y de los tiempos, y el máximo de los picos
+        """
+        resumen: Dict[str, Dict[str, float]] = OrderedDict()
+
+        with self._candado:
+            registros = list(self.registros)
+
+        for registro in registros:
+            agregado = resumen.setdefault(registro['algoritmo'], {'busquedas': 0})
+            agregado['busquedas'] += 1
+            for campo in ('nodos_expandidos',) + MetricasBusqueda.CAMPOS:
+                valor = registro[campo]
+                if valor is None:
+                    continue
+                if campo.startswith('pico'):
+                    agregado[campo] = max(agregado.get(campo, valor), valor)
+                else:
+                    agregado[campo] = agregado.get(campo, 0) + valor
+
+        return resumen
+
+    def limpiar(self) -> None:
+        """Descarta los registros guardados."""
+        with self._candado:
+            self.registros.clear()
+
+
+class ExportadorJSONL:
+    """Exportador que agrega cada registro como una línea JSON al final de un archivo."""
+
+    def __init__(self, ruta: str):
+        """
+        Inicializa el exportador.
+
+        Args:
+            ruta: Ruta del archivo (se crea si no existe)
+        """
+        self.ruta = ruta
+        self._candado = threading.Lock()
+
+    def __call__(self, nombre_algoritmo: str, problema: ProblemaDeRuta, resultado: ResultadoBusqueda) -> None:
+        linea = json.dumps(registro_metricas(nombre_algoritmo, problema, resultado), ensure_ascii=False)
+        with self._candado, open(self.ruta, 'a', encoding='utf-8') as archivo:
+            archivo.write(linea + "\n")
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from algoritmos_busqueda import (
+        busqueda_amplitud, busqueda_costo_uniforme, busqueda_profundidad, busqueda_profundidad_iterativa
+    )
+    from busqueda_informada import busqueda_a_estrella
+
+    grafo_rumania = {
+        'Oradea': [('Zerind', 71), ('Sibiu', 151)],
+        'Zerind': [('Oradea', 71), ('Sibiu', 99), ('Arad', 75)],
+        'Arad': [('Zerind', 75), ('Sibiu', 140), ('Timisoara', 118)],
+        'Timisoara': [('Arad', 118), ('Lugoj', 111)],
+        'Lugoj': [('Timisoara', 111), ('Mehadia', 70)],
+        'Mehadia': [('Lugoj', 70), ('Drobeta', 75)],
+        'Drobeta': [('Mehadia', 75)],
+        'Sibiu': [('Oradea', 151), ('Zerind', 99), ('Arad', 140), ('Fagaras', 99), ('Rimnicu Vilcea', 80)],
+        'Rimnicu Vilcea': [('Sibiu', 80), ('Craiova', 146), ('Pitesti', 97)],
+        'Craiova': [('Rimnicu Vilcea', 146), ('Pitesti', 138), ('Drobeta', 120)],
+        'Fagaras': [('Sibiu', 99), ('Bucharest', 211)],
+        'Pitesti': [('Rimnicu Vilcea', 97), ('Craiova', 138), ('Bucharest', 101)],
+        'Bucharest': [('Fagaras', 211), ('Pitesti', 101), ('Giurgiu', 90), ('Urziceni', 85)],
+        'Giurgiu': [('Bucharest', 90)],
+        'Urziceni': [('Bucharest', 85), ('Hirsova', 98), ('Vaslui', 142)],
+        'Hirsova': [('Urziceni', 98), ('Eforie', 86)],
+        'Eforie': [('Hirsova', 86)],
+        'Vaslui': [('Urziceni', 142), ('Iasi', 92)],
+        'Iasi': [('Vaslui', 92), ('Neamt', 87)],
+        'Neamt': [('Iasi', 87)]
+    }
+
+    registro = RegistroMetricas()
+    algoritmos = [
+        busqueda_amplitud, busqueda_profundidad, busqueda_costo_uniforme,
+        busqueda_profundidad_iterativa, busqueda_a_estrella
+    ]
+
+    for algoritmo in algoritmos:
+        medido = con_metricas(algoritmo, memoria=True, exportadores=[registro])
+        resultado = medido(ProblemaDeRuta(grafo_rumania, 'Arad', 'Bucharest'))
+        print(f"=== {algoritmo.__name__} ===")
+        print(resultado.metricas)
+        print()
+
+    for inicial, objetivo in [('Oradea', 'Eforie'), ('Timisoara', 'Neamt')]:
+        medir_busqueda(busqueda_amplitud, ProblemaDeRuta(grafo_rumania, inicial, objetivo), exportadores=[registro])
+
+    print("=== Resumen ===")
+    for nombre, agregado in registro.resumen().items():
+        print(f"{nombre}: {agregado}")
@@ -0,0 +1,384 @@
+"""
+Módulo: Perfilado
+Descripción: Perfilado opcional de llamadas (cualquier ``busqueda_*``, ``simular_entorno``
+o un bloque de código) con cProfile y tracemalloc, muestreando una de cada N llamadas.
+
+Por cada llamada muestreada se escriben en el directorio de salida:
+
+- ``<nombre>-<n>.pstats``: las estadísticas de cProfile (``pstats``, snakeviz, ...)
+- ``<nombre>-<n>.collapsed``: pilas colapsadas ``a;b;c microsegundos`` para flamegraph.pl,
+  speedscope o inferno. cProfile solo registra pares llamador → llamado, así que el tiempo
+  de cada función se reparte entre sus pilas en proporción al tiempo de cada llamador.
+- ``<nombre>-<n>-memoria.txt``: pico de memoria y las N líneas que más memoria asignaron,
+  en una instantánea de tracemalloc tomada cerca del pico y al terminar la llamada.
+
+Las llamadas no muestreadas solo incrementan un contador. Dentro de una captura, las
+llamadas perfiladas anidadas (por ejemplo, una búsqueda envuelta dentro de otra) se
+ejecutan sin capturar.
+"""
+
+import contextlib
+import cProfile
+import functools
+import linecache
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Frames que no interesan en los informes de memoria
+_FILTROS_MEMORIA = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class CapturaPerfil:
+    """Una llamada perfilada y los archivos que se escribieron."""
+
+    def __init__(self, nombre: str, numero: int, directorio: str):
+        self.nombre = nombre
+        self.numero = numero
+        base = os.path.join(directorio, f"{nombre}-{numero:06d}")
+        self.ruta_pstats = base + ".pstats"
+        self.ruta_pilas = base + ".collapsed"
+        self.ruta_memoria: Optional[str] = None
+        self.segundos = 0.0
+        self.pico_memoria: Optional[int] = None
+
+    def __str__(self) -> str:
+        """Representación en string de la captura."""
+        resultado = f"{self.nombre} #{self.numero}: {1000 * self.segundos:.1f} ms"
+        if self.pico_memoria is not None:
+            resultado += f", pico {self.pico_memoria / 1024:.0f} KiB"
+        return resultado
+
+
+class _VigilanteMemoria(threading.Thread):
+    """
+    Hilo que toma una instantánea de tracemalloc cada vez que la memoria nueva (sobre
+    ``base``) supera en ``margen`` la de la última instantánea, para conservar la más
+    cercana al pico.
+    """
+
+    def __init__(self, base: int, intervalo: float, margen: float = 0.1):
+        super().__init__(daemon=True)
+        self.base = base
+        self.intervalo = intervalo
+        self.margen = margen
+        self.instantanea: Optional[tracemalloc.Snapshot] = None
+        self.memoria = 0
+        self._detener = threading.Event()
+
+    def run(self) -> None:
+        while not self._detener.wait(self.intervalo):
+            nueva = tracemalloc.get_traced_memory()[0] - self.base
+            if nueva > self.memoria * (1 + self.margen):
+                self.instantanea, self.memoria = tracemalloc.take_snapshot(), nueva
+
+    def detener(self) -> None:
+        self._detener.set()
+        self.join()
+
+
+class Perfilador:
+    """
+    Perfila con cProfile y tracemalloc una de cada ``cada`` llamadas de cada nombre.
+
+    Se usa como contexto (``with perfilador.perfilar("ucs"): ...``) o envolviendo una
+    función (``perfilador.envolver(busqueda_costo_uniforme)``). Es seguro para usarse
+    desde varios hilos; cada hilo perfila sus propias llamadas.
+    """
+
+    def __init__(
+        self,
+        directorio: str = "perfiles",
+        cada: int = 1,
+        top: int = 20,
+        memoria: bool = True,
+        marcos: int = 1,
+        intervalo_memoria: float = 0.005,
+        max_capturas: int = 100
+    ):
+        """
+        Inicializa el perfilador.
+
+        Args:
+            directorio: Directorio de salida (se crea si no existe)
+            cada: Se perfilan las llamadas 1, cada + 1, 2 * cada + 1, ... de cada nombre
+            top: Número de líneas del informe de memoria
+            memoria: Capturar también la memoria con tracemalloc
+            marcos: Marcos de pila que guarda tracemalloc por asignación (más es más lento)
+            intervalo_memoria: Segundos entre comprobaciones de la memoria para la
+                instantánea cercana al pico
+            max_capturas: Número de capturas recientes que se conservan en ``capturas``
+        """
+        if cada < 1:
+            raise ValueError("cada debe ser al menos 1")
+
+        self.directorio = directorio
+        self.cada = cada
+        self.top = top
+        self.memoria = memoria
+        self.marcos = marcos
+        self.intervalo_memoria = intervalo_memoria
+        self.llamadas: Dict[str, int] = defaultdict(int)
+        self.capturas: 'deque[CapturaPerfil]' = deque(maxlen=max_capturas)
+        self._candado = threading.Lock()
+        self._local = threading.local()
+
+    @contextlib.contextmanager
+    def perfilar(self, nombre: str = "bloque") -> Iterator[Optional[CapturaPerfil]]:
+        """
+        Contexto que perfila el bloque si le toca ser muestreado.
+
+        Args:
+            nombre: Nombre de la llamada (prefijo de los archivos y clave del muestreo)
+
+        Yields:
+            Optional[CapturaPerfil]: La captura (completa al salir del bloque) o None si
+            la llamada no se muestrea
+        """
+        with self._candado:
+            self.llamadas[nombre] += 1
+            numero = self.llamadas[nombre]
+
+        if (numero - 1) % self.cada or getattr(self._local, 'activo', False):
+            yield None
+            return
+
+        os.makedirs(self.directorio, exist_ok=True)
+        captura = CapturaPerfil(nombre, numero, self.directorio)
+        self._local.activo = True
+        try:
+            with self._medir(captura):
+                yield captura
+        finally:
+            self._local.activo = False
+            with self._candado:
+                self.capturas.append(captura)
+
+    def envolver(self, funcion: Callable, nombre: Optional[str] = None) -> Callable:
+        """
+        Envuelve una función para que sus llamadas se perfilen con ``perfilar``.
+
+        Args:
+            funcion: La función (busqueda_costo_uniforme, simular_entorno, ...)
+            nombre: Nombre de las capturas (por defecto, el de la función)
+
+        Returns:
+            Callable: Función con la misma firma que ``funcion``
+        """
+        nombre = nombre or getattr(funcion, '__name__', 'funcion')
+
+        @functools.wraps(funcion)
+        def envoltura(*args: Any, **kwargs: Any) -> Any:
+            with self.perfilar(nombre):
+                return funcion(*args, **kwargs)
+
+        return envoltura
+
+    @contextlib.contextmanager
+    def _medir(self, captura: CapturaPerfil) -> Iterator[None]:
+        """Perfila el bloque y escribe los archivos de la captura."""
+        propio = self.memoria and not tracemalloc.is_tracing()
+        vigilante = None
+
+        if self.memoria:
+            if propio:
+                tracemalloc.start(self.marcos)
+            else:
+                tracemalloc.reset_peak()
+            inicial = tracemalloc.take_snapshot()
+            memoria_inicial = tracemalloc.get_traced_memory()[0]
+            vigilante = _VigilanteMemoria(memoria_inicial, self.intervalo_memoria)
+            vigilante.start()
+
+        perfil = cProfile.Profile()
+        inicio = time.perf_counter()
+        perfil.enable()
+        try:
+            yield
+        finally:
+            perfil.disable()
+            captura.segundos = time.perf_counter() - inicio
+
+            if vigilante is not None:
+                vigilante.detener()
+                final = tracemalloc.take_snapshot()
+                captura.pico_memoria = tracemalloc.get_traced_memory()[1] - memoria_inicial
+                if propio:
+                    tracemalloc.stop()
+
+            perfil.dump_stats(captura.ruta_pstats)
+            escribir_pilas_colapsadas(pstats.Stats(perfil), captura.ruta_pilas)
+
+            if vigilante is not None:
+                captura.ruta_memoria = os.path.join(self.directorio, f"{captura.nombre}-{captura.numero:06d}-memoria.txt")
+                escribir_informe_memoria(
+                    captura.ruta_memoria, inicial, vigilante.instantanea, vigilante.memoria,
+                    final, captura.pico_memoria, self.top
+                )
+
+
+def _etiqueta(funcion: Tuple[str, int, str]) -> str:
+    """Nombre de un frame de cProfile para las pilas colapsadas."""
+    archivo, linea, nombre = funcion
+    if archivo == '~':
+        return nombre
+    return f"{nombre} ({os.path.basename(archivo)}:{linea})"
+
+
+def pilas_colapsadas(estadisticas: pstats.Stats, minimo: float = 1e-6) -> Dict[str, float]:
+    """
+    Reconstruye pilas colapsadas a partir del grafo de llamadas de cProfile.
+
+    El tiempo acumulado de cada función se reparte entre sus llamadores según el tiempo
+    acumulado de cada arista; su tiempo propio se asigna a cada pila en esa proporción.
+    Las llamadas recursivas se cortan en su primera aparición en la pila.
+
+    Args:
+        estadisticas: Las estadísticas de cProfile
+        minimo: Segundos por debajo de los cuales una rama se descarta
+
+    Returns:
+        Dict[str, float]: Segundos de tiempo propio por pila "raíz;...;hoja"
+    """
+    datos = estadisticas.stats
+    llamados: Dict[Tuple, List[Tuple[Tuple, float]]] = defaultdict(list)
+    for funcion, (_, _, _, _, llamadores) in datos.items():
+        for llamador, (_, _, _, acumulado) in llamadores.items():
+            llamados[llamador].append((funcion, acumulado))
+
+    pilas: Dict[str, float] = defaultdict(float)
+    en_pila = set()
+
+    def recorrer(funcion: Tuple, prefijo: str, fraccion: float) -> None:
+        _, _, propio, acumulado, _ = datos[funcion]
+        pila = f"{prefijo};{_etiqueta(funcion)}" if prefijo else _etiqueta(funcion)
+        if propio * fraccion >= minimo:
+            pilas[pila] += propio * fraccion
+
+        en_pila.add(funcion)
+        for hijo, tiempo in llamados.get(funcion, ()):
+            total = datos[hijo][3]
+            if hijo not in en_pila and total > 0 and tiempo * fraccion >= minimo:
+                recorrer(hijo, pila, fraccion * tiempo / total)
+        en_pila.discard(funcion)
+
+    for funcion, (_, _, _, _, llamadores) in datos.items():
+        # Las raíces son las llamadas hechas directamente desde el bloque perfilado
+        if not llamadores and funcion[2] != "<method 'disable' of '_lsprof.Profiler' objects>":
+            recorrer(funcion, "", 1.0)
+
+    return pilas
+
+
+def escribir_pilas_colapsadas(estadisticas: pstats.Stats, ruta: str) -> None:
+    """
+    Escribe las pilas colapsadas en formato ``pila microsegundos`` (una por línea).
+
+    Args:
+        estadisticas: Las estadísticas de cProfile
+        ruta: Ruta del archivo
+    """
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        for pila, segundos in sorted(pilas_colapsadas(estadisticas).items()):
+            microsegundos = round(segundos * 1_000_000)
+            if microsegundos:
+                archivo.write(f"{pila} {microsegundos}\n")
+
+
+def escribir_informe_memoria(
+    ruta: str,
+    inicial: tracemalloc.Snapshot,
+    cercana_al_pico: Optional[tracemalloc.Snapshot],
+    memoria_cercana: int,
+    final: tracemalloc.Snapshot,
+    pico: int,
+    top: int
+) -> None:
+    """
+    Escribe el informe de asignaciones: las ``top`` líneas con más memoria nueva respecto
+    del inicio, en la instantánea más cercana al pico y al terminar.
+
+    Args:
+        ruta: Ruta del archivo
+        inicial: Instantánea al entrar al bloque
+        cercana_al_pico: Instantánea de mayor memoria durante el bloque (None si no se tomó)
+        memoria_cercana: Memoria nueva al tomar ``cercana_al_pico``, en bytes
+        final: Instantánea al salir del bloque
+        pico: Pico de memoria nueva durante el bloque, en bytes
+        top: Número de líneas por sección
+    """
+    inicial = inicial.filter_traces(_FILTROS_MEMORIA)
+    lineas = [f"Pico de memoria nueva: {pico / 1024:.1f} KiB", ""]
+
+    secciones = [("Al terminar (memoria retenida)", final)]
+    if cercana_al_pico is not None:
+        secciones.insert(0, (f"Cerca del pico ({memoria_cercana / 1024:.1f} KiB)", cercana_al_pico))
+
+    for titulo, instantanea in secciones:
+        lineas.append(f"=== {titulo}: top {top} ===")
+        diferencias = instantanea.filter_traces(_FILTROS_MEMORIA).compare_to(inicial, 'lineno')
+        for estadistica in [d for d in diferencias if d.size_diff > 0][:top]:
+            marco = estadistica.traceback[0]
+            codigo = linecache.getline(marco.filename, marco.lineno).strip()
+            lineas.append(
+                f"{estadistica.size_diff / 1024:>10.1f} KiB {estadistica.count_diff:>+9} bloques  "
+                f"{marco.filename}:{marco.lineno}"
+            )
+            if codigo:
+                lineas.append(f"{'':>33}{codigo}")
+        lineas.append("")
+
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        archivo.write("\n".join(lineas))
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    import tempfile
+
+    from agente_aspiradora import Estado, Ubicacion, simular_entorno
+    from algoritmos_busqueda import ProblemaDeRuta, busqueda_costo_uniforme
+
+    # Cuadrícula de 150 x 150 con costos que dependen de la posición
+    lado = 150
+    grafo = {}
+    for fila in range(lado):
+        for columna in range(lado):
+            grafo[f"{fila},{columna}"] = [
+                (f"{fila + df},{columna + dc}", 1 + (fila * 7 + columna * 13) % 5)
+                for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                if 0 <= fila + df < lado and 0 <= columna + dc < lado
+            ]
+
+    perfilador = Perfilador(tempfile.mkdtemp(prefix="perfiles-"), cada=5, top=5)
+    ucs = perfilador.envolver(busqueda_costo_uniforme)
+    simular = perfilador.envolver(simular_entorno)
+
+    for i in range(10):
+        ucs(ProblemaDeRuta(grafo, "0,0", f"{lado - 1},{lado - 1 - i}"))
+    simular({Ubicacion.A: Estado.SUCIO, Ubicacion.B: Estado.SUCIO})
+
+    print(f"=== Capturas en {perfilador.directorio} ===")
+    for captura in perfilador.capturas:
+        print(f"  {captura}")
+    print("Llamadas:", dict(perfilador.llamadas))
+
+    primera = perfilador.capturas[0]
+    print(f"\n=== {os.path.basename(primera.ruta_pilas)} (5 pilas más costosas) ===")
+    with open(primera.ruta_pilas, encoding='utf-8') as archivo:
+        pilas = sorted((linea.rsplit(' ', 1) for linea in archivo), key=lambda par: -int(par[1]))
+    for pila, microsegundos in pilas[:5]:
+        print(f"  {int(microsegundos):>8} µs  {pila}")
+
+    print(f"\n=== {os.path.basename(primera.ruta_memoria)} ===")
+    with open(primera.ruta_memoria, encoding='utf-8') as archivo:
+        print(archivo.read())
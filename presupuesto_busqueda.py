@@ -0,0 +1,251 @@
+"""
+Módulo: Presupuesto de Búsqueda
+Descripción: Límites de tiempo, de nodos expandidos y de memoria para las funciones de
+búsqueda, y un token para cancelarlas desde otro hilo.
+
+Cada ``busqueda_*`` que recibe un ``presupuesto`` crea un ``ControlPresupuesto`` y lo
+consulta cuando el número de nodos expandidos alcanza ``control.proxima``: el límite de
+expansiones se respeta exactamente y el tiempo, la memoria y la cancelación se revisan
+cada ``intervalo`` expansiones. Sin presupuesto, ``proxima`` nunca se alcanza y la
+búsqueda solo paga una comparación por nodo expandido.
+
+Si el presupuesto se agota, la búsqueda devuelve un ResultadoBusqueda parcial con
+``motivo_parada`` igual a una de las constantes ``PARADA_*`` y, cuando el algoritmo lo
+permite, el mejor camino que tenía hasta ese momento.
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Callable, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Motivos de parada (``ResultadoBusqueda.motivo_parada``)
+PARADA_TIEMPO = "tiempo"
+PARADA_EXPANSIONES = "expansiones"
+PARADA_MEMORIA = "memoria"
+PARADA_CANCELADA = "cancelada"
+
+# (pid, descriptor de /proc/self/statm): el descriptor se reabre tras un fork
+_statm = (-1, -1)
+
+
+def _memoria_residente() -> int:
+    """Memoria residente (RSS) actual del proceso en Linux, en bytes."""
+    global _statm
+    pid = os.getpid()
+    if _statm[0] != pid:
+        _statm = (pid, os.open('/proc/self/statm', os.O_RDONLY))
+    return int(os.pread(_statm[1], 64, 0).split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def _pico_residente() -> int:
+    """Pico de memoria residente del proceso, en bytes (macOS y otros Unix)."""
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
+def medidor_memoria() -> Optional[Callable[[], int]]:
+    """
+    Elige cómo medir la memoria en uso.
+
+    Con tracemalloc activo se usa la memoria trazada; si no, la memoria residente del
+    proceso (en Linux) o su pico (en otros Unix), que crece como mucho lo que crece la
+    memoria en uso.
+
+    Returns:
+        Optional[Callable[[], int]]: Función que devuelve la memoria en bytes, o None si
+        no hay forma de medirla en esta plataforma
+    """
+    if tracemalloc.is_tracing():
+        return lambda: tracemalloc.get_traced_memory()[0]
+    try:
+        _memoria_residente()
+        return _memoria_residente
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is not None:
+        return _pico_residente
+    return None
+
+
+class TokenCancelacion:
+    """
+    Señal para detener una o varias búsquedas en curso desde otro hilo.
+
+    Las búsquedas que lo reciben en su presupuesto lo consultan cada ``intervalo``
+    expansiones y devuelven un resultado parcial con ``PARADA_CANCELADA``.
+    """
+
+    def __init__(self, padre: Optional['TokenCancelacion'] = None):
+        """
+        Inicializa el token.
+
+        Args:
+            padre: Si se indica, cancelar el padre también cancela este token (pero no
+                al revés)
+        """
+        self.padre = padre
+        self._evento = threading.Event()
+
+    def cancelar(self) -> None:
+        """Pide que se detengan las búsquedas que usan este token."""
+        self._evento.set()
+
+    @property
+    def cancelado(self) -> bool:
+        """Indica si se pidió la cancelación (de este token o de alguno de sus padres)."""
+        return self._evento.is_set() or (self.padre is not None and self.padre.cancelado)
+
+
+class PresupuestoBusqueda:
+    """
+    Límites de una búsqueda. Se puede reutilizar: cada búsqueda empieza su propia cuenta.
+    """
+
+    def __init__(
+        self,
+        segundos: Optional[float] = None,
+        max_expansiones: Optional[int] = None,
+        max_memoria: Optional[int] = None,
+        cancelacion: Optional[TokenCancelacion] = None,
+        intervalo: int = 256
+    ):
+        """
+        Inicializa el presupuesto.
+
+        Args:
+            segundos: Tiempo máximo desde el inicio de la búsqueda
+            max_expansiones: Número máximo de nodos expandidos
+            max_memoria: Crecimiento máximo de la memoria en uso durante la búsqueda, en
+                bytes (ver ``medidor_memoria``)
+            cancelacion: Token para cancelar la búsqueda desde otro hilo
+            intervalo: Expansiones entre revisiones del tiempo, la memoria y la cancelación
+
+        Raises:
+            ValueError: Si algún límite es negativo, ``intervalo`` no es positivo o no
+            hay forma de medir la memoria en esta plataforma
+        """
+        if any(limite is not None and limite < 0 for limite in (segundos, max_expansiones, max_memoria)):
+            raise ValueError("Los límites del presupuesto no pueden ser negativos")
+        if intervalo < 1:
+            raise ValueError("intervalo debe ser al menos 1")
+        if max_memoria is not None and medidor_memoria() is None:
+            raise ValueError("No se puede medir la memoria en esta plataforma")
+
+        self.segundos = segundos
+        self.max_expansiones = max_expansiones
+        self.max_memoria = max_memoria
+        self.cancelacion = cancelacion
+        self.intervalo = intervalo
+
+
+class ControlPresupuesto:
+    """
+    Cuenta de una búsqueda contra su presupuesto.
+
+    Attributes:
+        proxima: Nodos expandidos a partir de los cuales hay que llamar a ``revisar``
+        motivo: Motivo de parada (None mientras no se agote el presupuesto)
+    """
+
+    def __init__(self, presupuesto: Optional[PresupuestoBusqueda]):
+        """
+        Empieza la cuenta (el tiempo y la memoria se miden desde aquí).
+
+        Args:
+            presupuesto: El presupuesto de la búsqueda (None para no limitarla)
+        """
+        self.presupuesto = presupuesto
+        self.motivo: Optional[str] = None
+
+        if presupuesto is None:
+            self.proxima = sys.maxsize
+            return
+
+        # La primera revisión es inmediata: detecta tokens ya cancelados y presupuestos nulos
+        self.proxima = 0
+        self._fin = None if presupuesto.segundos is None else time.monotonic() + presupuesto.segundos
+        self._memoria = medidor_memoria() if presupuesto.max_memoria is not None else None
+        self._memoria_maxima = (
+            self._memoria() + presupuesto.max_memoria if self._memoria is not None else 0
+        )
+
+    def revisar(self, nodos_expandidos: int) -> Optional[str]:
+        """
+        Comprueba el presupuesto y fija la próxima revisión.
+
+        Args:
+            nodos_expandidos: Nodos expandidos hasta ahora
+
+        Returns:
+            Optional[str]: El motivo de parada, o None si la búsqueda puede seguir
+        """
+        presupuesto = self.presupuesto
+
+        if presupuesto.cancelacion is not None and presupuesto.cancelacion.cancelado:
+            self.motivo = PARADA_CANCELADA
+        elif presupuesto.max_expansiones is not None and nodos_expandidos >= presupuesto.max_expansiones:
+            self.motivo = PARADA_EXPANSIONES
+        elif self._fin is not None and time.monotonic() >= self._fin:
+            self.motivo = PARADA_TIEMPO
+        elif self._memoria is not None and self._memoria() > self._memoria_maxima:
+            self.motivo = PARADA_MEMORIA
+        else:
+            self.proxima = nodos_expandidos + presupuesto.intervalo
+            if presupuesto.max_expansiones is not None:
+                self.proxima = min(self.proxima, presupuesto.max_expansiones)
+            return None
+
+        self.proxima = sys.maxsize
+        return self.motivo
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from algoritmos_busqueda import ProblemaDeRuta, busqueda_costo_uniforme, busqueda_profundidad
+    from busqueda_informada import HeuristicaFuncion, busqueda_voraz
+
+    # Cuadrícula de 200 x 200 con costos que dependen de la posición
+    lado = 200
+    grafo = {}
+    for fila in range(lado):
+        for columna in range(lado):
+            grafo[f"{fila},{columna}"] = [
+                (f"{fila + df},{columna + dc}", 1 + (fila * 7 + columna * 13) % 5)
+                for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1))
+                if 0 <= fila + df < lado and 0 <= columna + dc < lado
+            ]
+    problema = ProblemaDeRuta(grafo, "0,0", f"{lado - 1},{lado - 1}")
+    problema.grafo_compilado
+
+    print("=== Límite de expansiones ===")
+    print(busqueda_costo_uniforme(problema, presupuesto=PresupuestoBusqueda(max_expansiones=1000)))
+    print()
+
+    print("=== Límite de tiempo (5 ms) ===")
+    print(busqueda_profundidad(problema, presupuesto=PresupuestoBusqueda(segundos=0.005)))
+    print()
+
+    def manhattan(estado: str, objetivo: str) -> float:
+        (f1, c1), (f2, c2) = (map(int, e.split(",")) for e in (estado, objetivo))
+        return abs(f1 - f2) + abs(c1 - c2)
+
+    print("=== Voraz con 50 expansiones: mejor camino parcial ===")
+    parcial = busqueda_voraz(problema, HeuristicaFuncion(manhattan), presupuesto=PresupuestoBusqueda(max_expansiones=50))
+    print(f"Motivo: {parcial.motivo_parada}, llega a {parcial.camino[-1][0]} en {len(parcial.camino) - 1} pasos")
+    print()
+
+    print("=== Cancelación desde otro hilo ===")
+    token = TokenCancelacion()
+    threading.Timer(0.01, token.cancelar).start()
+    inicio = time.perf_counter()
+    resultado = busqueda_costo_uniforme(problema, presupuesto=PresupuestoBusqueda(cancelacion=token))
+    print(resultado)
+    print(f"Cancelada tras {1000 * (time.perf_counter() - inicio):.1f} ms")
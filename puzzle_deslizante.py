@@ -0,0 +1,173 @@
+"""
+Módulo: Puzzle Deslizante
+Descripción: El 8-puzzle y el 15-puzzle como ProblemaImplicito (ver espacio_estados.py),
+con cada tablero empaquetado en un entero.
+
+Cada casilla ocupa 4 bits (0 es el hueco) y los 4 bits más bajos guardan la posición del
+hueco: el 8-puzzle cabe en 40 bits y el 15-puzzle en 68. Mover una ficha al hueco solo
+cambia dos casillas y la posición del hueco, así que cada sucesor se calcula con una
+suma sobre el entero del estado, sin desempaquetarlo.
+"""
+
+import random
+from typing import List, Optional, Sequence, Tuple
+
+from espacio_estados import ProblemaImplicito, desempaquetar, empaquetar
+
+
+class PuzzleDeslizante(ProblemaImplicito):
+    """
+    Puzzle de fichas deslizantes de lado 2, 3 o 4; cada movimiento cuesta 1.
+
+    Las fichas se dan por filas, de arriba abajo, con 0 para el hueco.
+    """
+
+    def __init__(self, fichas: Sequence[int], objetivo: Optional[Sequence[int]] = None):
+        """
+        Inicializa el puzzle.
+
+        Args:
+            fichas: Configuración inicial
+            objetivo: Configuración objetivo (por defecto, 1, 2, ..., n - 1 y el hueco al final)
+
+        Raises:
+            ValueError: Si las configuraciones no son permutaciones de 0..n - 1 con n = 4, 9 o 16
+        """
+        n = len(fichas)
+        self.lado = {4: 2, 9: 3, 16: 4}.get(n, 0)
+        objetivo = list(range(1, n)) + [0] if objetivo is None else list(objetivo)
+
+        if not self.lado:
+            raise ValueError("El puzzle debe tener 4, 9 o 16 casillas")
+        for configuracion in (fichas, objetivo):
+            if sorted(configuracion) != list(range(n)):
+                raise ValueError(f"Configuración inválida: {list(configuracion)}")
+
+        super().__init__(self.codificar(fichas))
+        self.objetivo = self.codificar(objetivo)
+        self._fichas_objetivo = objetivo
+
+        # Para cada posición del hueco: (bits de la casilla vecina, factor que mueve su
+        # ficha al hueco, cambio de la posición del hueco)
+        self._movimientos: List[List[Tuple[int, int, int]]] = []
+        for hueco in range(n):
+            fila, columna = divmod(hueco, self.lado)
+            movimientos = []
+            for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                if 0 <= fila + df < self.lado and 0 <= columna + dc < self.lado:
+                    vecina = hueco + df * self.lado + dc
+                    bits_vecina, bits_hueco = 4 * (vecina + 1), 4 * (hueco + 1)
+                    movimientos.append((bits_vecina, (1 << bits_hueco) - (1 << bits_vecina), vecina - hueco))
+            self._movimientos.append(movimientos)
+
+    @classmethod
+    def aleatorio(cls, lado: int, semilla: int = 0, movimientos: Optional[int] = None) -> 'PuzzleDeslizante':
+        """
+        Genera un puzzle resoluble con el objetivo por defecto.
+
+        Args:
+            lado: Lado del tablero (2, 3 o 4)
+            semilla: Semilla del generador
+            movimientos: Si se indica, el puzzle se obtiene desde el objetivo con ese número
+                de movimientos al azar (sin deshacer el anterior); si no, es una
+                configuración resoluble uniforme
+
+        Returns:
+            PuzzleDeslizante: El puzzle generado
+        """
+        generador = random.Random(semilla)
+        n = lado * lado
+        objetivo = list(range(1, n)) + [0]
+
+        if movimientos is None:
+            while True:
+                fichas = generador.sample(range(n), n)
+                puzzle = cls(fichas)
+                if puzzle.resoluble():
+                    return puzzle
+
+        puzzle = cls(objetivo)
+        estado, anterior = puzzle.estado_inicial, None
+        for _ in range(movimientos):
+            opciones = [sucesor for sucesor, _ in puzzle.sucesores(estado) if sucesor != anterior]
+            estado, anterior = generador.choice(opciones), estado
+        return cls(puzzle.decodificar(estado))
+
+    def codificar(self, fichas: Sequence[int]) -> int:
+        """Empaqueta una configuración en un estado."""
+        return empaquetar(fichas) << 4 | list(fichas).index(0)
+
+    def decodificar(self, estado: int) -> List[int]:
+        """Desempaqueta un estado en su configuración."""
+        return desempaquetar(estado >> 4, self.lado * self.lado)
+
+    def resoluble(self) -> bool:
+        """
+        Indica si el objetivo es alcanzable desde el estado inicial.
+
+        Lo es cuando la paridad de la permutación entre ambas configuraciones (contando el
+        hueco como una ficha) coincide con la de la distancia Manhattan entre sus huecos.
+        """
+        fichas = self.decodificar(self.estado_inicial)
+        posicion = {ficha: i for i, ficha in enumerate(self._fichas_objetivo)}
+        permutacion = [posicion[ficha] for ficha in fichas]
+
+        # La paridad de una permutación es la de n menos su número de ciclos
+        visitados = [False] * len(permutacion)
+        ciclos = 0
+        for inicio in range(len(permutacion)):
+            if not visitados[inicio]:
+                ciclos += 1
+                i = inicio
+                while not visitados[i]:
+                    visitados[i] = True
+                    i = permutacion[i]
+
+        (f1, c1), (f2, c2) = (divmod(i, self.lado) for i in (fichas.index(0), posicion[0]))
+        return (len(permutacion) - ciclos) % 2 == (abs(f1 - f2) + abs(c1 - c2)) % 2
+
+    def sucesores(self, estado: int) -> List[Tuple[int, float]]:
+        return [
+            (estado + ((estado >> bits_vecina) & 15) * factor + desplazamiento, 1)
+            for bits_vecina, factor, desplazamiento in self._movimientos[estado & 15]
+        ]
+
+    def es_objetivo(self, estado: int) -> bool:
+        return estado == self.objetivo
+
+    def costo_paso(self, origen: int, destino: int) -> float:
+        return 1
+
+    def describir(self, estado: int) -> str:
+        fichas = [str(ficha) if ficha else "_" for ficha in self.decodificar(estado)]
+        return "/".join(" ".join(fichas[i:i + self.lado]) for i in range(0, len(fichas), self.lado))
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from algoritmos_busqueda import (
+        busqueda_amplitud, busqueda_costo_uniforme, busqueda_profundidad, busqueda_profundidad_iterativa
+    )
+
+    puzzle = PuzzleDeslizante([1, 2, 3, 4, 0, 6, 7, 5, 8])
+    print("=== 8-puzzle ===")
+    print(busqueda_amplitud(puzzle))
+    print()
+
+    puzzle = PuzzleDeslizante.aleatorio(3, semilla=1, movimientos=40)
+    print(f"=== 8-puzzle mezclado con 40 movimientos: {puzzle.describir(puzzle.estado_inicial)} ===")
+    for nombre, algoritmo in [
+        ("BFS", busqueda_amplitud),
+        ("DFS", busqueda_profundidad),
+        ("UCS", busqueda_costo_uniforme),
+        ("IDDFS", lambda p: busqueda_profundidad_iterativa(p, limite_maximo=31)),
+    ]:
+        resultado = algoritmo(puzzle)
+        print(f"{nombre:<6} {len(resultado.camino) - 1:>6} movimientos, {resultado.nodos_expandidos:>7} expandidos")
+    print()
+
+    puzzle = PuzzleDeslizante.aleatorio(4, semilla=1, movimientos=18)
+    print(f"=== 15-puzzle mezclado con 18 movimientos: {puzzle.describir(puzzle.estado_inicial)} ===")
+    resultado = busqueda_amplitud(puzzle)
+    print(f"BFS: {len(resultado.camino) - 1} movimientos, {resultado.nodos_expandidos} expandidos")
+    print(f"Resoluble (tablero con dos fichas cambiadas): {PuzzleDeslizante([2, 1, 3, 0]).resoluble()}")
@@ -0,0 +1,291 @@
+"""
+Módulo: Traza de Búsquedas
+Descripción: Versiones generadoras de los algoritmos de búsqueda que emiten, a medida que
+ocurren, los eventos de la búsqueda: expansión, generación y poda de sucesores y
+hallazgo del objetivo.
+
+Cada ``trazar_*`` ejecuta su ``busqueda_*`` con un observador (ver ``Observador`` en
+algoritmos_busqueda.py) que convierte cada notificación en un EventoBusqueda, y termina
+con un evento ``fin`` que lleva el ResultadoBusqueda de la propia búsqueda, así que la
+traza admite los mismos argumentos (``metricas``, ``presupuesto``) y los mismos
+problemas (también un ProblemaImplicito) que la búsqueda.
+
+La búsqueda corre en un hilo propio y pasa los eventos al generador en lotes de
+``TAMANO_LOTE``, con a lo sumo un lote en espera: una traza de millones de eventos usa
+memoria constante (además de la propia búsqueda). Cerrar el generador (``close()``, o
+salir del ``for`` con ``break`` y descartarlo) detiene la búsqueda en su siguiente evento.
+
+Un sucesor ya alcanzado, explorado o que no mejora su mejor costo conocido se emite como
+PODAR; las entradas obsoletas que salen de la frontera, como PODAR sin padre. En las
+búsquedas bidireccionales, los eventos de la búsqueda hacia atrás llevan ``sentido`` 1 y
+OBJETIVO indica el estado de encuentro y el costo total del camino.
+
+Las versiones por niveles (vectorizada y paralela) no tienen traza: recorren los mismos
+nodos en el mismo orden que ``trazar_amplitud``.
+"""
+
+import functools
+import inspect
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from algoritmos_busqueda import (
+    EXPANDIR, GENERAR, OBJETIVO, PODAR, ProblemaDeRuta, ResultadoBusqueda, busqueda_amplitud,
+    busqueda_amplitud_bidireccional, busqueda_costo_uniforme, busqueda_costo_uniforme_bidireccional,
+    busqueda_profundidad, busqueda_profundidad_iterativa
+)
+from busqueda_informada import busqueda_a_estrella, busqueda_voraz
+
+# Tipo del evento que cierra la traza (los demás los notifican las búsquedas)
+FIN = "fin"
+TIPOS_EVENTO = (EXPANDIR, GENERAR, PODAR, OBJETIVO, FIN)
+
+# Eventos que el hilo de la búsqueda entrega juntos al generador
+TAMANO_LOTE = 1024
+
+# Segundos entre comprobaciones de cierre mientras el hilo espera para entregar un lote
+_ESPERA_CIERRE = 0.05
+
+
+class EventoBusqueda:
+    """
+    Un evento de la traza de una búsqueda.
+
+    Attributes:
+        tipo: EXPANDIR, GENERAR, PODAR, OBJETIVO o FIN
+        estado: Estado expandido, generado, podado o encontrado (None en FIN)
+        padre: Estado desde el que se generó o podó el sucesor (None si no aplica, por
+            ejemplo al descartar una entrada obsoleta de la frontera)
+        costo: Costo del camino hasta ``estado`` (en la dirección de búsqueda de ``sentido``)
+        sentido: 0 hacia adelante, 1 hacia atrás desde el objetivo (búsquedas bidireccionales)
+        resultado: El ResultadoBusqueda (solo en FIN)
+    """
+
+    __slots__ = ('tipo', 'estado', 'padre', 'costo', 'sentido', 'resultado')
+
+    def __init__(
+        self,
+        tipo: str,
+        estado: Optional[Any] = None,
+        padre: Optional[Any] = None,
+        costo: float = 0.0,
+        sentido: int = 0,
+        resultado: Optional[ResultadoBusqueda] = None
+    ):
+        self.tipo = tipo
+        self.estado = estado
+        self.padre = padre
+        self.costo = costo
+        self.sentido = sentido
+        self.resultado = resultado
+
+    def __repr__(self) -> str:
+        if self.tipo == FIN:
+            return f"EventoBusqueda(fin, encontrado={self.resultado.encontrado})"
+        padre = f", desde {self.padre}" if self.padre is not None else ""
+        sentido = ", hacia atrás" if self.sentido else ""
+        return f"EventoBusqueda({self.tipo}, {self.estado}{padre}, costo={self.costo:g}{sentido})"
+
+    __str__ = __repr__
+
+
+Traza = Iterator[EventoBusqueda]
+
+
+class _TrazaCerrada(Exception):
+    """Se lanza desde el observador para detener la búsqueda de una traza cerrada."""
+
+
+@functools.lru_cache(maxsize=None)
+def _acepta_observador(algoritmo: Callable[..., ResultadoBusqueda]) -> bool:
+    """Indica si la función de búsqueda recibe el parámetro ``observador``."""
+    try:
+        return 'observador' in inspect.signature(algoritmo).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def trazar(algoritmo: Callable[..., ResultadoBusqueda], problema: Any, *args, **kwargs) -> Traza:
+    """
+    Traza de ``algoritmo(problema, *args, **kwargs)``.
+
+    Args:
+        algoritmo: Una función de búsqueda que acepte ``observador`` (ver ``TRAZAS``)
+        problema: El problema a resolver
+        *args: Argumentos adicionales del algoritmo
+        **kwargs: Argumentos adicionales del algoritmo
+
+    Returns:
+        Iterator[EventoBusqueda]: El generador de eventos, que termina en FIN
+
+    Raises:
+        ValueError: Si el algoritmo no acepta observador
+    """
+    if not _acepta_observador(algoritmo):
+        nombre = getattr(algoritmo, '__name__', repr(algoritmo))
+        raise ValueError(f"{nombre} no tiene versión con traza")
+    return _recorrer(algoritmo, problema, args, kwargs)
+
+
+def _recorrer(algoritmo: Callable[..., ResultadoBusqueda], problema: Any, args: tuple, kwargs: dict) -> Traza:
+    """Generador de ``trazar``: la búsqueda empieza al pedir el primer evento."""
+    # Cada entrega es (eventos, resultado, excepción); la última lleva el resultado o la excepción
+    entregas: 'queue.Queue[tuple]' = queue.Queue(maxsize=1)
+    cerrada = threading.Event()
+    lote = []
+
+    def entregar(resultado: Optional[ResultadoBusqueda] = None, error: Optional[BaseException] = None) -> None:
+        nonlocal lote
+        entrega, lote = (lote, resultado, error), []
+        while True:
+            if cerrada.is_set():
+                raise _TrazaCerrada
+            try:
+                entregas.put(entrega, timeout=_ESPERA_CIERRE)
+                return
+            except queue.Full:
+                pass
+
+    def observar(tipo: str, estado: Any, padre: Any, costo: float, sentido: int) -> None:
+        lote.append((tipo, estado, padre, costo, sentido))
+        if len(lote) >= TAMANO_LOTE:
+            entregar()
+
+    def buscar() -> None:
+        try:
+            resultado = algoritmo(problema, *args, observador=observar, **kwargs)
+        except _TrazaCerrada:
+            return
+        except BaseException as error:
+            resultado, excepcion = None, error
+        else:
+            excepcion = None
+        try:
+            entregar(resultado, excepcion)
+        except _TrazaCerrada:
+            pass
+
+    hilo = threading.Thread(target=buscar, name="traza", daemon=True)
+    hilo.start()
+
+    try:
+        while True:
+            eventos, resultado, excepcion = entregas.get()
+            for tipo, estado, padre, costo, sentido in eventos:
+                yield EventoBusqueda(tipo, estado, padre, costo, sentido)
+            if excepcion is not None:
+                raise excepcion
+            if resultado is not None:
+                yield EventoBusqueda(FIN, resultado=resultado)
+                return
+    finally:
+        cerrada.set()
+        hilo.join()
+
+
+def trazar_amplitud(problema: Any, *args, **kwargs) -> Traza:
+    """Traza de ``busqueda_amplitud`` (ver ``trazar``)."""
+    return trazar(busqueda_amplitud, problema, *args, **kwargs)
+
+
+def trazar_profundidad(problema: Any, *args, **kwargs) -> Traza:
+    """Traza de ``busqueda_profundidad`` (ver ``trazar``)."""
+    return trazar(busqueda_profundidad, problema, *args, **kwargs)
+
+
+def trazar_costo_uniforme(problema: Any, *args, **kwargs) -> Traza:
+    """Traza de ``busqueda_costo_uniforme`` (ver ``trazar``)."""
+    return trazar(busqueda_costo_uniforme, problema, *args, **kwargs)
+
+
+def trazar_profundidad_iterativa(problema: Any, *args, **kwargs) -> Traza:
+    """
+    Traza de ``busqueda_profundidad_iterativa`` (ver ``trazar``).
+
+    Cada iteración vuelve a expandir el estado inicial; los sucesores que quedan más allá
+    del límite de la iteración no emiten eventos.
+    """
+    return trazar(busqueda_profundidad_iterativa, problema, *args, **kwargs)
+
+
+def trazar_amplitud_bidireccional(problema: Any, *args, **kwargs) -> Traza:
+    """Traza de ``busqueda_amplitud_bidireccional`` (ver ``trazar``)."""
+    return trazar(busqueda_amplitud_bidireccional, problema, *args, **kwargs)
+
+
+def trazar_costo_uniforme_bidireccional(problema: Any, *args, **kwargs) -> Traza:
+    """Traza de ``busqueda_costo_uniforme_bidireccional`` (ver ``trazar``)."""
+    return trazar(busqueda_costo_uniforme_bidireccional, problema, *args, **kwargs)
+
+
+def trazar_a_estrella(problema: Any, *args, **kwargs) -> Traza:
+    """Traza de ``busqueda_a_estrella`` (ver ``trazar``)."""
+    return trazar(busqueda_a_estrella, problema, *args, **kwargs)
+
+
+def trazar_voraz(problema: Any, *args, **kwargs) -> Traza:
+    """Traza de ``busqueda_voraz`` (ver ``trazar``)."""
+    return trazar(busqueda_voraz, problema, *args, **kwargs)
+
+
+# Traza correspondiente a cada función de búsqueda de los módulos de búsqueda
+TRAZAS: Dict[Callable[..., ResultadoBusqueda], Callable[..., Traza]] = {
+    busqueda_amplitud: trazar_amplitud,
+    busqueda_profundidad: trazar_profundidad,
+    busqueda_costo_uniforme: trazar_costo_uniforme,
+    busqueda_profundidad_iterativa: trazar_profundidad_iterativa,
+    busqueda_amplitud_bidireccional: trazar_amplitud_bidireccional,
+    busqueda_costo_uniforme_bidireccional: trazar_costo_uniforme_bidireccional,
+    busqueda_a_estrella: trazar_a_estrella,
+    busqueda_voraz: trazar_voraz
+}
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from collections import Counter
+
+    grafo_rumania = {
+        'Oradea': [('Zerind', 71), ('Sibiu', 151)],
+        'Zerind': [('Oradea', 71), ('Sibiu', 99), ('Arad', 75)],
+        'Arad': [('Zerind', 75), ('Sibiu', 140), ('Timisoara', 118)],
+        'Timisoara': [('Arad', 118), ('Lugoj', 111)],
+        'Lugoj': [('Timisoara', 111), ('Mehadia', 70)],
+        'Mehadia': [('Lugoj', 70), ('Drobeta', 75)],
+        'Drobeta': [('Mehadia', 75)],
+        'Sibiu': [('Oradea', 151), ('Zerind', 99), ('Arad', 140), ('Fagaras', 99), ('Rimnicu Vilcea', 80)],
+        'Rimnicu Vilcea': [('Sibiu', 80), ('Craiova', 146), ('Pitesti', 97)],
+        'Craiova': [('Rimnicu Vilcea', 146), ('Pitesti', 138), ('Drobeta', 120)],
+        'Fagaras': [('Sibiu', 99), ('Bucharest', 211)],
+        'Pitesti': [('Rimnicu Vilcea', 97), ('Craiova', 138), ('Bucharest', 101)],
+        'Bucharest': [('Fagaras', 211), ('Pitesti', 101), ('Giurgiu', 90), ('Urziceni', 85)],
+        'Giurgiu': [('Bucharest', 90)],
+        'Urziceni': [('Bucharest', 85), ('Hirsova', 98), ('Vaslui', 142)],
+        'Hirsova': [('Urziceni', 98), ('Eforie', 86)],
+        'Eforie': [('Hirsova', 86)],
+        'Vaslui': [('Urziceni', 142), ('Iasi', 92)],
+        'Iasi': [('Vaslui', 92), ('Neamt', 87)],
+        'Neamt': [('Iasi', 87)]
+    }
+
+    print("=== Orden de expansión de UCS: Arad → Bucharest ===")
+    for evento in trazar(busqueda_costo_uniforme, ProblemaDeRuta(grafo_rumania, 'Arad', 'Bucharest')):
+        if evento.tipo == EXPANDIR:
+            print(f"  {evento.estado} (g = {evento.costo:g})")
+        elif evento.tipo == FIN:
+            print(evento.resultado)
+
+    print("\n=== Eventos por tipo de la BFS bidireccional: Oradea → Eforie ===")
+    traza = trazar(busqueda_amplitud_bidireccional, ProblemaDeRuta(grafo_rumania, 'Oradea', 'Eforie'))
+    print(dict(Counter(evento.tipo for evento in traza)))
+
+    print("\n=== Detener la DFS al expandir el tercer nodo ===")
+    traza = trazar(busqueda_profundidad, ProblemaDeRuta(grafo_rumania, 'Arad', 'Neamt'))
+    expandidos = 0
+    for evento in traza:
+        print(f"  {evento}")
+        expandidos += evento.tipo == EXPANDIR
+        if expandidos == 3:
+            traza.close()
+            break